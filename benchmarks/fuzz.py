@@ -0,0 +1,65 @@
+"""
+    Parses randomly corrupted playlists in tolerant mode and reports the worst parse time per input size,
+    which should grow with the size of the file and not with the counts it claims.
+
+        python benchmarks/fuzz.py [nb_files] [seed]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Imports the package and the synthetic playlists of the tests from the checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyparsebluray.mpls import ParseError, loads_mpls, parse_mode  # noqa: E402
+from tests.synthetic import corrupt, synthetic_mpls  # noqa: E402
+
+_SHAPES = [
+    dict(nb_play_items=1, nb_streams=4),
+    dict(nb_play_items=10, nb_streams=16, nb_angles=2, nb_sub_paths=2, nb_ext_data_entries=2),
+    dict(nb_play_items=100, nb_streams=32, nb_angles=2, nb_sub_paths=4, nb_ext_data_entries=4),
+]
+
+
+def main() -> None:
+    nb_files = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+
+    for shape in _SHAPES:
+        data = synthetic_mpls(**shape)
+        clean = min(_time(data, lazy=False) for _ in range(20))
+
+        worst = 0.0
+        counts: Dict[str, int] = {'diagnostics': 0, 'rejected': 0}
+        failures: List[str] = []
+        for _ in range(nb_files):
+            mutated = corrupt(data, rng)
+            for lazy in (False, True):
+                try:
+                    worst = max(worst, _time(mutated, lazy, counts))
+                except ParseError:
+                    # Header too damaged to locate the sections
+                    counts['rejected'] += 1
+                except Exception as error:  # pylint: disable=broad-except
+                    failures.append(repr(error))
+
+        print(f'{len(data):7d} bytes: clean {clean * 1e6:8.1f} us, worst corrupted {worst * 1e6:8.1f} us, '
+              f'{counts["diagnostics"]} diagnostics, {counts["rejected"]} rejected, {len(failures)} uncaught errors')
+        for failure in failures[:5]:
+            print('   ', failure)
+
+
+def _time(data: bytes, lazy: bool, counts: Optional[Dict[str, int]] = None) -> float:
+    start = time.perf_counter()
+    with parse_mode() as diagnostics:
+        loads_mpls(data, lazy).freeze()
+    elapsed = time.perf_counter() - start
+    if counts is not None:
+        counts['diagnostics'] += len(diagnostics)
+    return elapsed
+
+
+if __name__ == '__main__':
+    main()
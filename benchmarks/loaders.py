@@ -0,0 +1,104 @@
+"""
+    Times every MPLS loader on synthetic playlists and reports throughput and peak memory.
+
+        python benchmarks/loaders.py [--play-items N] [--streams N] [--angles N] [--sub-paths N]
+                                     [--marks N] [--ext-entries N] [--number N] [--repeat N]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Imports the package and the synthetic playlists of the tests from the checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyparsebluray.mpls import (load_app_info_playlist, load_extention_data, load_lazy_playlist,  # noqa: E402
+                                load_movie_playlist, load_mpls_file, load_playlist, load_playlist_mark, loads_mpls)
+from tests.synthetic import synthetic_mpls  # noqa: E402
+
+
+def _section_loader(data: bytes, offset: int, loader: Callable) -> Callable[[], object]:
+    mpls = io.BufferedReader(io.BytesIO(data))
+
+    def load() -> object:
+        mpls.seek(offset, os.SEEK_SET)
+        return loader(mpls)
+    return load
+
+
+def _peak_memory(load: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        result = load()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--play-items', type=int, default=20)
+    parser.add_argument('--streams', type=int, default=16)
+    parser.add_argument('--angles', type=int, default=0)
+    parser.add_argument('--sub-paths', type=int, default=2)
+    parser.add_argument('--marks', type=int, default=50)
+    parser.add_argument('--ext-entries', type=int, default=4)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data = synthetic_mpls(nb_play_items=args.play_items, nb_streams=args.streams, nb_angles=args.angles,
+                          nb_sub_paths=args.sub_paths, nb_playlist_marks=args.marks,
+                          nb_ext_data_entries=args.ext_entries)
+    header = loads_mpls(data).movie_playlist
+    sections = sorted(
+        address for address in (40, header.playlist_start_address, header.playlist_mark_start_address,
+                                header.extension_data_start_address, len(data)) if address
+    )
+
+    def section_size(offset: int) -> int:
+        return next(address for address in sections if address > offset) - offset
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, '00000.mpls')
+        with open(path, 'wb') as mpls:
+            mpls.write(data)
+
+        benchmarks: List[Tuple[str, Callable[[], object], int]] = [
+            ('load_movie_playlist', _section_loader(data, 0, load_movie_playlist), 40),
+            ('load_app_info_playlist', _section_loader(data, 40, load_app_info_playlist), section_size(40)),
+            ('load_playlist', _section_loader(data, header.playlist_start_address, load_playlist),
+             section_size(header.playlist_start_address)),
+            ('load_lazy_playlist', _section_loader(data, header.playlist_start_address, load_lazy_playlist),
+             section_size(header.playlist_start_address)),
+            ('load_playlist_mark', _section_loader(data, header.playlist_mark_start_address, load_playlist_mark),
+             section_size(header.playlist_mark_start_address)),
+        ]
+        if header.extension_data_start_address:
+            benchmarks.append(
+                ('load_extention_data', _section_loader(data, header.extension_data_start_address, load_extention_data),
+                 section_size(header.extension_data_start_address))
+            )
+        benchmarks += [
+            ('loads_mpls', lambda: loads_mpls(data), len(data)),
+            ('load_mpls_file', lambda: load_mpls_file(path), len(data)),
+        ]
+
+        print(f'{len(data)} bytes: {args.play_items} play items x {args.streams} streams, {args.angles} angles, '
+              f'{args.sub_paths} sub paths, {args.marks} marks, {args.ext_entries} extension entries')
+        print(f'{"loader":<24} {"us/call":>10} {"calls/s":>12} {"MB/s":>10} {"peak KiB":>10}')
+        for name, load, size in benchmarks:
+            seconds = min(timeit.repeat(load, number=args.number, repeat=args.repeat)) / args.number
+            peak = _peak_memory(load)
+            print(f'{name:<24} {seconds * 1e6:10.1f} {1 / seconds:12.0f} {size / seconds / 1e6:10.1f} {peak / 1024:10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+    Compares the playlist probe to a full decode of the Playlist and PlaylistMarks.
+
+        python benchmarks/probe.py [nb_play_items] [nb_streams]
+"""
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+# Imports the package and the synthetic playlists of the tests from the checkout
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyparsebluray.mpls import load_movie_playlist, load_playlist, load_playlist_mark, probe_mpls_file  # noqa: E402
+from tests.synthetic import synthetic_mpls  # noqa: E402
+
+
+def full_decode(path: str) -> None:
+    with open(path, 'rb') as mpls:
+        header = load_movie_playlist(mpls)
+        mpls.seek(header.playlist_start_address, os.SEEK_SET)
+        load_playlist(mpls)
+        mpls.seek(header.playlist_mark_start_address, os.SEEK_SET)
+        load_playlist_mark(mpls)
+
+
+def main() -> None:
+    nb_play_items = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    nb_streams = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, '00000.mpls')
+        with open(path, 'wb') as mpls:
+            mpls.write(synthetic_mpls(nb_play_items=nb_play_items, nb_streams=nb_streams,
+                                      nb_playlist_marks=nb_play_items))
+
+        number = 200
+        full = min(timeit.repeat(lambda: full_decode(path), number=number, repeat=5)) / number
+        probe = min(timeit.repeat(lambda: probe_mpls_file(path), number=number, repeat=5)) / number
+
+    print(f'{nb_play_items} play items, {nb_streams} streams each')
+    print(f'full decode: {full * 1e6:10.1f} us')
+    print(f'probe:       {probe * 1e6:10.1f} us')
+    print(f'speedup:     {full / probe:10.1f}x')
+
+
+if __name__ == '__main__':
+    main()
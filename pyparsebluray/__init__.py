@@ -1,3 +1,12 @@
 """MPLS or playlist specifying an order in which clips (or parts of them) get played."""
 # flake8: noqa
 from .mpls import *
+from .library import *
+from .cache import *
+from .seek import *
+from .fingerprint import *
+from .aio import *
+from .udf import *
+from .reader import *
+from .instrument import *
+from .columnar import *
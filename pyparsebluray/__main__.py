@@ -0,0 +1,159 @@
+"""
+    Scans BDMV folders or MPLS files and writes one JSON line per playlist to stdout as soon as it is parsed.
+
+        python -m pyparsebluray [--jobs N] [--fields SECTION,...] [--quiet] PATH [PATH ...]
+
+    A PATH is a BDMV folder, a disc root holding one, or a MPLS file.
+    Anomalies met in tolerant mode are listed under "diagnostics",
+    a file that can't be read or parsed gets an "error" line instead.
+"""
+
+__all__ = ['FIELDS', 'main']
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
+
+from .mpls import MplsFile, list_playlists, parse_mode
+from .mpls.load import _load_sections
+
+# Sections a line can hold, in file order
+FIELDS: Tuple[str, ...] = MplsFile._fields
+
+
+def _iter_playlists(paths: Sequence[str]) -> Iterator[str]:
+    for path in map(Path, paths):
+        if path.is_dir():
+            bdmv = path / 'BDMV' if (path / 'BDMV' / 'PLAYLIST').is_dir() else path
+            if not (bdmv / 'PLAYLIST').is_dir():
+                yield str(path)
+                continue
+            yield from map(str, list_playlists(bdmv))
+        else:
+            yield str(path)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, tuple) and hasattr(value, '_asdict'):
+        return {name: _jsonable(v) for name, v in zip(value._fields, value)}
+    if isinstance(value, dict):
+        return {name: _jsonable(v) for name, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
+def _load_fields(data: bytes, fields: Sequence[str]) -> Dict[str, Any]:
+    """Decodes only the sections listed in `fields`"""
+    mpls = _load_sections(data, None, fields=fields)
+    return {field: None if getattr(mpls, field) is None else getattr(mpls, field).freeze() for field in fields}
+
+
+def _scan_playlist(path: str, fields: Sequence[str]) -> Tuple[str, bool]:
+    """Returns the JSON line of a playlist and whether it holds an error"""
+    record: Dict[str, Any] = {'path': path}
+    try:
+        with parse_mode() as diagnostics:
+            record.update(_jsonable(_load_fields(Path(path).read_bytes(), fields)))
+    except Exception as error:  # pylint: disable=broad-except
+        record['error'] = f'{type(error).__name__}: {error}'
+        return json.dumps(record), True
+    if diagnostics:
+        record['diagnostics'] = [diagnostic._asdict() for diagnostic in diagnostics]
+    return json.dumps(record), False
+
+
+def _scan(paths: Sequence[str], fields: Sequence[str], jobs: int) -> Iterator[Tuple[str, bool]]:
+    """Yields the lines as they complete, keeping at most 2 * `jobs` playlists in flight"""
+    if jobs <= 1:
+        for path in _iter_playlists(paths):
+            yield _scan_playlist(path, fields)
+        return
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: Set['Future[Tuple[str, bool]]'] = set()
+        for path in _iter_playlists(paths):
+            pending.add(executor.submit(_scan_playlist, path, fields))
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in wait(pending).done:
+            yield future.result()
+
+
+class _Progress:
+    """Progress summary on stderr, rewritten in place on a terminal"""
+
+    def __init__(self, stream: TextIO, quiet: bool) -> None:
+        self.stream = stream
+        self.quiet = quiet
+        self.live = not quiet and stream.isatty()
+        self.playlists = self.errors = 0
+        self.start = self._last = time.perf_counter()
+
+    def update(self, error: bool) -> None:
+        self.playlists += 1
+        self.errors += error
+        now = time.perf_counter()
+        if self.live and now - self._last >= 0.2:
+            self._last = now
+            self.stream.write(f'\r{self._summary(now)}')
+            self.stream.flush()
+
+    def close(self) -> None:
+        if not self.quiet:
+            prefix = '\r' if self.live else ''
+            self.stream.write(f'{prefix}{self._summary(time.perf_counter())}\n')
+            self.stream.flush()
+
+    def _summary(self, now: float) -> str:
+        elapsed = now - self.start
+        rate = self.playlists / elapsed if elapsed else 0.0
+        return f'{self.playlists} playlists, {self.errors} errors, {elapsed:.1f} s, {rate:.0f} playlists/s'
+
+
+def _parse_fields(value: str) -> List[str]:
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = sorted(set(fields) - set(FIELDS))
+    if unknown:
+        raise argparse.ArgumentTypeError(f'unknown fields {", ".join(unknown)}, expected some of {", ".join(FIELDS)}')
+    return [field for field in FIELDS if field in fields]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the scanner and returns the exit status, 1 if any playlist failed"""
+    parser = argparse.ArgumentParser(prog='python -m pyparsebluray', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', metavar='PATH')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes, lines are then written in completion order (default: 1)')
+    parser.add_argument('-f', '--fields', type=_parse_fields, default=list(FIELDS),
+                        help=f'comma-separated sections to decode and emit (default: {",".join(FIELDS)})')
+    parser.add_argument('-q', '--quiet', action='store_true', help='no progress summary on stderr')
+    args = parser.parse_args(argv)
+
+    progress = _Progress(sys.stderr, args.quiet)
+    try:
+        for line, error in _scan(args.paths, args.fields, args.jobs):
+            sys.stdout.write(line + '\n')
+            sys.stdout.flush()
+            progress.update(error)
+    except BrokenPipeError:
+        # The consumer went away, don't let the interpreter complain when flushing stdout at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        progress.close()
+    return 1 if progress.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
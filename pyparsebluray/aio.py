@@ -0,0 +1,80 @@
+"""asyncio counterparts of the file loaders"""
+
+__all__ = ['load_mpls_file_async', 'load_clpi_file_async', 'load_index_bdmv_file_async',
+           'load_movie_object_file_async', 'iter_playlists_async', 'scan_playlists_async']
+
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, Dict, Set, Tuple, Union
+
+from .clpi import ClpiFile, loads_clpi
+from .index_table import IndexFile, loads_index_bdmv
+from .movie_object import MovieObjectFile, loads_movie_object
+from .mpls import MplsFile, list_playlists, loads_mpls
+
+
+async def _read_bytes(path: Union[str, os.PathLike]) -> bytes:
+    return await asyncio.to_thread(Path(path).read_bytes)
+
+
+async def load_mpls_file_async(path: Union[str, os.PathLike], lazy: bool = False) -> MplsFile:
+    """
+        Reads a MPLS file in a worker thread and returns all of its sections.
+        Only the read leaves the event loop, the bytes are parsed from memory.
+    """
+    return loads_mpls(await _read_bytes(path), lazy)
+
+
+async def load_clpi_file_async(path: Union[str, os.PathLike]) -> ClpiFile:
+    """Reads a CLPI file in a worker thread and returns all of its sections"""
+    return loads_clpi(await _read_bytes(path))
+
+
+async def load_index_bdmv_file_async(path: Union[str, os.PathLike]) -> IndexFile:
+    """Reads a index.bdmv file in a worker thread and returns all of its sections"""
+    return loads_index_bdmv(await _read_bytes(path))
+
+
+async def load_movie_object_file_async(path: Union[str, os.PathLike]) -> MovieObjectFile:
+    """Reads a MovieObject.bdmv file in a worker thread and returns all of its sections"""
+    return loads_movie_object(await _read_bytes(path))
+
+
+async def _load_named(path: Path, lazy: bool) -> Tuple[str, MplsFile]:
+    return path.name, await load_mpls_file_async(path, lazy)
+
+
+async def iter_playlists_async(bdmv: Union[str, os.PathLike], max_concurrency: int = 8,
+                               lazy: bool = False) -> AsyncIterator[Tuple[str, MplsFile]]:
+    """
+        Loads every playlist of a BDMV folder and yields (file name, MplsFile) as they complete.
+        At most `max_concurrency` files are being read at a time and no new read is started
+        while the consumer holds back, so a slow consumer never causes files to pile up in memory.
+    """
+    if max_concurrency < 1:
+        raise ValueError('iter_playlists_async: max_concurrency must be at least 1')
+
+    paths = iter(await asyncio.to_thread(list_playlists, bdmv))
+    pending: Set['asyncio.Task[Tuple[str, MplsFile]]'] = set()
+    try:
+        while True:
+            for path in paths:
+                pending.add(asyncio.create_task(_load_named(path, lazy)))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def scan_playlists_async(bdmv: Union[str, os.PathLike], max_concurrency: int = 8,
+                               lazy: bool = False) -> Dict[str, MplsFile]:
+    """Async counterpart of `pyparsebluray.mpls.scan_playlists` reading at most `max_concurrency` files at a time"""
+    playlists = {name: mpls async for name, mpls in iter_playlists_async(bdmv, max_concurrency, lazy)}
+    return dict(sorted(playlists.items()))
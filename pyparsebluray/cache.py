@@ -0,0 +1,157 @@
+"""Persistent on-disk cache of parsed files"""
+
+__all__ = ['ParseCache']
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .mpls import FrozenMplsFile, list_playlists, load_mpls_file, loads_mpls
+
+
+class ParseCache:
+    """
+        Size-bounded LRU cache of frozen parse results, stored in a SQLite database.
+
+        Entries are keyed on the absolute path, size and modification time of the file
+        or, if `key` is 'content', on a SHA-256 of its content.
+        With the default key, a hit only stats the file and never opens it.
+
+        Entries are pickled: only open a database written by a trusted process,
+        a crafted entry can run arbitrary code when it's loaded.
+    """
+    path: Path
+    max_size: int
+    key: str
+    hits: int
+    misses: int
+
+    def __init__(self, path: Union[str, os.PathLike], max_size: int = 256 << 20, key: str = 'stat') -> None:
+        if key not in {'stat', 'content'}:
+            raise ValueError(f'ParseCache: key must be "stat" or "content", not "{key}"')
+
+        self.path = Path(path)
+        self.max_size = max_size
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        self._evict()
+        self._db.commit()
+
+    def __enter__(self) -> 'ParseCache':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored entries"""
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit/miss counters and the current occupancy"""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self), 'size': self.size}
+
+    def load_mpls_file(self, path: Union[str, os.PathLike]) -> FrozenMplsFile:
+        """Returns the frozen sections of a MPLS file, parsing it only on a cache miss"""
+        try:
+            return self._load_mpls_file(path)
+        finally:
+            self._db.commit()
+
+    def scan_playlists(self, bdmv: Union[str, os.PathLike]) -> Dict[str, FrozenMplsFile]:
+        """Cached counterpart of `pyparsebluray.mpls.scan_playlists`"""
+        playlists = list_playlists(bdmv)
+        try:
+            return {path.name: self._load_mpls_file(path) for path in playlists}
+        finally:
+            self._db.commit()
+
+    def _load_mpls_file(self, path: Union[str, os.PathLike]) -> FrozenMplsFile:
+        if self.key == 'content':
+            data = Path(path).read_bytes()
+            key = 'sha256:' + hashlib.sha256(data).hexdigest()
+        else:
+            data = None
+            key = self._stat_key(path)
+
+        value = self._get(key)
+        if value is not None:
+            return value
+
+        value = (load_mpls_file(path) if data is None else loads_mpls(data)).freeze()
+        self._put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters"""
+        self._db.execute('DELETE FROM entries')
+        self._db.commit()
+        self._size = 0
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Writes pending LRU updates and closes the database"""
+        self._db.commit()
+        self._db.close()
+
+    @staticmethod
+    def _stat_key(path: Union[str, os.PathLike]) -> str:
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        return f'stat:{path}:{st.st_size}:{st.st_mtime_ns}'
+
+    def _get(self, key: str) -> Optional[Any]:
+        row = self._db.execute('SELECT value FROM entries WHERE key = ?', (key, )).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._db.execute('UPDATE entries SET last_used = ? WHERE key = ?', (time.time(), key))
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def _put(self, key: str, value: Any) -> None:
+        blob = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if len(blob) > self.max_size:
+            return
+        # A replaced entry, eg. written meanwhile by another process, no longer counts
+        row = self._db.execute('SELECT size FROM entries WHERE key = ?', (key, )).fetchone()
+        if row is not None:
+            self._size -= row[0]
+        self._db.execute(
+            'INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)',
+            (key, blob, len(blob), time.time())
+        )
+        self._size += len(blob)
+        self._evict()
+
+    def _evict(self) -> None:
+        excess = self._size - self.max_size
+        if excess <= 0:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._db.execute('SELECT key, size FROM entries ORDER BY last_used'):
+            victims.append((key, ))
+            freed += size
+            if freed >= excess:
+                break
+        self._db.executemany('DELETE FROM entries WHERE key = ?', victims)
+        self._size -= freed
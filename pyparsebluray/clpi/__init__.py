@@ -1 +1,17 @@
-# TODO:
+"""CLPI or clip information describing the streams and the entry points of a clip."""
+# flake8: noqa
+from .clip_info import *
+from .clip_information import *
+from .clip_mark import *
+from .cpi import *
+from .program_info import *
+from .sequence_info import *
+
+from .load import *
+
+__all__ = ['ClipInformation', 'ClipInfo', 'SequenceInfo', 'ProgramInfo', 'CPI', 'ClipMark', 'EPMapStream']
+__all__ += ['FrozenClipInformation', 'FrozenClipInfo', 'FrozenSequenceInfo', 'FrozenProgramInfo',
+            'FrozenCPI', 'FrozenClipMark', 'FrozenStreamCodingInfo']
+__all__ += ['load_clip_information', 'load_clip_info', 'load_sequence_info', 'load_program_info',
+            'load_cpi', 'load_clip_mark', 'load_extention_data']
+__all__ += ['ClpiFile', 'FrozenClpiFile', 'load_clpi', 'loads_clpi', 'load_clpi_file', 'scan_clips']
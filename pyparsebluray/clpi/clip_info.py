@@ -0,0 +1,119 @@
+"""https://github.com/lw/BluRay/wiki/ClipInfo"""
+
+__all__ = ['ClipInfo', 'FrozenClipInfo']
+
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from ..mpls.diagnostics import section_end
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject, decode_string
+from ..mpls.schema import Field, Group, Repeat, compile_schema
+
+
+class ATCDelta(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/ClipInfo"""
+    atc_delta: int
+    following_clip_information_filename: str
+    following_clip_codec_identifier: str
+
+
+_LOAD_CLIP_INFO = compile_schema('_load_clip_info', (
+    Field(None, '2x'),                                                          # 2 bytes - 16 bits - Reserved
+    Field('clip_stream_type', 'B'),                                             # 1 byte - 8 bits
+    Field('application_type', 'B'),                                             # 1 byte - 8 bits
+    Field('misc_flags_1', 'I', bits=(('is_atc_delta', 0, 1),)),                # 4 bytes - 32 bits
+    Field('ts_recording_rate', 'I'),                                            # 4 bytes - 32 bits
+    Field('nb_source_packets', 'I'),                                            # 4 bytes - 32 bits
+    Field(None, '128x'),                                                        # 128 bytes - 1024 bits - Reserved
+    Field('ts_type_info_block_length', 'H'),                                    # 2 bytes - 16 bits
+    Group('ts_type_info_block_length != 0', (
+        Field('validity_flags', 'B'),                                           # 1 byte - 8 bits
+        Field('format_identifier', '4s', convert=decode_string),               # 4 bytes - 32 bits
+    )),
+))
+
+# Following the TSTypeInfoBlock
+_LOAD_CLIP_INFO_LISTS = compile_schema('_load_clip_info_lists', (
+    Group('_obj.is_atc_delta', (
+        Field(None, 'x'),                                                       # 1 byte - 8 bits - Reserved
+        Field('nb_atc_deltas', 'B'),                                            # 1 byte - 8 bits
+        # nb_atc_deltas x 14 bytes:
+        Repeat('atc_deltas', 'nb_atc_deltas', (
+            Field('atc_delta', 'I'),                                            # 4 bytes - 32 bits
+            Field('following_clip_information_filename', '5s', convert=decode_string),  # 5 bytes - 40 bits
+            Field('following_clip_codec_identifier', '4s', convert=decode_string),      # 4 bytes - 32 bits
+            Field(None, 'x'),                                                   # 1 byte - 8 bits - Reserved
+        ), ATCDelta),
+    )),
+    # Sub TS for a sub-path of Text subtitle
+    Group('_obj.application_type == 0x06', (
+        Field(None, 'x'),                                                       # 1 byte - 8 bits - Reserved
+        Field('nb_font_files', 'B'),                                            # 1 byte - 8 bits
+        # nb_font_files x 6 bytes:
+        Repeat('font_filenames', 'nb_font_files', (
+            Field('font_filename', '5s'),                                       # 5 bytes - 40 bits
+            Field(None, 'x'),                                                   # 1 byte - 8 bits - Reserved
+        ), decode_string),
+    )),
+))
+
+
+class FrozenClipInfo(NamedTuple):
+    """Frozen ClipInfo"""
+    length: int
+    clip_stream_type: Optional[int]
+    application_type: Optional[int]
+    misc_flags_1: Optional[int]
+    is_atc_delta: Optional[bool]
+    ts_recording_rate: Optional[int]
+    nb_source_packets: Optional[int]
+    ts_type_info_block_length: Optional[int]
+    validity_flags: Optional[int]
+    format_identifier: Optional[str]
+    nb_atc_deltas: Optional[int]
+    atc_deltas: Optional[Tuple[ATCDelta, ...]]
+    nb_font_files: Optional[int]
+    font_filenames: Optional[Tuple[str, ...]]
+
+
+class ClipInfo(MplsObject):
+    """https://github.com/lw/BluRay/wiki/ClipInfo"""
+    length: int
+    clip_stream_type: Optional[int]
+    application_type: Optional[int]
+    misc_flags_1: Optional[int]
+    is_atc_delta: Optional[bool]
+    ts_recording_rate: Optional[int]
+    nb_source_packets: Optional[int]
+    ts_type_info_block_length: Optional[int]
+    validity_flags: Optional[int]
+    format_identifier: Optional[str]
+    nb_atc_deltas: Optional[int]
+    atc_deltas: Optional[List[ATCDelta]]
+    nb_font_files: Optional[int]
+    font_filenames: Optional[List[str]]
+
+    _frozen = FrozenClipInfo
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.nb_atc_deltas = self.atc_deltas = self.nb_font_files = self.font_filenames = None
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            end = section_end(data, offset, self.length + 4)
+
+            _LOAD_CLIP_INFO(self, data, offset + 4, end)
+            offset += 4 + _LOAD_CLIP_INFO.size + self.ts_type_info_block_length
+
+            _LOAD_CLIP_INFO_LISTS(self, data, offset, end)
+
+        return self
@@ -0,0 +1,57 @@
+"""https://github.com/lw/BluRay/wiki/CLPI"""
+
+__all__ = ['ClipInformation', 'FrozenClipInformation']
+
+
+from typing import NamedTuple
+
+from ..mpls.diagnostics import section_end
+from ..mpls.movie_playlist import Buffer, MplsObject, decode_string
+from ..mpls.schema import Field, compile_schema
+
+_LOAD_CLIP_INFORMATION = compile_schema('_load_clip_information', (
+    Field('type_indicator', '4s', convert=decode_string),                      # 4 bytes - 32 bits
+    Field('version_number', '4s', convert=decode_string),                      # 4 bytes - 32 bits
+    Field('sequence_info_start_address', 'I'),                                  # 4 bytes - 32 bits
+    Field('program_info_start_address', 'I'),                                   # 4 bytes - 32 bits
+    Field('cpi_start_address', 'I'),                                            # 4 bytes - 32 bits
+    Field('clip_mark_start_address', 'I'),                                      # 4 bytes - 32 bits
+    Field('extension_data_start_address', 'I'),                                 # 4 bytes - 32 bits
+))
+
+
+class FrozenClipInformation(NamedTuple):
+    """Frozen ClipInformation"""
+    type_indicator: str
+    version_number: str
+    sequence_info_start_address: int
+    program_info_start_address: int
+    cpi_start_address: int
+    clip_mark_start_address: int
+    extension_data_start_address: int
+
+
+class ClipInformation(MplsObject):
+    """https://github.com/lw/BluRay/wiki/CLPI"""
+    type_indicator: str
+    version_number: str
+    sequence_info_start_address: int
+    program_info_start_address: int
+    cpi_start_address: int
+    clip_mark_start_address: int
+    extension_data_start_address: int
+
+    _frozen = FrozenClipInformation
+
+    def load(self):
+        pos = self._get_pos()
+
+        if pos != 0:
+            raise Exception('ClipInformation: You should called it at the start of the clpi file!')
+
+        return self.load_from(self.mpls.read(_LOAD_CLIP_INFORMATION.size + 12))  # 12 bytes - 96 bits - Reserved
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        _LOAD_CLIP_INFORMATION(self, data, offset, section_end(data, offset, _LOAD_CLIP_INFORMATION.size))
+
+        return self
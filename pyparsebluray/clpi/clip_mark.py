@@ -0,0 +1,37 @@
+"""https://github.com/lw/BluRay/wiki/ClipMark"""
+
+__all__ = ['ClipMark', 'FrozenClipMark']
+
+
+from typing import NamedTuple
+
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject
+
+
+class FrozenClipMark(NamedTuple):
+    """Frozen ClipMark"""
+    length: int
+
+
+class ClipMark(MplsObject):
+    """
+        https://github.com/lw/BluRay/wiki/ClipMark
+        The content of ClipMark is reserved by the BD-ROM format and is always empty on discs.
+    """
+    length: int
+
+    _frozen = FrozenClipMark
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        return self
@@ -0,0 +1,205 @@
+"""https://github.com/lw/BluRay/wiki/CPI"""
+
+__all__ = ['CPI', 'FrozenCPI', 'EPMapStream']
+
+
+import sys
+from array import array
+from struct import Struct
+from struct import error as StructError
+from typing import List, NamedTuple, Optional, Tuple
+
+from ..mpls.diagnostics import cap_count, section_end
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject, iter_unpack_from
+from ..mpls.schema import Field, compile_schema
+
+_EP_MAP_STREAM = Struct('>HHII')
+
+_LOAD_CPI = compile_schema('_load_cpi', (
+    Field('_cpi_type', 'H', bits=(('cpi_type', 0, 4),)),                       # 12 bits - Reserved, 4 bits
+    # EP map
+    Field(None, 'x'),                                                           # 1 byte - 8 bits - Reserved
+    Field('nb_stream_pid_entries', 'B'),                                        # 1 byte - 8 bits
+))
+
+
+def _uint32_array(data: Buffer, offset: int, count: int) -> 'array[int]':
+    """Decodes `count` big-endian unsigned 32 bits integers in one pass"""
+    if len(data) - offset < count * 4:
+        raise StructError(f'_uint32_array requires a buffer of at least {offset + count * 4} bytes')
+    words = array('I')
+    words.frombytes(memoryview(data)[offset:offset + count * 4])
+    if sys.byteorder == 'little':
+        words.byteswap()
+    return words
+
+
+class EPMapStream(NamedTuple):
+    """
+        https://github.com/lw/BluRay/wiki/CPI
+        Coarse and fine entries are stored column-wise in `array.array`
+    """
+    stream_pid: int
+    ep_stream_type: int
+    nb_ep_coarse_entries: int
+    nb_ep_fine_entries: int
+    ep_map_stream_start_address: int
+
+    ref_to_ep_fine_id: 'array[int]'
+    pts_ep_coarse: 'array[int]'
+    spn_ep_coarse: 'array[int]'
+
+    is_angle_change_point: 'array[int]'
+    i_end_position_offset: 'array[int]'
+    pts_ep_fine: 'array[int]'
+    spn_ep_fine: 'array[int]'
+
+    def entry_points(self) -> Tuple['array[int]', 'array[int]']:
+        """
+            Returns the full 33 bits PTS (90 kHz) and the SPN of every fine entry,
+            combining each of them with its coarse entry. Both arrays are sorted.
+            Only the entries that were decoded are combined, fewer than the counts of a truncated map.
+        """
+        nb_fine = len(self.pts_ep_fine)
+        pts = array('Q', bytes(8 * nb_fine))
+        spn = array('Q', bytes(8 * nb_fine))
+        bounds = list(self.ref_to_ep_fine_id[1:]) + [nb_fine]
+
+        for coarse_id, end in enumerate(bounds):
+            pts_coarse = (self.pts_ep_coarse[coarse_id] & ~0x01) << 19
+            spn_coarse = self.spn_ep_coarse[coarse_id] & ~0x1FFFF
+            for fine_id in range(min(self.ref_to_ep_fine_id[coarse_id], nb_fine), min(end, nb_fine)):
+                pts[fine_id] = pts_coarse + (self.pts_ep_fine[fine_id] << 9)
+                spn[fine_id] = spn_coarse + self.spn_ep_fine[fine_id]
+
+        return pts, spn
+
+    def to_numpy(self):
+        """
+            Returns the coarse and fine entries as two NumPy structured arrays
+            with one field per column. Requires numpy.
+        """
+        import numpy as np
+
+        coarse = np.empty(len(self.pts_ep_coarse), dtype=EP_COARSE_DTYPE)
+        coarse['ref_to_ep_fine_id'] = self.ref_to_ep_fine_id
+        coarse['pts_ep_coarse'] = self.pts_ep_coarse
+        coarse['spn_ep_coarse'] = self.spn_ep_coarse
+
+        fine = np.empty(len(self.pts_ep_fine), dtype=EP_FINE_DTYPE)
+        fine['is_angle_change_point'] = self.is_angle_change_point
+        fine['i_end_position_offset'] = self.i_end_position_offset
+        fine['pts_ep_fine'] = self.pts_ep_fine
+        fine['spn_ep_fine'] = self.spn_ep_fine
+
+        return coarse, fine
+
+
+EP_COARSE_DTYPE = [
+    ('ref_to_ep_fine_id', 'u4'),
+    ('pts_ep_coarse', 'u2'),
+    ('spn_ep_coarse', 'u4'),
+]
+
+EP_FINE_DTYPE = [
+    ('is_angle_change_point', 'u1'),
+    ('i_end_position_offset', 'u1'),
+    ('pts_ep_fine', 'u2'),
+    ('spn_ep_fine', 'u4'),
+]
+
+
+class FrozenCPI(NamedTuple):
+    """Frozen CPI"""
+    length: int
+    cpi_type: Optional[int]
+    nb_stream_pid_entries: Optional[int]
+    ep_map_streams: Optional[Tuple[EPMapStream, ...]]
+
+
+class CPI(MplsObject):
+    """https://github.com/lw/BluRay/wiki/CPI"""
+    length: int
+    cpi_type: Optional[int]
+    nb_stream_pid_entries: Optional[int]
+    ep_map_streams: Optional[List[EPMapStream]]
+
+    _frozen = FrozenCPI
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.cpi_type = self.nb_stream_pid_entries = self.ep_map_streams = None
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            end = section_end(data, offset, self.length + 4)
+
+            # The start addresses of the EP map are relative to it
+            ep_map_pos = offset + 6
+            offset = _LOAD_CPI(self, data, offset + 4, end)
+
+            self.ep_map_streams = []
+            nb_streams = cap_count(self, 'nb_stream_pid_entries', self.nb_stream_pid_entries,
+                                   offset, end, _EP_MAP_STREAM.size)
+
+            # nb_stream_pid_entries x 12 bytes:
+            # 2 bytes - 16 bits - stream_pid
+            # 10 bits - Reserved
+            # 4 bits - ep_stream_type
+            # 16 bits - nb_ep_coarse_entries
+            # 18 bits - nb_ep_fine_entries
+            # 4 bytes - 32 bits - ep_map_stream_start_address
+            for stream_pid, type_and_coarse, coarse_and_fine, ep_map_stream_start_address in iter_unpack_from(
+                _EP_MAP_STREAM, data, offset, nb_streams
+            ):
+                ep_stream_type = (type_and_coarse >> 2) & 0x0F
+                nb_ep_coarse_entries = ((type_and_coarse & 0x03) << 14) | (coarse_and_fine >> 18)
+                nb_ep_fine_entries = coarse_and_fine & 0x3FFFF
+                start = ep_map_pos + ep_map_stream_start_address
+                self.ep_map_streams.append(
+                    EPMapStream(stream_pid, ep_stream_type, nb_ep_coarse_entries, nb_ep_fine_entries,
+                                ep_map_stream_start_address, *self._load_ep_map_stream(
+                                    data, start, end, nb_ep_coarse_entries, nb_ep_fine_entries
+                                ))
+                )
+
+        return self
+
+    def _load_ep_map_stream(self, data: Buffer, offset: int, end: int,
+                            nb_ep_coarse_entries: int, nb_ep_fine_entries: int) -> Tuple['array[int]', ...]:
+        ep_fine_table_start_address, = UINT32.unpack_from(data, offset)        # 4 bytes - 32 bits
+
+        # nb_ep_coarse_entries x 8 bytes:
+        # 18 bits - ref_to_ep_fine_id
+        # 14 bits - pts_ep_coarse
+        # 32 bits - spn_ep_coarse
+        nb_ep_coarse_entries = cap_count(self, 'nb_ep_coarse_entries', nb_ep_coarse_entries, offset + 4, end, 8)
+        coarse = _uint32_array(data, offset + 4, 2 * nb_ep_coarse_entries)
+        ref_and_pts = coarse[0::2]
+        ref_to_ep_fine_id = array('I', [w >> 14 for w in ref_and_pts])
+        pts_ep_coarse = array('I', [w & 0x3FFF for w in ref_and_pts])
+        spn_ep_coarse = coarse[1::2]
+
+        # nb_ep_fine_entries x 4 bytes:
+        # 1 bit - is_angle_change_point
+        # 3 bits - i_end_position_offset
+        # 11 bits - pts_ep_fine
+        # 17 bits - spn_ep_fine
+        fine_pos = offset + ep_fine_table_start_address
+        nb_ep_fine_entries = cap_count(self, 'nb_ep_fine_entries', nb_ep_fine_entries, fine_pos, end, 4)
+        fine = _uint32_array(data, fine_pos, nb_ep_fine_entries)
+        is_angle_change_point = array('B', [w >> 31 for w in fine])
+        i_end_position_offset = array('B', [(w >> 28) & 0x07 for w in fine])
+        pts_ep_fine = array('I', [(w >> 17) & 0x7FF for w in fine])
+        spn_ep_fine = array('I', [w & 0x1FFFF for w in fine])
+
+        return ref_to_ep_fine_id, pts_ep_coarse, spn_ep_coarse, \
+            is_angle_change_point, i_end_position_offset, pts_ep_fine, spn_ep_fine
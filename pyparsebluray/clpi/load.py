@@ -0,0 +1,120 @@
+"""Convenience functions"""
+
+__all__ = ['load_clip_information', 'load_clip_info', 'load_sequence_info', 'load_program_info',
+           'load_cpi', 'load_clip_mark', 'load_extention_data',
+           'ClpiFile', 'FrozenClpiFile', 'load_clpi', 'loads_clpi', 'load_clpi_file', 'scan_clips']
+
+import mmap
+import os
+from io import BufferedReader
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+from ..mpls.diagnostics import load_section
+from ..mpls.extension_data import ExtensionData, FrozenExtensionData
+from ..mpls.load import load_extention_data
+from ..mpls.movie_playlist import Buffer
+from .clip_info import ClipInfo, FrozenClipInfo
+from .clip_information import ClipInformation, FrozenClipInformation
+from .clip_mark import ClipMark, FrozenClipMark
+from .cpi import CPI, FrozenCPI
+from .program_info import FrozenProgramInfo, ProgramInfo
+from .sequence_info import FrozenSequenceInfo, SequenceInfo
+
+
+def load_clip_information(clpi: BufferedReader) -> ClipInformation:
+    """Loads and returns a ClipInformation object"""
+    return ClipInformation(clpi).load()
+
+
+def load_clip_info(clpi: BufferedReader) -> ClipInfo:
+    """Loads and returns a ClipInfo object"""
+    return ClipInfo(clpi).load()
+
+
+def load_sequence_info(clpi: BufferedReader) -> SequenceInfo:
+    """Loads and returns a SequenceInfo object"""
+    return SequenceInfo(clpi).load()
+
+
+def load_program_info(clpi: BufferedReader) -> ProgramInfo:
+    """Loads and returns a ProgramInfo object"""
+    return ProgramInfo(clpi).load()
+
+
+def load_cpi(clpi: BufferedReader) -> CPI:
+    """Loads and returns a CPI object"""
+    return CPI(clpi).load()
+
+
+def load_clip_mark(clpi: BufferedReader) -> ClipMark:
+    """Loads and returns a ClipMark object"""
+    return ClipMark(clpi).load()
+
+
+class FrozenClpiFile(NamedTuple):
+    """Every frozen section of a CLPI file"""
+    clip_information: FrozenClipInformation
+    clip_info: FrozenClipInfo
+    sequence_info: FrozenSequenceInfo
+    program_info: FrozenProgramInfo
+    cpi: FrozenCPI
+    clip_mark: FrozenClipMark
+    extension_data: Optional[FrozenExtensionData]
+
+
+class ClpiFile(NamedTuple):
+    """Every section of a CLPI file"""
+    clip_information: ClipInformation
+    clip_info: ClipInfo
+    sequence_info: SequenceInfo
+    program_info: ProgramInfo
+    cpi: CPI
+    clip_mark: ClipMark
+    extension_data: Optional[ExtensionData]
+
+    def freeze(self) -> FrozenClpiFile:
+        """Returns the frozen counterpart of every section"""
+        return FrozenClpiFile._make(None if section is None else section.freeze() for section in self)
+
+
+def load_clpi(clpi: BufferedReader) -> ClpiFile:
+    """Reads the whole CLPI file in one call and returns all of its sections"""
+    clpi.seek(0, os.SEEK_SET)
+    return _load_sections(clpi.read(), clpi)
+
+
+def loads_clpi(data: Buffer) -> ClpiFile:
+    """Loads and returns all the sections of an in-memory CLPI file"""
+    return _load_sections(data, None)
+
+
+def load_clpi_file(path: Union[str, os.PathLike]) -> ClpiFile:
+    """Memory-maps a CLPI file and returns all of its sections"""
+    with open(path, 'rb') as clpi:
+        if os.fstat(clpi.fileno()).st_size == 0:
+            return _load_sections(b'', None)
+        with mmap.mmap(clpi.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _load_sections(data, None)
+
+
+def scan_clips(bdmv: Union[str, os.PathLike]) -> Dict[str, ClpiFile]:
+    """Loads every clip information file of a BDMV folder, keyed and sorted by file name"""
+    clips = sorted(
+        path for path in Path(bdmv, 'CLIPINF').iterdir()
+        if path.suffix.lower() == '.clpi' and path.is_file()
+    )
+    return {path.name: load_clpi_file(path) for path in clips}
+
+
+def _load_sections(data: Buffer, clpi: Optional[BufferedReader]) -> ClpiFile:
+    header = load_section(ClipInformation(clpi), data, 0, required=True)
+    clip_info = load_section(ClipInfo(clpi), data, 40)
+    sequence_info = load_section(SequenceInfo(clpi), data, header.sequence_info_start_address)
+    program_info = load_section(ProgramInfo(clpi), data, header.program_info_start_address)
+    cpi = load_section(CPI(clpi), data, header.cpi_start_address)
+    clip_mark = load_section(ClipMark(clpi), data, header.clip_mark_start_address)
+    extension = None
+    if header.extension_data_start_address != 0:
+        extension = load_section(ExtensionData(clpi), data, header.extension_data_start_address)
+    return ClpiFile(header, clip_info, sequence_info, program_info, cpi, clip_mark, extension)
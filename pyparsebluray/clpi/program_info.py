@@ -0,0 +1,197 @@
+"""https://github.com/lw/BluRay/wiki/ProgramInfo"""
+
+__all__ = ['ProgramInfo', 'FrozenProgramInfo', 'FrozenStreamCodingInfo']
+
+
+from struct import Struct
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from ..mpls.diagnostics import fits, report, section_end
+from ..mpls.movie_playlist import UINT8, UINT16, UINT32, Buffer, MplsObject, decode_string
+from ..mpls.play_item import CHARACTER_CODE
+from ..mpls.schema import Field, Group, compile_schema
+
+_PROGRAM = Struct('>IHBB')
+
+_LOAD_STREAM_CODING_INFO = compile_schema('_load_stream_coding_info', (
+    Field('stream_coding_type', 'B'),                                           # 1 byte - 8 bits
+    Group('stream_coding_type in {0x01, 0x02, 0x1B, 0x20, 0xEA}', (
+        Field('_video_format_and_framerate', 'B',                               # 1 byte - 8 bits
+              bits=(('video_format', 4, 4), ('framerate', 0, 4))),
+        Field('_aspect_ratio_and_flags', 'B',                                   # 1 byte - 8 bits
+              bits=(('aspect_ratio', 4, 4), ('oc_flag', 1, 1))),
+    )),
+    Group('stream_coding_type == 0x24', (
+        Field('_video_format_and_framerate', 'B',                               # 1 byte - 8 bits
+              bits=(('video_format', 4, 4), ('framerate', 0, 4))),
+        Field('_aspect_ratio_and_flags', 'B',                                   # 1 byte - 8 bits
+              bits=(('aspect_ratio', 4, 4), ('oc_flag', 1, 1), ('cr_flag', 0, 1))),
+        Field('_dynamic_range_type_and_colorspace', 'B',                        # 1 byte - 8 bits
+              bits=(('dynamic_range_type', 4, 4), ('colorspace', 0, 4))),
+        Field('_hdr_plus_flag', 'B', bits=(('hdr_plus_flag', 7, 1),)),         # 1 byte - 8 bits
+    )),
+    Group('stream_coding_type in {0x03, 0x04, 0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0xA1, 0xA2}', (
+        Field('_audio_format_and_samplerate', 'B',                              # 1 byte - 8 bits
+              bits=(('audio_format', 4, 4), ('samplerate', 0, 4))),
+        Field('language_code', '3s', convert=decode_string),                   # 3 bytes - 24 bits
+    )),
+    Group('stream_coding_type in {0x90, 0x91, 0xA0}', (
+        Field('language_code', '3s', convert=decode_string),                   # 3 bytes - 24 bits
+    )),
+    # The language code is decoded according to the character code once it's read
+    Group('stream_coding_type == 0x92', (
+        Field('character_code', 'B'),                                           # 1 byte - 8 bits
+        Field('language_code', '3s'),                                           # 3 bytes - 24 bits
+    )),
+))
+
+
+class FrozenStreamCodingInfo(NamedTuple):
+    """Frozen StreamCodingInfo"""
+    length: int
+    stream_coding_type: Optional[int]
+    video_format: Optional[int]
+    framerate: Optional[int]
+    aspect_ratio: Optional[int]
+    oc_flag: Optional[bool]
+    cr_flag: Optional[bool]
+    dynamic_range_type: Optional[int]
+    colorspace: Optional[int]
+    hdr_plus_flag: Optional[bool]
+    audio_format: Optional[int]
+    samplerate: Optional[int]
+    language_code: Union[str, bytes, None]
+    character_code: Optional[int]
+
+
+class StreamCodingInfo(MplsObject):
+    """https://github.com/lw/BluRay/wiki/StreamCodingInfo"""
+    length: int
+    stream_coding_type: Optional[int]
+
+    video_format: Optional[int]
+    framerate: Optional[int]
+    aspect_ratio: Optional[int]
+    oc_flag: Optional[bool]
+
+    cr_flag: Optional[bool]
+    dynamic_range_type: Optional[int]
+    colorspace: Optional[int]
+    hdr_plus_flag: Optional[bool]
+
+    audio_format: Optional[int]
+    samplerate: Optional[int]
+
+    language_code: Union[str, bytes, None]
+    character_code: Optional[int]
+
+    _frozen = FrozenStreamCodingInfo
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT8))
+
+        self.mpls.seek(pos + self.length + 1)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT8.unpack_from(data, offset)                          # 1 byte - 8 bits
+
+        if self.length != 0:
+            _LOAD_STREAM_CODING_INFO(self, data, offset + 1, section_end(data, offset, self.length + 1))
+
+            if self.stream_coding_type == 0x92:
+                self._decode_text_language_code(offset + 2)
+
+        return self
+
+    def _decode_text_language_code(self, offset: int) -> None:
+        if self.character_code in CHARACTER_CODE:
+            self.language_code = decode_string(self.language_code, CHARACTER_CODE[self.character_code])
+        else:
+            report(self, offset, f'character_code was not a recognised value {self.character_code}')
+
+
+class ProgramStream(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/ProgramInfo"""
+    stream_pid: int
+    stream_coding_info: StreamCodingInfo
+
+
+class Program(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/ProgramInfo"""
+    spn_program_sequence_start: int
+    program_map_pid: int
+    nb_streams_in_ps: int
+    nb_groups: int
+    program_streams: List[ProgramStream]
+
+
+_LOAD_PROGRAM_INFO = compile_schema('_load_program_info', (
+    Field(None, 'x'),                                                           # 1 byte - 8 bits - Reserved
+    Field('nb_programs', 'B'),                                                  # 1 byte - 8 bits
+))
+
+
+class FrozenProgramInfo(NamedTuple):
+    """Frozen ProgramInfo"""
+    length: int
+    nb_programs: Optional[int]
+    programs: Optional[Tuple[Program, ...]]
+
+
+class ProgramInfo(MplsObject):
+    """https://github.com/lw/BluRay/wiki/ProgramInfo"""
+    length: int
+    nb_programs: Optional[int]
+    programs: Optional[List[Program]]
+
+    _frozen = FrozenProgramInfo
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.nb_programs = self.programs = None
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            end = section_end(data, offset, self.length + 4)
+
+            offset = _LOAD_PROGRAM_INFO(self, data, offset + 4, end)
+
+            self.programs = []
+            for i in range(self.nb_programs):
+                if not fits(self, 'nb_programs', self.nb_programs, i, offset, end, _PROGRAM.size):
+                    break
+                # 4 bytes - 32 bits
+                # 2 bytes - 16 bits
+                # 1 byte - 8 bits
+                # 1 byte - 8 bits
+                spn_program_sequence_start, program_map_pid, \
+                    nb_streams_in_ps, nb_groups = _PROGRAM.unpack_from(data, offset)
+                offset += _PROGRAM.size
+
+                program_streams = []
+                for j in range(nb_streams_in_ps):
+                    # stream_pid and the length of the StreamCodingInfo at least
+                    if not fits(self, 'nb_streams_in_ps', nb_streams_in_ps, j, offset, end, 3):
+                        break
+                    stream_pid, = UINT16.unpack_from(data, offset)              # 2 bytes - 16 bits
+                    stream_coding_info = StreamCodingInfo(self.mpls).load_from(data, offset + 2)
+                    offset += stream_coding_info.length + 3
+                    program_streams.append(ProgramStream(stream_pid, stream_coding_info))
+
+                self.programs.append(
+                    Program(spn_program_sequence_start, program_map_pid, nb_streams_in_ps, nb_groups, program_streams)
+                )
+
+        return self
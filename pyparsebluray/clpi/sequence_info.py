@@ -0,0 +1,78 @@
+"""https://github.com/lw/BluRay/wiki/SequenceInfo"""
+
+__all__ = ['SequenceInfo', 'FrozenSequenceInfo']
+
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from ..mpls.diagnostics import section_end
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject
+from ..mpls.schema import Field, Repeat, compile_schema
+
+
+class STCSequence(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/SequenceInfo"""
+    pcr_pid: int
+    spn_stc_start: int
+    presentation_start_time: int
+    presentation_end_time: int
+
+
+class ATCSequence(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/SequenceInfo"""
+    spn_atc_start: int
+    nb_stc_sequences: int
+    offset_stc_id: int
+    stc_sequences: List[STCSequence]
+
+
+_LOAD_SEQUENCE_INFO = compile_schema('_load_sequence_info', (
+    Field(None, 'x'),                                                           # 1 byte - 8 bits - Reserved
+    Field('nb_atc_sequences', 'B'),                                             # 1 byte - 8 bits
+    Repeat('atc_sequences', 'nb_atc_sequences', (
+        Field('spn_atc_start', 'I'),                                            # 4 bytes - 32 bits
+        Field('nb_stc_sequences', 'B'),                                         # 1 byte - 8 bits
+        Field('offset_stc_id', 'B'),                                            # 1 byte - 8 bits
+        # nb_stc_sequences x 14 bytes:
+        Repeat('stc_sequences', 'nb_stc_sequences', (
+            Field('pcr_pid', 'H'),                                              # 2 bytes - 16 bits
+            Field('spn_stc_start', 'I'),                                        # 4 bytes - 32 bits
+            Field('presentation_start_time', 'I'),                              # 4 bytes - 32 bits
+            Field('presentation_end_time', 'I'),                                # 4 bytes - 32 bits
+        ), STCSequence),
+    ), ATCSequence),
+))
+
+
+class FrozenSequenceInfo(NamedTuple):
+    """Frozen SequenceInfo"""
+    length: int
+    nb_atc_sequences: Optional[int]
+    atc_sequences: Optional[Tuple[ATCSequence, ...]]
+
+
+class SequenceInfo(MplsObject):
+    """https://github.com/lw/BluRay/wiki/SequenceInfo"""
+    length: int
+    nb_atc_sequences: Optional[int]
+    atc_sequences: Optional[List[ATCSequence]]
+
+    _frozen = FrozenSequenceInfo
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.nb_atc_sequences = self.atc_sequences = None
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            _LOAD_SEQUENCE_INFO(self, data, offset + 4, section_end(data, offset, self.length + 4))
+
+        return self
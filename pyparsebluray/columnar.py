@@ -0,0 +1,243 @@
+"""Columnar export of playlists, play items, marks and streams across a library"""
+
+__all__ = ['LibraryTables', 'PLAYLIST_COLUMNS', 'PLAY_ITEM_COLUMNS', 'MARK_COLUMNS', 'STREAM_COLUMNS',
+           'STREAM_KINDS']
+
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# (column, NumPy type, array typecode)
+Columns = List[Tuple[str, str, str]]
+
+PLAYLIST_COLUMNS: Columns = [
+    ('playlist_id', 'u4', 'I'),
+    ('disc', 'u4', 'I'),                                                        # Index in `discs`
+    ('name', 'u4', 'I'),                                                        # Index in `names`
+    ('nb_play_items', 'u2', 'H'),
+    ('nb_sub_paths', 'u2', 'H'),
+    ('nb_playlist_marks', 'u2', 'H'),
+    ('duration', 'u8', 'Q'),                                                    # 45 kHz
+]
+
+PLAY_ITEM_COLUMNS: Columns = [
+    ('playlist_id', 'u4', 'I'),
+    ('play_item_id', 'u2', 'H'),
+    ('clip', 'u4', 'I'),                                                        # Index in `clips`
+    ('intime', 'u4', 'I'),
+    ('outtime', 'u4', 'I'),
+    ('nb_angles', 'u1', 'B'),
+]
+
+MARK_COLUMNS: Columns = [
+    ('playlist_id', 'u4', 'I'),
+    ('mark_type', 'u1', 'B'),
+    ('ref_to_play_item_id', 'u2', 'H'),
+    ('mark_timestamp', 'u4', 'I'),
+    ('entry_espid', 'u2', 'H'),
+    ('duration', 'u4', 'I'),
+]
+
+STREAM_COLUMNS: Columns = [
+    ('playlist_id', 'u4', 'I'),
+    ('play_item_id', 'u2', 'H'),
+    ('kind', 'u1', 'B'),                                                        # Index in STREAM_KINDS
+    ('stream_id', 'u1', 'B'),                                                   # Position in its kind
+    ('stream_type', 'u1', 'B'),
+    ('pid', 'u2', 'H'),
+    ('stream_coding_type', 'u1', 'B'),
+    ('video_format', 'u1', 'B'),
+    ('framerate', 'u1', 'B'),
+    ('dynamic_range_type', 'u1', 'B'),
+    ('colorspace', 'u1', 'B'),
+    ('audio_format', 'u1', 'B'),
+    ('samplerate', 'u1', 'B'),
+    ('character_code', 'u1', 'B'),
+    ('language', 'u2', 'H'),                                                    # Index in `languages`
+]
+
+STREAM_KINDS: Tuple[str, ...] = (
+    'prim_video', 'prim_audio', 'prim_pgs', 'seco_pgs', 'prim_igs', 'seco_audio', 'seco_video', 'dv'
+)
+
+_STREAM_ATTRIBUTES = ('stream_coding_type', 'video_format', 'framerate', 'dynamic_range_type',
+                      'colorspace', 'audio_format', 'samplerate', 'character_code')
+
+
+class _Dictionary:
+    """Dictionary encoding of strings to small ints, code 0 being the empty string"""
+
+    def __init__(self) -> None:
+        self.values: List[str] = ['']
+        self._codes: Dict[str, int] = {'': 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        if not value:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _Table:
+    def __init__(self, columns: Columns) -> None:
+        self.columns = columns
+        self.data = {name: array(typecode) for name, _, typecode in columns}
+        self._appends = [self.data[name].append for name, _, _ in columns]
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0][0]])
+
+    def append(self, *row: int) -> None:
+        for append, value in zip(self._appends, row):
+            append(value)
+
+
+class LibraryTables:
+    """
+        Flattens loaded or frozen playlists into typed columns, appended incrementally as discs are scanned.
+
+        Every code is stored as a small unsigned int, 0 standing for a missing value.
+        Disc paths, playlist names, clip names and languages are dictionary-encoded:
+        their columns hold indexes in `discs`, `names`, `clips` and `languages`.
+        `to_numpy` returns NumPy structured arrays and `to_arrow` pyarrow tables
+        with dictionary-typed string columns; both libraries are optional.
+    """
+    playlists: _Table
+    play_items: _Table
+    marks: _Table
+    streams: _Table
+
+    def __init__(self) -> None:
+        self.playlists = _Table(PLAYLIST_COLUMNS)
+        self.play_items = _Table(PLAY_ITEM_COLUMNS)
+        self.marks = _Table(MARK_COLUMNS)
+        self.streams = _Table(STREAM_COLUMNS)
+        self._discs = _Dictionary()
+        self._names = _Dictionary()
+        self._clips = _Dictionary()
+        self._languages = _Dictionary()
+
+    @property
+    def discs(self) -> List[str]:
+        """Disc paths indexed by the `disc` column"""
+        return self._discs.values
+
+    @property
+    def names(self) -> List[str]:
+        """Playlist file names indexed by the `name` column"""
+        return self._names.values
+
+    @property
+    def clips(self) -> List[str]:
+        """Clip information filenames indexed by the `clip` column"""
+        return self._clips.values
+
+    @property
+    def languages(self) -> List[str]:
+        """Language codes indexed by the `language` column"""
+        return self._languages.values
+
+    def language_code(self, language: str) -> int:
+        """Returns the code of a language in the `language` column, or -1 if no stream has it"""
+        return self._languages._codes.get(language, -1)
+
+    def append_playlist(self, disc: str, name: str, mpls: Any) -> int:
+        """Appends a loaded or frozen MplsFile and returns its playlist_id"""
+        playlist_id = len(self.playlists)
+        playlist, playlist_mark = mpls.playlist, mpls.playlist_mark
+        play_items = playlist.play_items or ()
+
+        duration = 0
+        for play_item_id, play_item in enumerate(play_items):
+            duration += max(play_item.outtime - play_item.intime, 0)
+            self.play_items.append(
+                playlist_id, play_item_id, self._clips.encode(play_item.clip_information_filename),
+                play_item.intime, play_item.outtime,
+                play_item.nb_angles if play_item.is_multi_angle else 0
+            )
+            self._append_streams(playlist_id, play_item_id, play_item.stn_table)
+
+        for mark in playlist_mark.playlist_marks or ():
+            self.marks.append(
+                playlist_id, mark.mark_type, mark.ref_to_play_item_id, mark.mark_timestamp, mark.entry_espid,
+                mark.duration
+            )
+
+        self.playlists.append(
+            playlist_id, self._discs.encode(disc), self._names.encode(name),
+            playlist.nb_play_items or 0, playlist.nb_sub_paths or 0, playlist_mark.nb_playlist_marks or 0, duration
+        )
+        return playlist_id
+
+    def append_disc(self, disc: str, playlists: Mapping[str, Any]) -> None:
+        """Appends the playlists of a disc, such as the result of `scan_playlists`"""
+        for name, mpls in playlists.items():
+            self.append_playlist(disc, name, mpls)
+
+    def append_library(self, discs: Iterable[Any]) -> None:
+        """Appends every DiscIndex yielded by `index_library`"""
+        for disc in discs:
+            self.append_disc(disc.bdmv, disc.playlists)
+
+    def _append_streams(self, playlist_id: int, play_item_id: int, stn_table: Any) -> None:
+        if stn_table.length == 0:
+            return
+        for kind, attribute in enumerate(STREAM_KINDS):
+            stream_entries = getattr(stn_table, f'{attribute}_stream_entries')
+            for stream_id, (stream_entry, stream_attributes) in enumerate(stream_entries):
+                pid = getattr(stream_entry, 'ref_to_stream_pid', None)
+                language = getattr(stream_attributes, 'language_code', None)
+                if isinstance(language, bytes):
+                    language = language.decode('latin-1')
+                self.streams.append(
+                    playlist_id, play_item_id, kind, stream_id,
+                    getattr(stream_entry, 'stream_type', None) or 0, int(pid, 16) if pid else 0,
+                    *(getattr(stream_attributes, name, None) or 0 for name in _STREAM_ATTRIBUTES),
+                    self._languages.encode(language)
+                )
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+            Returns the 'playlists', 'play_items', 'marks' and 'streams' tables
+            as NumPy structured arrays. Requires numpy.
+        """
+        import numpy as np
+
+        tables = {}
+        for name, table in self._tables():
+            array_ = np.empty(len(table), dtype=[(column, dtype) for column, dtype, _ in table.columns])
+            if len(table):
+                for column, dtype, _ in table.columns:
+                    array_[column] = np.frombuffer(table.data[column], dtype=dtype)
+            tables[name] = array_
+        return tables
+
+    def to_arrow(self) -> Dict[str, Any]:
+        """
+            Returns the 'playlists', 'play_items', 'marks' and 'streams' tables as pyarrow Tables,
+            with the dictionary-encoded columns as dictionary arrays. Requires pyarrow.
+        """
+        import pyarrow as pa
+
+        dictionaries = {
+            ('playlists', 'disc'): self.discs, ('playlists', 'name'): self.names,
+            ('play_items', 'clip'): self.clips, ('streams', 'language'): self.languages,
+        }
+        tables = {}
+        for name, table in self._tables():
+            arrays = {}
+            for column, dtype, _ in table.columns:
+                type_ = getattr(pa, f'uint{int(dtype[1]) * 8}')()
+                values = pa.Array.from_buffers(type_, len(table), [None, pa.py_buffer(table.data[column].tobytes())])
+                dictionary = dictionaries.get((name, column))
+                if dictionary is not None:
+                    values = pa.DictionaryArray.from_arrays(values.cast(pa.int32()), pa.array(dictionary, pa.string()))
+                arrays[column] = values
+            tables[name] = pa.table(arrays)
+        return tables
+
+    def _tables(self) -> Iterable[Tuple[str, _Table]]:
+        return (('playlists', self.playlists), ('play_items', self.play_items),
+                ('marks', self.marks), ('streams', self.streams))
@@ -0,0 +1,171 @@
+"""Fingerprints of playlists to find duplicates across a disc or a library"""
+
+__all__ = ['PlaylistFingerprint', 'fingerprint_playlist', 'fingerprint_mpls', 'fingerprint_mpls_file',
+           'scan_fingerprints', 'group_playlists']
+
+import hashlib
+import os
+from struct import Struct
+from typing import Any, Dict, Hashable, List, Mapping, NamedTuple, Tuple, TypeVar, Union
+
+from .mpls.load import list_playlists
+from .mpls.movie_playlist import UINT16, UINT32, Buffer
+
+_PLAYLIST = Struct('>4x2xH2x')
+_PLAY_ITEM = Struct('>5s4xHxII12x')
+_STN_TABLE = Struct('>2x2x8s4x')
+
+K = TypeVar('K', bound=Hashable)
+
+
+class PlaylistFingerprint(NamedTuple):
+    """
+        Fingerprint of the play items of a playlist.
+        `key` holds the clip information filenames and angle clips of every play item
+        and, if requested, its STN layout, ie. its number of streams of each kind and their coding types.
+        `times` holds the intime and outtime of every play item.
+        Two playlists are identical if their `digest` are equal.
+    """
+    digest: bytes
+    key: bytes
+    times: Tuple[int, ...]                                                      # 45 kHz
+
+
+def _make(key: bytearray, times: List[int]) -> PlaylistFingerprint:
+    digest = hashlib.blake2b(key, digest_size=16)
+    digest.update(Struct(f'>{len(times)}I').pack(*times))
+    return PlaylistFingerprint(digest.digest(), bytes(key), tuple(times))
+
+
+def fingerprint_playlist(playlist: Any, stn: bool = False) -> PlaylistFingerprint:
+    """
+        Fingerprints a loaded, lazy or frozen Playlist from its `play_items`.
+        The STNTable of the play items is only read if `stn` is True.
+    """
+    key = bytearray()
+    times: List[int] = []
+    for play_item in playlist.play_items or ():
+        key += play_item.clip_information_filename.encode('utf-8')
+        times += (play_item.intime, play_item.outtime)
+        angles = play_item.angles if play_item.is_multi_angle else ()
+        key.append(len(angles))
+        for angle in angles:
+            key += angle.clip_information_filename.encode('utf-8')
+        if stn:
+            stn_table = play_item.stn_table
+            if stn_table.length == 0:
+                key += bytes(8)
+                continue
+            key += bytes((
+                stn_table.nb_prim_video_stream_entries, stn_table.nb_prim_audio_stream_entries,
+                stn_table.nb_prim_pgs_stream_entries, stn_table.nb_prim_igs_stream_entries,
+                stn_table.nb_seco_audio_stream_entries, stn_table.nb_seco_video_stream_entries,
+                stn_table.nb_seco_pgs_stream_entries, stn_table.nb_dv_stream_entries
+            ))
+            for stream_entries in (
+                stn_table.prim_video_stream_entries, stn_table.prim_audio_stream_entries,
+                stn_table.prim_pgs_stream_entries, stn_table.seco_pgs_stream_entries,
+                stn_table.prim_igs_stream_entries, stn_table.seco_audio_stream_entries,
+                stn_table.seco_video_stream_entries, stn_table.dv_stream_entries
+            ):
+                key += bytes(
+                    stream_attributes.stream_coding_type if stream_attributes.length != 0 else 0
+                    for _, stream_attributes in stream_entries
+                )
+    return _make(key, times)
+
+
+def fingerprint_mpls(data: Buffer, stn: bool = False) -> PlaylistFingerprint:
+    """
+        Fingerprints an in-memory MPLS file without decoding it.
+        Only the play items are walked: StreamAttributes and strings are never decoded,
+        and STN tables are jumped over unless `stn` is True.
+        The result is the same as `fingerprint_playlist` on the decoded Playlist.
+    """
+    offset, = UINT32.unpack_from(data, 8)                                       # playlist_start_address
+    if UINT32.unpack_from(data, offset)[0] == 0:
+        return _make(bytearray(), [])
+    nb_play_items, = _PLAYLIST.unpack_from(data, offset)
+    offset += _PLAYLIST.size
+
+    key = bytearray()
+    times: List[int] = []
+    for _ in range(nb_play_items):
+        length, = UINT16.unpack_from(data, offset)
+        end = offset + 2 + length
+
+        clip_information_filename, misc_flags_1, intime, outtime = _PLAY_ITEM.unpack_from(data, offset + 2)
+        offset += 2 + _PLAY_ITEM.size
+        key += clip_information_filename
+        times += (intime, outtime)
+
+        if misc_flags_1 & (1 << 16 - 1 - 11):                                   # is_multi_angle
+            nb_angles = data[offset]
+            offset += 2
+            key.append(nb_angles)
+            for _ in range(nb_angles):
+                key += data[offset:offset + 5]
+                offset += 10
+        else:
+            key.append(0)
+
+        if stn:
+            if UINT16.unpack_from(data, offset)[0] == 0:
+                key += bytes(8)
+            else:
+                nbs, = _STN_TABLE.unpack_from(data, offset)
+                offset += _STN_TABLE.size
+                key += nbs
+                for _ in range(sum(nbs)):
+                    offset += data[offset] + 1                                  # StreamEntry
+                    key.append(data[offset + 1] if data[offset] != 0 else 0)    # stream_coding_type
+                    offset += data[offset] + 1                                  # StreamAttributes
+
+        offset = end
+
+    return _make(key, times)
+
+
+def fingerprint_mpls_file(path: Union[str, os.PathLike], stn: bool = False) -> PlaylistFingerprint:
+    """Reads a MPLS file in one call and fingerprints it"""
+    with open(path, 'rb') as mpls:
+        return fingerprint_mpls(mpls.read(), stn)
+
+
+def scan_fingerprints(bdmv: Union[str, os.PathLike], stn: bool = False) -> Dict[str, PlaylistFingerprint]:
+    """Fingerprints every playlist of a BDMV folder, keyed by file name"""
+    return {path.name: fingerprint_mpls_file(path, stn) for path in list_playlists(bdmv)}
+
+
+def group_playlists(fingerprints: Mapping[K, PlaylistFingerprint], tolerance: int = 0) -> List[List[K]]:
+    """
+        Groups the playlists having the same fingerprint.
+        If `tolerance` is not 0, playlists having the same key and
+        whose intimes and outtimes differ by at most `tolerance` ticks (45 kHz) are grouped too.
+        Keys may be file names or, across a library, (bdmv, file name) tuples.
+        Groups follow the order of `fingerprints`, singletons included.
+    """
+    identical: Dict[bytes, List[K]] = {}
+    representatives: Dict[bytes, PlaylistFingerprint] = {}
+    for name, fingerprint in fingerprints.items():
+        identical.setdefault(fingerprint.digest, []).append(name)
+        representatives.setdefault(fingerprint.digest, fingerprint)
+
+    if tolerance == 0:
+        return list(identical.values())
+
+    groups: List[List[K]] = []
+    clusters: Dict[bytes, List[Tuple[PlaylistFingerprint, List[K]]]] = {}
+    for digest, names in identical.items():
+        fingerprint = representatives[digest]
+        candidates = clusters.setdefault(fingerprint.key, [])
+        for representative, group in candidates:
+            if len(representative.times) == len(fingerprint.times) and all(
+                abs(a - b) <= tolerance for a, b in zip(representative.times, fingerprint.times)
+            ):
+                group += names
+                break
+        else:
+            candidates.append((fingerprint, names))
+            groups.append(names)
+    return groups
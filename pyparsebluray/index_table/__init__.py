@@ -1 +1,15 @@
-# TODO:
+"""index.bdmv or index table listing the titles of a disc and their movie objects."""
+# flake8: noqa
+from .app_info_bdmv import *
+from .index import *
+from .indexes import *
+
+from .load import *
+from .title_table import *
+
+__all__ = ['Index', 'AppInfoBDMV', 'Indexes', 'IndexObject']
+__all__ += ['FrozenIndex', 'FrozenAppInfoBDMV', 'FrozenIndexes']
+__all__ += ['load_index', 'load_app_info_bdmv', 'load_indexes', 'load_extention_data']
+__all__ += ['IndexFile', 'FrozenIndexFile', 'load_index_bdmv', 'loads_index_bdmv', 'load_index_bdmv_file']
+__all__ += ['Title', 'TitleTable', 'resolve_titles', 'load_title_table']
+__all__ += ['OBJECT_TYPE', 'ACCESS_TYPE', 'HDMV_PLAYBACK_TYPE', 'BDJ_PLAYBACK_TYPE']
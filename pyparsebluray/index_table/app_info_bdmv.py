@@ -0,0 +1,67 @@
+"""https://github.com/lw/BluRay/wiki/AppInfoBDMV"""
+
+__all__ = ['AppInfoBDMV', 'FrozenAppInfoBDMV']
+
+
+from struct import Struct
+from typing import NamedTuple, Optional
+
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject
+
+_APP_INFO_BDMV = Struct('>BB32s')
+
+
+class FrozenAppInfoBDMV(NamedTuple):
+    """Frozen AppInfoBDMV"""
+    length: int
+    misc_flags_1: Optional[int]
+    initial_output_mode_preference: Optional[int]
+    content_exist_flag: Optional[bool]
+    initial_dynamic_range_type: Optional[int]
+    video_format: Optional[int]
+    framerate: Optional[int]
+    user_data: Optional[bytes]
+
+
+class AppInfoBDMV(MplsObject):
+    """https://github.com/lw/BluRay/wiki/AppInfoBDMV"""
+    length: int
+    misc_flags_1: Optional[int]
+    initial_output_mode_preference: Optional[int]
+    content_exist_flag: Optional[bool]
+    initial_dynamic_range_type: Optional[int]
+    video_format: Optional[int]
+    framerate: Optional[int]
+    user_data: Optional[bytes]
+
+    _frozen = FrozenAppInfoBDMV
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            # 1 byte - 8 bits
+            # 1 byte - 8 bits
+            # 32 bytes - 256 bits
+            misc_flags_1, video_format_and_framerate, user_data = _APP_INFO_BDMV.unpack_from(data, offset + 4)
+
+            self.misc_flags_1 = misc_flags_1
+            self.initial_output_mode_preference = (misc_flags_1 >> 6) & 0x01
+            self.content_exist_flag = bool(misc_flags_1 & 0x20)
+            self.initial_dynamic_range_type = misc_flags_1 & 0x0F
+
+            self.video_format = video_format_and_framerate >> 4
+            self.framerate = video_format_and_framerate & 0x0F
+
+            self.user_data = user_data
+
+        return self
@@ -0,0 +1,48 @@
+"""https://github.com/lw/BluRay/wiki/index.bdmv"""
+
+__all__ = ['Index', 'FrozenIndex']
+
+
+from struct import Struct
+from typing import NamedTuple
+
+from ..mpls.movie_playlist import Buffer, MplsObject
+
+_INDEX = Struct('>4s4sII')
+
+
+class FrozenIndex(NamedTuple):
+    """Frozen Index"""
+    type_indicator: str
+    version_number: str
+    indexes_start_address: int
+    extension_data_start_address: int
+
+
+class Index(MplsObject):
+    """https://github.com/lw/BluRay/wiki/index.bdmv"""
+    type_indicator: str
+    version_number: str
+    indexes_start_address: int
+    extension_data_start_address: int
+
+    _frozen = FrozenIndex
+
+    def load(self):
+        pos = self._get_pos()
+
+        if pos != 0:
+            raise Exception('Index: You should called it at the start of the index.bdmv file!')
+
+        return self.load_from(self.mpls.read(_INDEX.size + 24))                 # 24 bytes - 192 bits - Reserved
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        type_indicator, version_number, indexes_start_address, \
+            extension_data_start_address = _INDEX.unpack_from(data, offset)
+
+        self.type_indicator = type_indicator.decode('utf-8')                    # 4 bytes - 32 bits
+        self.version_number = version_number.decode('utf-8')                    # 4 bytes - 32 bits
+        self.indexes_start_address = indexes_start_address                      # 4 bytes - 32 bits
+        self.extension_data_start_address = extension_data_start_address        # 4 bytes - 32 bits
+
+        return self
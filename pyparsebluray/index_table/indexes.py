@@ -0,0 +1,127 @@
+"""https://github.com/lw/BluRay/wiki/Indexes"""
+
+__all__ = ['Indexes', 'FrozenIndexes', 'IndexObject',
+           'OBJECT_TYPE', 'ACCESS_TYPE', 'HDMV_PLAYBACK_TYPE', 'BDJ_PLAYBACK_TYPE']
+
+
+from struct import Struct
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..mpls.diagnostics import cap_count, section_end
+from ..mpls.movie_playlist import UINT16, UINT32, Buffer, MplsObject, iter_unpack_from
+
+# 4 bytes - 32 bits
+# 1 byte - 8 bits
+# 7 bytes - 56 bits
+_INDEX_OBJECT = Struct('>IB7s')
+_HDMV_OBJECT = Struct('>xH4x')
+_BDJ_OBJECT = Struct('>x5sx')
+
+
+class IndexObject(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/Indexes"""
+    object_type: int
+    access_type: Optional[int]
+    playback_type: int
+    id_ref: Optional[int]
+    bdjo_filename: Optional[str]
+
+
+def _load_index_objects(records: Iterable[Tuple[int, int, bytes]], titles: bool) -> List[IndexObject]:
+    objects = []
+    for flags, playback_type, payload in records:
+        object_type = flags >> 30
+        access_type = (flags >> 28) & 0x03 if titles else None
+        playback_type >>= 6
+        if object_type == 0x01:
+            id_ref, = _HDMV_OBJECT.unpack(payload)
+            objects.append(IndexObject(object_type, access_type, playback_type, id_ref, None))
+        elif object_type == 0x02:
+            bdjo_filename, = _BDJ_OBJECT.unpack(payload)
+            objects.append(IndexObject(object_type, access_type, playback_type, None, bdjo_filename.decode('utf-8')))
+        else:
+            objects.append(IndexObject(object_type, access_type, playback_type, None, None))
+    return objects
+
+
+class FrozenIndexes(NamedTuple):
+    """Frozen Indexes"""
+    length: int
+    first_playback: Optional[IndexObject]
+    top_menu: Optional[IndexObject]
+    nb_titles: Optional[int]
+    titles: Optional[Tuple[IndexObject, ...]]
+
+
+class Indexes(MplsObject):
+    """https://github.com/lw/BluRay/wiki/Indexes"""
+    length: int
+    first_playback: Optional[IndexObject]
+    top_menu: Optional[IndexObject]
+    nb_titles: Optional[int]
+    titles: Optional[List[IndexObject]]
+
+    _frozen = FrozenIndexes
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            end = section_end(data, offset, self.length + 4)
+
+            # 2 x 12 bytes:
+            # 2 bits - object_type
+            # 30 bits - Reserved
+            # 2 bits - playback_type
+            # 62 bits - HDMV or BD-J object
+            self.first_playback, self.top_menu = _load_index_objects(
+                iter_unpack_from(_INDEX_OBJECT, data, offset + 4, 2), titles=False
+            )
+            offset += 4 + 2 * _INDEX_OBJECT.size
+
+            self.nb_titles, = UINT16.unpack_from(data, offset)                  # 2 bytes - 16 bits
+            offset += 2
+
+            # nb_titles x 12 bytes:
+            # 2 bits - object_type
+            # 2 bits - access_type
+            # 28 bits - Reserved
+            # 2 bits - playback_type
+            # 62 bits - HDMV or BD-J object
+            nb_titles = cap_count(self, 'nb_titles', self.nb_titles, offset, end, _INDEX_OBJECT.size)
+            self.titles = _load_index_objects(
+                iter_unpack_from(_INDEX_OBJECT, data, offset, nb_titles), titles=True
+            )
+
+        return self
+
+
+OBJECT_TYPE: Dict[int, str] = {
+    0x01: 'HDMV',
+    0x02: 'BD-J',
+}
+
+ACCESS_TYPE: Dict[int, str] = {
+    0x00: 'Title Search and Title Number display permitted',
+    0x01: 'Title Search prohibited, Title Number display permitted',
+    0x03: 'Title Search and Title Number display prohibited',
+}
+
+HDMV_PLAYBACK_TYPE: Dict[int, str] = {
+    0x00: 'Movie Title',
+    0x01: 'Interactive Title',
+}
+
+BDJ_PLAYBACK_TYPE: Dict[int, str] = {
+    0x02: 'Movie Title',
+    0x03: 'Interactive Title',
+}
@@ -0,0 +1,78 @@
+"""Convenience functions"""
+
+__all__ = ['load_index', 'load_app_info_bdmv', 'load_indexes', 'load_extention_data',
+           'IndexFile', 'FrozenIndexFile', 'load_index_bdmv', 'loads_index_bdmv', 'load_index_bdmv_file']
+
+import os
+from io import BufferedReader
+from typing import NamedTuple, Optional, Union
+
+from ..mpls.diagnostics import load_section
+from ..mpls.extension_data import ExtensionData, FrozenExtensionData
+from ..mpls.load import load_extention_data
+from ..mpls.movie_playlist import Buffer
+from .app_info_bdmv import AppInfoBDMV, FrozenAppInfoBDMV
+from .index import FrozenIndex, Index
+from .indexes import FrozenIndexes, Indexes
+
+
+def load_index(index: BufferedReader) -> Index:
+    """Loads and returns a Index object"""
+    return Index(index).load()
+
+
+def load_app_info_bdmv(index: BufferedReader) -> AppInfoBDMV:
+    """Loads and returns a AppInfoBDMV object"""
+    return AppInfoBDMV(index).load()
+
+
+def load_indexes(index: BufferedReader) -> Indexes:
+    """Loads and returns a Indexes object"""
+    return Indexes(index).load()
+
+
+class FrozenIndexFile(NamedTuple):
+    """Every frozen section of a index.bdmv file"""
+    index: FrozenIndex
+    app_info_bdmv: FrozenAppInfoBDMV
+    indexes: FrozenIndexes
+    extension_data: Optional[FrozenExtensionData]
+
+
+class IndexFile(NamedTuple):
+    """Every section of a index.bdmv file"""
+    index: Index
+    app_info_bdmv: AppInfoBDMV
+    indexes: Indexes
+    extension_data: Optional[ExtensionData]
+
+    def freeze(self) -> FrozenIndexFile:
+        """Returns the frozen counterpart of every section"""
+        return FrozenIndexFile._make(None if section is None else section.freeze() for section in self)
+
+
+def load_index_bdmv(index: BufferedReader) -> IndexFile:
+    """Reads the whole index.bdmv file in one call and returns all of its sections"""
+    index.seek(0, os.SEEK_SET)
+    return _load_sections(index.read(), index)
+
+
+def loads_index_bdmv(data: Buffer) -> IndexFile:
+    """Loads and returns all the sections of an in-memory index.bdmv file"""
+    return _load_sections(data, None)
+
+
+def load_index_bdmv_file(path: Union[str, os.PathLike]) -> IndexFile:
+    """Reads a index.bdmv file in one call and returns all of its sections"""
+    with open(path, 'rb') as index:
+        return _load_sections(index.read(), None)
+
+
+def _load_sections(data: Buffer, index: Optional[BufferedReader]) -> IndexFile:
+    header = load_section(Index(index), data, 0, required=True)
+    app_info = load_section(AppInfoBDMV(index), data, 40)
+    indexes = load_section(Indexes(index), data, header.indexes_start_address)
+    extension = None
+    if header.extension_data_start_address != 0:
+        extension = load_section(ExtensionData(index), data, header.extension_data_start_address)
+    return IndexFile(header, app_info, indexes, extension)
@@ -0,0 +1,85 @@
+"""Resolution of the titles of a disc to their movie objects and playlists"""
+
+__all__ = ['Title', 'TitleTable', 'resolve_titles', 'load_title_table']
+
+import os
+from functools import lru_cache
+from typing import Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from ..movie_object import load_movie_object_file, movie_object_playlists
+from .indexes import IndexObject
+from .load import IndexFile, load_index_bdmv_file
+
+FIRST_PLAYBACK = 0xFFFF
+TOP_MENU = 0x0000
+
+
+class Title(NamedTuple):
+    """Title of a disc resolved to its movie object and the playlists it plays"""
+    title_number: int
+    object_type: int
+    access_type: Optional[int]
+    playback_type: int
+    movie_object_id: Optional[int]
+    bdjo_filename: Optional[str]
+    playlists: Tuple[int, ...]
+
+
+class TitleTable(NamedTuple):
+    """First Playback, Top Menu and titles of a disc"""
+    first_playback: Title
+    top_menu: Title
+    titles: Tuple[Title, ...]
+
+
+def _resolve_title(title_number: int, index_object: IndexObject,
+                   movie_object_playlists: Mapping[int, Sequence[int]]) -> Title:
+    playlists: Tuple[int, ...] = ()
+    if index_object.id_ref is not None:
+        playlists = tuple(movie_object_playlists.get(index_object.id_ref, ()))
+    return Title(title_number, index_object.object_type, index_object.access_type, index_object.playback_type,
+                 index_object.id_ref, index_object.bdjo_filename, playlists)
+
+
+def resolve_titles(index: IndexFile, movie_object_playlists: Optional[Mapping[int, Sequence[int]]] = None) -> TitleTable:
+    """
+        Resolves every title of a index.bdmv to its movie object.
+        `movie_object_playlists` maps movie object ids to the playlist numbers they reference;
+        BD-J titles can't be resolved statically and always have no playlist.
+    """
+    movie_object_playlists = movie_object_playlists or {}
+    indexes = index.indexes
+    return TitleTable(
+        _resolve_title(FIRST_PLAYBACK, indexes.first_playback, movie_object_playlists),
+        _resolve_title(TOP_MENU, indexes.top_menu, movie_object_playlists),
+        tuple(
+            _resolve_title(title_number, title, movie_object_playlists)
+            for title_number, title in enumerate(indexes.titles or (), 1)
+        )
+    )
+
+
+def load_title_table(bdmv: Union[str, os.PathLike]) -> TitleTable:
+    """
+        Parses the index.bdmv and MovieObject.bdmv of a BDMV folder and returns its title table.
+        Titles get the playlists their movie object references if MovieObject.bdmv exists.
+        The result is cached until one of the files changes.
+    """
+    path = os.path.abspath(os.path.join(bdmv, 'index.bdmv'))
+    st = os.stat(path)
+    movie_object_path = os.path.abspath(os.path.join(bdmv, 'MovieObject.bdmv'))
+    try:
+        movie_object_st = os.stat(movie_object_path)
+    except FileNotFoundError:
+        return _load_title_table(path, st.st_size, st.st_mtime_ns, None, 0, 0)
+    return _load_title_table(path, st.st_size, st.st_mtime_ns,
+                             movie_object_path, movie_object_st.st_size, movie_object_st.st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _load_title_table(path: str, size: int, mtime_ns: int,
+                      movie_object_path: Optional[str], movie_object_size: int, movie_object_mtime_ns: int) -> TitleTable:
+    playlists = None
+    if movie_object_path is not None:
+        playlists = movie_object_playlists(load_movie_object_file(movie_object_path).movie_objects)
+    return resolve_titles(load_index_bdmv_file(path), playlists)
@@ -0,0 +1,260 @@
+"""Opt-in per-structure parse instrumentation"""
+
+__all__ = ['ParseStats', 'StructureStats', 'instrument']
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from .clpi.clip_info import ClipInfo
+from .clpi.clip_information import ClipInformation
+from .clpi.clip_mark import ClipMark
+from .clpi.cpi import CPI
+from .clpi.program_info import ProgramInfo, StreamCodingInfo
+from .clpi.sequence_info import SequenceInfo
+from .index_table.app_info_bdmv import AppInfoBDMV
+from .index_table.index import Index
+from .index_table.indexes import Indexes
+from .movie_object.movie_object_bdmv import MovieObjectBDMV
+from .movie_object.movie_objects import MovieObjects
+from .mpls.app_info_playlist import AppInfoPlaylist
+from .mpls.extension_data import ExtensionData
+from .mpls.movie_playlist import MoviePlaylist, MplsObject
+from .mpls.play_item import PlayItem, StreamAttributes, StreamEntry, STNTable
+from .mpls.playlist import Playlist
+from .mpls.playlist_mark import PlaylistMarks
+from .mpls.sub_path import SubPath, SubPlayItem
+
+# Size of the length field preceding each section, counted in the bytes it consumes
+_LENGTH_SIZES: Dict[Type[MplsObject], int] = {
+    StreamEntry: 1, StreamAttributes: 1, StreamCodingInfo: 1,
+    STNTable: 2, PlayItem: 2, SubPlayItem: 2,
+    AppInfoPlaylist: 4, Playlist: 4, SubPath: 4, PlaylistMarks: 4, ExtensionData: 4,
+    ClipInfo: 4, SequenceInfo: 4, ProgramInfo: 4, CPI: 4, ClipMark: 4,
+    AppInfoBDMV: 4, Indexes: 4, MovieObjects: 4,
+}
+# Fixed-size file headers
+_HEADER_SIZES: Dict[Type[MplsObject], int] = {
+    MoviePlaylist: 40, ClipInformation: 40, Index: 40, MovieObjectBDMV: 40,
+}
+
+
+class StructureStats:
+    """Counters of a structure type"""
+    __slots__ = ('calls', 'bytes', 'reads', 'seeks', 'time')
+    calls: int
+    bytes: int
+    reads: int
+    seeks: int
+    time: float
+
+    def __init__(self) -> None:
+        self.calls = self.bytes = self.reads = self.seeks = 0
+        self.time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the counters as a dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ParseStats:
+    """
+        Counters collected by `instrument`, per structure type name:
+        number of structures decoded, bytes they span (length field included),
+        read and seek calls issued on the reader and cumulative time in seconds.
+        Time is inclusive: a PlayItem includes its STNTable.
+    """
+    structures: Dict[str, StructureStats]
+
+    def __init__(self) -> None:
+        self.structures = {}
+
+    def __getitem__(self, name: str) -> StructureStats:
+        stats = self.structures.get(name)
+        if stats is None:
+            stats = self.structures[name] = StructureStats()
+        return stats
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the counters of every structure type as nested dicts"""
+        return {name: stats.as_dict() for name, stats in self.structures.items()}
+
+
+class _Collector:
+    """Counters of an instrument block and the structures being timed in it"""
+    __slots__ = ('stats', 'active', 'lock')
+
+    def __init__(self, stats: ParseStats) -> None:
+        self.stats = stats
+        self.active: Set[int] = set()
+        # The block's context may be copied to other threads, eg. by load_mpls_at with an executor
+        self.lock = threading.Lock()
+
+
+# Collector of the instrument block the current context runs in
+_COLLECTOR: ContextVar[Optional[_Collector]] = ContextVar('instrument', default=None)
+
+
+class _CountingReader:
+    """Reader proxy counting the read and seek calls of the structure being loaded"""
+
+    def __init__(self, reader: Any, stats: StructureStats, lock: threading.Lock) -> None:
+        self._reader = reader
+        self._stats = stats
+        self._lock = lock
+
+    def read(self, *args: Any) -> bytes:
+        with self._lock:
+            self._stats.reads += 1
+        return self._reader.read(*args)
+
+    def readinto(self, *args: Any) -> int:
+        with self._lock:
+            self._stats.reads += 1
+        return self._reader.readinto(*args)
+
+    def seek(self, *args: Any) -> int:
+        with self._lock:
+            self._stats.seeks += 1
+        return self._reader.seek(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._reader, name)
+
+
+def _section_size(obj: MplsObject) -> int:
+    for cls in type(obj).__mro__:
+        if cls in _HEADER_SIZES:
+            return _HEADER_SIZES[cls]
+        if cls in _LENGTH_SIZES:
+            return getattr(obj, 'length', 0) + _LENGTH_SIZES[cls]
+    return 0
+
+
+def _restore_reader(value: Any, proxy: _CountingReader, seen: Set[int]) -> None:
+    """Gives back the real reader to the structures created while `proxy` was in place"""
+    if isinstance(value, MplsObject):
+        if id(value) in seen:
+            return
+        seen.add(id(value))
+        if value.mpls is proxy:
+            value.mpls = proxy._reader
+        for child in vars(value).values():
+            _restore_reader(child, proxy, seen)
+    elif isinstance(value, (list, tuple)):
+        for child in value:
+            _restore_reader(child, proxy, seen)
+
+
+def _instrument_load(load: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(load)
+    def instrumented_load(self: MplsObject) -> Any:
+        collector = _COLLECTOR.get()
+        reader = self.mpls
+        if collector is None or id(self) in collector.active or reader is None \
+                or isinstance(reader, _CountingReader):
+            return load(self)
+        with collector.lock:
+            structure = collector.stats[type(self).__name__]
+        proxy = self.mpls = _CountingReader(reader, structure, collector.lock)
+        collector.active.add(id(self))
+        start = time.perf_counter()
+        try:
+            return load(self)
+        finally:
+            elapsed = time.perf_counter() - start
+            with collector.lock:
+                structure.time += elapsed
+            collector.active.discard(id(self))
+            _restore_reader(self, proxy, set())
+    return instrumented_load
+
+
+def _instrument_load_from(load_from: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(load_from)
+    def instrumented_load_from(self: MplsObject, data: Any, offset: int = 0) -> Any:
+        collector = _COLLECTOR.get()
+        if collector is None:
+            return load_from(self, data, offset)
+        if id(self) in collector.active:
+            # Called by the load of the same structure, which is already timed
+            result = load_from(self, data, offset)
+        else:
+            collector.active.add(id(self))
+            start = time.perf_counter()
+            try:
+                result = load_from(self, data, offset)
+            finally:
+                elapsed = time.perf_counter() - start
+                collector.active.discard(id(self))
+                with collector.lock:
+                    collector.stats[type(self).__name__].time += elapsed
+        with collector.lock:
+            structure = collector.stats[type(self).__name__]
+            structure.calls += 1
+            structure.bytes += _section_size(self)
+        return result
+    return instrumented_load_from
+
+
+def _subclasses(cls: Type[MplsObject]) -> Iterator[Type[MplsObject]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+# The wrapped methods stay in place while any block runs, in any thread
+_PATCH_LOCK = threading.Lock()
+_originals: List[Tuple[Type[MplsObject], str, Callable[..., Any]]] = []
+_blocks = 0
+
+
+def _patch() -> None:
+    global _blocks
+    with _PATCH_LOCK:
+        if _blocks == 0:
+            for cls in set(_subclasses(MplsObject)):
+                for name, wrapper in (('load', _instrument_load), ('load_from', _instrument_load_from)):
+                    method = cls.__dict__.get(name)
+                    if method is not None and not getattr(method, '__isabstractmethod__', False):
+                        _originals.append((cls, name, method))
+                        setattr(cls, name, wrapper(method))
+        _blocks += 1
+
+
+def _unpatch() -> None:
+    global _blocks
+    with _PATCH_LOCK:
+        _blocks -= 1
+        if _blocks == 0:
+            for cls, name, method in _originals:
+                setattr(cls, name, method)
+            _originals.clear()
+
+
+@contextmanager
+def instrument(stats: Optional[ParseStats] = None) -> Iterator[ParseStats]:
+    """
+        Collects per-structure counters on every MplsObject loaded inside the block.
+
+        Only the structures loaded in the context of the block are counted: its thread and the tasks
+        run in a copy of its context, as `load_mpls_at` does with an executor. Blocks can run
+        concurrently in several threads but can't be nested.
+        The `load` and `load_from` methods are only wrapped while a block runs,
+        so instrumentation costs nothing once they are all over.
+        Counters add up in `stats` if given, so it can be reused across blocks.
+    """
+    if _COLLECTOR.get() is not None:
+        raise RuntimeError('instrument: instrumentation is already enabled in this context')
+    stats = stats if stats is not None else ParseStats()
+
+    _patch()
+    token = _COLLECTOR.set(_Collector(stats))
+    try:
+        yield stats
+    finally:
+        _COLLECTOR.reset(token)
+        _unpatch()
@@ -0,0 +1,60 @@
+"""Library-wide indexing of BDMV folders across a process pool"""
+
+__all__ = ['DiscIndex', 'index_library']
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .clpi import ClpiFile, FrozenClpiFile, scan_clips
+from .mpls import Diagnostic, FrozenMplsFile, MplsFile, parse_mode, scan_playlists
+
+
+class DiscIndex(NamedTuple):
+    """
+        Parsed structures of a single BDMV folder.
+        `diagnostics` are the anomalies met in tolerant mode and `error` describes the error
+        that stopped the parsing of the disc, its playlists and clips being then empty.
+    """
+    bdmv: str
+    playlists: Dict[str, Union[MplsFile, FrozenMplsFile]]
+    clips: Dict[str, Union[ClpiFile, FrozenClpiFile]]
+    diagnostics: Tuple[Diagnostic, ...] = ()
+    error: Optional[str] = None
+
+
+def _index_disc(bdmv: str, frozen: bool, clips: bool, strict: Optional[bool]) -> DiscIndex:
+    diagnostics: List[Diagnostic] = []
+    try:
+        with nullcontext(diagnostics) if strict is None else parse_mode(strict) as diagnostics:
+            playlists = scan_playlists(bdmv)
+            clpis = scan_clips(bdmv) if clips else {}
+            if frozen:
+                return DiscIndex(
+                    bdmv,
+                    {name: mpls.freeze() for name, mpls in playlists.items()},
+                    {name: clpi.freeze() for name, clpi in clpis.items()},
+                    tuple(diagnostics)
+                )
+            return DiscIndex(bdmv, dict(playlists), dict(clpis), tuple(diagnostics))
+    except Exception as error:  # pylint: disable=broad-except
+        return DiscIndex(bdmv, {}, {}, tuple(diagnostics), f'{type(error).__name__}: {error}')
+
+
+def index_library(bdmvs: Iterable[Union[str, os.PathLike]],
+                  max_workers: Optional[int] = None, chunksize: int = 4,
+                  frozen: bool = True, clips: bool = True, strict: Optional[bool] = None) -> Iterator[DiscIndex]:
+    """
+        Parses the playlists and, if `clips` is True, the clip information files
+        of every BDMV folder in a process pool.
+        Discs are sent to the workers `chunksize` at a time and
+        the results are yielded in the same order as `bdmvs`.
+        If `frozen` is True, the workers send back compact frozen records.
+        If `strict` is given, the workers parse in `pyparsebluray.mpls.parse_mode(strict)`.
+        A disc that fails is yielded with its `error` set and doesn't stop the others.
+    """
+    with ProcessPoolExecutor(max_workers) as executor:
+        index_disc = partial(_index_disc, frozen=frozen, clips=clips, strict=strict)
+        yield from executor.map(index_disc, map(os.fspath, bdmvs), chunksize=chunksize)
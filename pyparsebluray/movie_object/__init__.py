@@ -1 +1,16 @@
-# TODO:
+"""MovieObject.bdmv holding the navigation commands of the HDMV movie objects of a disc."""
+# flake8: noqa
+from .movie_object_bdmv import *
+from .movie_objects import *
+from .navigation_command import *
+
+from .load import *
+from .playlist_index import *
+
+__all__ = ['MovieObjectBDMV', 'MovieObjects', 'MovieObject', 'NavigationCommand']
+__all__ += ['FrozenMovieObjectBDMV', 'FrozenMovieObjects']
+__all__ += ['load_movie_object_bdmv', 'load_movie_objects', 'load_extention_data']
+__all__ += ['MovieObjectFile', 'FrozenMovieObjectFile',
+            'load_movie_object', 'loads_movie_object', 'load_movie_object_file']
+__all__ += ['load_navigation_commands', 'referenced_playlists', 'movie_object_playlists']
+__all__ += ['COMMAND_GROUP', 'BRANCH_COMMAND', 'COMPARE_COMMAND', 'SET_COMMAND', 'PLAY_PL_COMMANDS']
@@ -0,0 +1,70 @@
+"""Convenience functions"""
+
+__all__ = ['load_movie_object_bdmv', 'load_movie_objects', 'load_extention_data',
+           'MovieObjectFile', 'FrozenMovieObjectFile',
+           'load_movie_object', 'loads_movie_object', 'load_movie_object_file']
+
+import os
+from io import BufferedReader
+from typing import NamedTuple, Optional, Union
+
+from ..mpls.diagnostics import load_section
+from ..mpls.extension_data import ExtensionData, FrozenExtensionData
+from ..mpls.load import load_extention_data
+from ..mpls.movie_playlist import Buffer
+from .movie_object_bdmv import FrozenMovieObjectBDMV, MovieObjectBDMV
+from .movie_objects import FrozenMovieObjects, MovieObjects
+
+
+def load_movie_object_bdmv(movie_object: BufferedReader) -> MovieObjectBDMV:
+    """Loads and returns a MovieObjectBDMV object"""
+    return MovieObjectBDMV(movie_object).load()
+
+
+def load_movie_objects(movie_object: BufferedReader) -> MovieObjects:
+    """Loads and returns a MovieObjects object"""
+    return MovieObjects(movie_object).load()
+
+
+class FrozenMovieObjectFile(NamedTuple):
+    """Every frozen section of a MovieObject.bdmv file"""
+    movie_object_bdmv: FrozenMovieObjectBDMV
+    movie_objects: FrozenMovieObjects
+    extension_data: Optional[FrozenExtensionData]
+
+
+class MovieObjectFile(NamedTuple):
+    """Every section of a MovieObject.bdmv file"""
+    movie_object_bdmv: MovieObjectBDMV
+    movie_objects: MovieObjects
+    extension_data: Optional[ExtensionData]
+
+    def freeze(self) -> FrozenMovieObjectFile:
+        """Returns the frozen counterpart of every section"""
+        return FrozenMovieObjectFile._make(None if section is None else section.freeze() for section in self)
+
+
+def load_movie_object(movie_object: BufferedReader) -> MovieObjectFile:
+    """Reads the whole MovieObject.bdmv file in one call and returns all of its sections"""
+    movie_object.seek(0, os.SEEK_SET)
+    return _load_sections(movie_object.read(), movie_object)
+
+
+def loads_movie_object(data: Buffer) -> MovieObjectFile:
+    """Loads and returns all the sections of an in-memory MovieObject.bdmv file"""
+    return _load_sections(data, None)
+
+
+def load_movie_object_file(path: Union[str, os.PathLike]) -> MovieObjectFile:
+    """Reads a MovieObject.bdmv file in one call and returns all of its sections"""
+    with open(path, 'rb') as movie_object:
+        return _load_sections(movie_object.read(), None)
+
+
+def _load_sections(data: Buffer, movie_object: Optional[BufferedReader]) -> MovieObjectFile:
+    header = load_section(MovieObjectBDMV(movie_object), data, 0, required=True)
+    movie_objects = load_section(MovieObjects(movie_object), data, 40)
+    extension = None
+    if header.extension_data_start_address != 0:
+        extension = load_section(ExtensionData(movie_object), data, header.extension_data_start_address)
+    return MovieObjectFile(header, movie_objects, extension)
@@ -0,0 +1,44 @@
+"""https://github.com/lw/BluRay/wiki/MovieObject.bdmv"""
+
+__all__ = ['MovieObjectBDMV', 'FrozenMovieObjectBDMV']
+
+
+from struct import Struct
+from typing import NamedTuple
+
+from ..mpls.movie_playlist import Buffer, MplsObject
+
+_MOVIE_OBJECT_BDMV = Struct('>4s4sI')
+
+
+class FrozenMovieObjectBDMV(NamedTuple):
+    """Frozen MovieObjectBDMV"""
+    type_indicator: str
+    version_number: str
+    extension_data_start_address: int
+
+
+class MovieObjectBDMV(MplsObject):
+    """https://github.com/lw/BluRay/wiki/MovieObject.bdmv"""
+    type_indicator: str
+    version_number: str
+    extension_data_start_address: int
+
+    _frozen = FrozenMovieObjectBDMV
+
+    def load(self):
+        pos = self._get_pos()
+
+        if pos != 0:
+            raise Exception('MovieObjectBDMV: You should called it at the start of the MovieObject.bdmv file!')
+
+        return self.load_from(self.mpls.read(_MOVIE_OBJECT_BDMV.size + 28))     # 28 bytes - 224 bits - Reserved
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        type_indicator, version_number, extension_data_start_address = _MOVIE_OBJECT_BDMV.unpack_from(data, offset)
+
+        self.type_indicator = type_indicator.decode('utf-8')                    # 4 bytes - 32 bits
+        self.version_number = version_number.decode('utf-8')                    # 4 bytes - 32 bits
+        self.extension_data_start_address = extension_data_start_address        # 4 bytes - 32 bits
+
+        return self
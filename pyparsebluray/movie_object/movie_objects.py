@@ -0,0 +1,82 @@
+"""https://github.com/lw/BluRay/wiki/MovieObjects"""
+
+__all__ = ['MovieObjects', 'FrozenMovieObjects', 'MovieObject']
+
+
+from struct import Struct
+from typing import List, NamedTuple, Optional, Tuple
+
+from ..mpls.diagnostics import cap_count, fits, section_end
+from ..mpls.movie_playlist import UINT32, Buffer, MplsObject
+from .navigation_command import NavigationCommand, load_navigation_commands
+
+_MOVIE_OBJECTS = Struct('>4xH')
+_MOVIE_OBJECT = Struct('>HH')
+
+
+class MovieObject(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/MovieObjects"""
+    resume_intention_flag: bool
+    menu_call_mask: bool
+    title_search_mask: bool
+    nb_navigation_commands: int
+    navigation_commands: List[NavigationCommand]
+
+
+class FrozenMovieObjects(NamedTuple):
+    """Frozen MovieObjects"""
+    length: int
+    nb_movie_objects: Optional[int]
+    movie_objects: Optional[Tuple[MovieObject, ...]]
+
+
+class MovieObjects(MplsObject):
+    """https://github.com/lw/BluRay/wiki/MovieObjects"""
+    length: int
+    nb_movie_objects: Optional[int]
+    movie_objects: Optional[List[MovieObject]]
+
+    _frozen = FrozenMovieObjects
+
+    def load(self):
+        pos = self._get_pos()
+
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            end = section_end(data, offset, self.length + 4)
+
+            # 4 bytes - 32 bits - Reserved
+            # 2 bytes - 16 bits
+            self.nb_movie_objects, = _MOVIE_OBJECTS.unpack_from(data, offset + 4)
+            offset += 4 + _MOVIE_OBJECTS.size
+
+            self.movie_objects = []
+            for i in range(self.nb_movie_objects):
+                if not fits(self, 'nb_movie_objects', self.nb_movie_objects, i, offset, end, _MOVIE_OBJECT.size):
+                    break
+                # 1 bit - resume_intention_flag
+                # 1 bit - menu_call_mask
+                # 1 bit - title_search_mask
+                # 13 bits - Reserved
+                # 2 bytes - 16 bits
+                flags, nb_navigation_commands = _MOVIE_OBJECT.unpack_from(data, offset)
+                offset += _MOVIE_OBJECT.size
+                # nb_navigation_commands x 12 bytes
+                nb_commands = cap_count(self, 'nb_navigation_commands', nb_navigation_commands, offset, end, 12)
+
+                self.movie_objects.append(
+                    MovieObject(bool(flags & 0x8000), bool(flags & 0x4000), bool(flags & 0x2000),
+                                nb_navigation_commands,
+                                load_navigation_commands(data, offset, nb_commands))
+                )
+                offset += nb_commands * 12
+
+        return self
@@ -0,0 +1,126 @@
+"""https://github.com/lw/BluRay/wiki/NavigationCommand"""
+
+__all__ = ['NavigationCommand', 'load_navigation_commands',
+           'COMMAND_GROUP', 'BRANCH_COMMAND', 'COMPARE_COMMAND', 'SET_COMMAND', 'PLAY_PL_COMMANDS']
+
+from struct import Struct
+from typing import Dict, List, NamedTuple, Tuple
+
+from ..mpls.movie_playlist import Buffer, iter_unpack_from
+
+# 1 byte - 8 bits - op_cnt, grp, sub_grp
+# 1 byte - 8 bits - imm_op1, imm_op2, reserved, branch_opt
+# 1 byte - 8 bits - reserved, cmp_opt
+# 1 byte - 8 bits - reserved, set_opt
+# 4 bytes - 32 bits - destination
+# 4 bytes - 32 bits - source
+_NAVIGATION_COMMAND = Struct('>BBBBII')
+
+
+class NavigationCommand(NamedTuple):
+    """https://github.com/lw/BluRay/wiki/NavigationCommand"""
+    operand_count: int
+    command_group: int
+    command_sub_group: int
+    immediate_destination: bool
+    immediate_source: bool
+    branch_option: int
+    compare_option: int
+    set_option: int
+    destination: int
+    source: int
+
+    @property
+    def option(self) -> int:
+        """Option selecting the command inside its sub group"""
+        return (self.branch_option, self.compare_option, self.set_option)[self.command_group] \
+            if self.command_group < 3 else 0
+
+    @property
+    def mnemonic(self) -> str:
+        """Name of the command, such as PLAY_PL or MOVE"""
+        return {0: BRANCH_COMMAND, 1: COMPARE_COMMAND, 2: SET_COMMAND}.get(self.command_group, {}).get(
+            (self.command_sub_group, self.option), 'UNKNOWN'
+        )
+
+
+def load_navigation_commands(data: Buffer, offset: int, count: int) -> List[NavigationCommand]:
+    """Decodes `count` navigation commands of 12 bytes in one pass"""
+    return [
+        NavigationCommand(
+            operand_and_group >> 5, (operand_and_group >> 3) & 0x03, operand_and_group & 0x07,
+            bool(flags_and_branch & 0x80), bool(flags_and_branch & 0x40), flags_and_branch & 0x0F,
+            compare & 0x0F, set_option & 0x1F, destination, source
+        )
+        for operand_and_group, flags_and_branch, compare, set_option, destination, source
+        in iter_unpack_from(_NAVIGATION_COMMAND, data, offset, count)
+    ]
+
+
+COMMAND_GROUP: Dict[int, str] = {
+    0x00: 'BRANCH',
+    0x01: 'COMPARE',
+    0x02: 'SET',
+}
+
+# (command_sub_group, branch_option)
+BRANCH_COMMAND: Dict[Tuple[int, int], str] = {
+    (0x00, 0x00): 'NOP',
+    (0x00, 0x01): 'GOTO',
+    (0x00, 0x02): 'BREAK',
+    (0x01, 0x00): 'JUMP_OBJECT',
+    (0x01, 0x01): 'JUMP_TITLE',
+    (0x01, 0x02): 'CALL_OBJECT',
+    (0x01, 0x03): 'CALL_TITLE',
+    (0x01, 0x04): 'RESUME',
+    (0x02, 0x00): 'PLAY_PL',
+    (0x02, 0x01): 'PLAY_PL_PI',
+    (0x02, 0x02): 'PLAY_PL_PM',
+    (0x02, 0x03): 'TERMINATE_PL',
+    (0x02, 0x04): 'LINK_PI',
+    (0x02, 0x05): 'LINK_MK',
+}
+
+# (command_sub_group, compare_option)
+COMPARE_COMMAND: Dict[Tuple[int, int], str] = {
+    (0x00, 0x01): 'BC',
+    (0x00, 0x02): 'EQ',
+    (0x00, 0x03): 'NE',
+    (0x00, 0x04): 'GE',
+    (0x00, 0x05): 'GT',
+    (0x00, 0x06): 'LE',
+    (0x00, 0x07): 'LT',
+}
+
+# (command_sub_group, set_option)
+SET_COMMAND: Dict[Tuple[int, int], str] = {
+    (0x00, 0x01): 'MOVE',
+    (0x00, 0x02): 'SWAP',
+    (0x00, 0x03): 'ADD',
+    (0x00, 0x04): 'SUB',
+    (0x00, 0x05): 'MUL',
+    (0x00, 0x06): 'DIV',
+    (0x00, 0x07): 'MOD',
+    (0x00, 0x08): 'RND',
+    (0x00, 0x09): 'AND',
+    (0x00, 0x0A): 'OR',
+    (0x00, 0x0B): 'XOR',
+    (0x00, 0x0C): 'BITSET',
+    (0x00, 0x0D): 'BITCLR',
+    (0x00, 0x0E): 'SHL',
+    (0x00, 0x0F): 'SHR',
+    (0x01, 0x01): 'SET_STREAM',
+    (0x01, 0x02): 'SET_NV_TIMER',
+    (0x01, 0x03): 'SET_BUTTON_PAGE',
+    (0x01, 0x04): 'ENABLE_BUTTON',
+    (0x01, 0x05): 'DISABLE_BUTTON',
+    (0x01, 0x06): 'SET_SEC_STREAM',
+    (0x01, 0x07): 'POPUP_OFF',
+    (0x01, 0x08): 'STILL_ON',
+    (0x01, 0x09): 'STILL_OFF',
+    (0x01, 0x0A): 'SET_OUTPUT_MODE',
+    (0x01, 0x0B): 'SET_STREAM_SS',
+    (0x01, 0x10): 'SETSYSTEM_0x10',
+}
+
+PLAY_PL_COMMANDS = frozenset({'PLAY_PL', 'PLAY_PL_PI', 'PLAY_PL_PM'})
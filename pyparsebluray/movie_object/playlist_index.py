@@ -0,0 +1,86 @@
+"""Static index of the playlists referenced by each movie object"""
+
+__all__ = ['referenced_playlists', 'movie_object_playlists']
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .movie_objects import MovieObject, MovieObjects
+from .navigation_command import NavigationCommand
+
+_PSR = 0x80000000
+
+# (command_group, command_sub_group, option)
+_PLAY_PL = frozenset({(0x00, 0x02, 0x00), (0x00, 0x02, 0x01), (0x00, 0x02, 0x02)})
+_JUMP_CALL_OBJECT = frozenset({(0x00, 0x01, 0x00), (0x00, 0x01, 0x02)})
+_SET = 0x02
+_MOVE = 0x01
+
+
+def _operand(value: int, immediate: bool, registers: Dict[int, int]) -> Optional[int]:
+    if immediate:
+        return value
+    if value & _PSR:
+        return None
+    return registers.get(value)
+
+
+def referenced_playlists(navigation_commands: Sequence[NavigationCommand]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+        Returns the playlist numbers played by PLAY_PL, PLAY_PL_PI and PLAY_PL_PM commands
+        and the ids of the movie objects reached by JUMP_OBJECT and CALL_OBJECT commands.
+        Operands read from a general purpose register are resolved only if the register was
+        last set by a MOVE of an immediate value, in command order.
+    """
+    playlists: List[int] = []
+    movie_objects: List[int] = []
+    registers: Dict[int, int] = {}
+    for command in navigation_commands:
+        group = command.command_group
+        if group == _SET:
+            if command.command_sub_group == 0x00 and not command.immediate_destination:
+                if command.set_option == _MOVE and command.immediate_source:
+                    registers[command.destination] = command.source
+                else:
+                    registers.pop(command.destination, None)
+                    if not command.immediate_source:
+                        # SWAP also writes the source register
+                        registers.pop(command.source, None)
+            continue
+
+        key = (group, command.command_sub_group, command.branch_option)
+        if key in _PLAY_PL:
+            targets = playlists
+        elif key in _JUMP_CALL_OBJECT:
+            targets = movie_objects
+        else:
+            continue
+        target = _operand(command.destination, command.immediate_destination, registers)
+        if target is not None and target not in targets:
+            targets.append(target)
+
+    return tuple(playlists), tuple(movie_objects)
+
+
+def movie_object_playlists(movie_objects: MovieObjects) -> Dict[int, Tuple[int, ...]]:
+    """
+        Maps every movie object id to the playlist numbers it may play,
+        including the ones played by the movie objects it jumps to or calls.
+    """
+    objects: Sequence[MovieObject] = movie_objects.movie_objects or ()
+    direct = [referenced_playlists(movie_object.navigation_commands) for movie_object in objects]
+
+    index: Dict[int, Tuple[int, ...]] = {}
+    for movie_object_id in range(len(direct)):
+        playlists: List[int] = []
+        seen: Set[int] = set()
+        pending = [movie_object_id]
+        while pending:
+            current = pending.pop()
+            if current in seen or current >= len(direct):
+                continue
+            seen.add(current)
+            current_playlists, current_objects = direct[current]
+            playlists.extend(playlist for playlist in current_playlists if playlist not in playlists)
+            pending.extend(reversed(current_objects))
+        index[movie_object_id] = tuple(playlists)
+    return index
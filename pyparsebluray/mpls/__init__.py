@@ -7,10 +7,23 @@ from .playlist_mark import *
 from .movie_playlist import *
 
 from .load import *
+from .probe import *
+from .feed import *
+from .diagnostics import *
+from .ext_data_blocks import *
 
-__all__ = ['AppInfoPlaylist', 'ExtensionData', 'Playlist', 'PlaylistMarks', 'MoviePlaylist']
+__all__ = ['AppInfoPlaylist', 'ExtensionData', 'Playlist', 'LazyPlaylist', 'PlaylistMarks', 'MoviePlaylist']
+__all__ += ['FrozenAppInfoPlaylist', 'FrozenExtensionData', 'FrozenPlaylist', 'FrozenPlaylistMarks',
+            'FrozenMoviePlaylist']
 __all__ += ['load_movie_playlist', 'load_app_info_playlist', 'load_playlist',
-            'load_playlist_mark', 'load_extention_data']
+            'load_playlist_mark', 'load_extention_data', 'load_lazy_playlist']
+__all__ += ['MplsFile', 'FrozenMplsFile', 'load_mpls', 'loads_mpls', 'load_mpls_file',
+            'list_playlists', 'scan_playlists']
+__all__ += ['PlaylistProbe', 'probe_mpls', 'probes_mpls', 'probe_mpls_file']
+__all__ += ['MplsEvent', 'MplsFeedParser']
+__all__ += ['Diagnostic', 'ParseError', 'parse_mode']
+__all__ += ['PipPosition', 'PipMetadata', 'STNTableSS', 'StaticMetadata',
+            'EXT_DATA_DECODERS', 'register_ext_data_decoder', 'decode_ext_data_block']
 
 
 from .play_item import *
@@ -1,11 +1,29 @@
 """https://github.com/lw/BluRay/wiki/AppInfoPlayList"""
 
-__all__ = ['AppInfoPlaylist']
+__all__ = ['AppInfoPlaylist', 'FrozenAppInfoPlaylist']
 
 
-from typing import Optional
+from typing import NamedTuple, Optional
 
-from .movie_playlist import MplsObject
+from .diagnostics import section_end
+from .movie_playlist import UINT32, Buffer, MplsObject
+from .schema import Field, compile_schema
+
+_LOAD_APP_INFO_PLAYLIST = compile_schema('_load_app_info_playlist', (
+    Field('playback_type', 'B'),                                                # 1 byte - 8 bits
+    Field('playback_count', 'H', when='playback_type in {0x02, 0x03}'),         # 2 bytes - 16 bits, else Reserved
+    Field('uo_mask_table', 'Q'),                                                # 8 bytes - 64 bits
+    Field('misc_flags', 'H'),                                                   # 2 bytes - 16 bits
+))
+
+
+class FrozenAppInfoPlaylist(NamedTuple):
+    """Frozen AppInfoPlaylist"""
+    length: int
+    playback_type: Optional[int]
+    playback_count: Optional[int]
+    uo_mask_table: Optional[int]
+    misc_flags: Optional[int]
 
 
 class AppInfoPlaylist(MplsObject):
@@ -16,20 +34,21 @@ class AppInfoPlaylist(MplsObject):
     uo_mask_table: Optional[int]
     misc_flags: Optional[int]
 
+    _frozen = FrozenAppInfoPlaylist
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(4)                                            # 4 bytes - 32 bits
-
-        if self.length != 0:
-            self.playback_type, = self._unpack_byte(1)                                 # 1 byte - 8 bits
-            if self.playback_type in {0x02, 0x03}:
-                self.playback_count, = self._unpack_byte(2)                            # 2 bytes - 16 bits
-            else:
-                self.mpls.read(2)                                                            # 2 bytes - 16 bits - Reserved
-            self.uo_mask_table, = self._unpack_byte(8)                                 # 8 bytes - 64 bits
-            self.misc_flags, = self._unpack_byte(2)                                    # 2 bytes - 16 bits
+        self.load_from(self._read_section(UINT32))
 
         self.mpls.seek(pos + self.length + 4)
 
         return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            _LOAD_APP_INFO_PLAYLIST(self, data, offset + 4, section_end(data, offset, self.length + 4))
+
+        return self
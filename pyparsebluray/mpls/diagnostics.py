@@ -0,0 +1,114 @@
+"""Strict and tolerant parse modes for corrupt or hostile files"""
+
+__all__ = ['Diagnostic', 'ParseError', 'parse_mode']
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from struct import error as StructError
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+from .movie_playlist import Buffer, MplsObject
+
+_S = TypeVar('_S', bound=MplsObject)
+
+
+class Diagnostic(NamedTuple):
+    """Anomaly met while parsing"""
+    structure: str                                                              # Type name of the structure
+    offset: int                                                                 # Offset in the decoded buffer
+    message: str
+
+
+class ParseError(ValueError):
+    """Anomaly met in strict mode"""
+    diagnostic: Diagnostic
+
+    def __init__(self, diagnostic: Diagnostic) -> None:
+        super().__init__(f'{diagnostic.structure} at {diagnostic.offset}: {diagnostic.message}')
+        self.diagnostic = diagnostic
+
+
+# (strict, diagnostics) of the innermost parse_mode block
+_MODE: ContextVar[Optional[Tuple[bool, List[Diagnostic]]]] = ContextVar('parse_mode', default=None)
+
+
+@contextmanager
+def parse_mode(strict: bool = False) -> Iterator[List[Diagnostic]]:
+    """
+        Sets how the loaders handle anomalies inside the block.
+
+        Whatever the mode, counts are capped to the records that fit in the remaining bytes of their section,
+        so the work done stays bounded by the size of the file.
+        In strict mode, the first anomaly raises a ParseError.
+        In tolerant mode, anomalies are appended to the yielded list and a section
+        that can't be decoded is kept as far as it was decoded.
+        Outside of any block, anomalies are printed as warnings.
+        The mode applies to the current thread or asyncio task only.
+    """
+    diagnostics: List[Diagnostic] = []
+    token = _MODE.set((strict, diagnostics))
+    try:
+        yield diagnostics
+    finally:
+        _MODE.reset(token)
+
+
+def report(structure: Any, offset: int, message: str) -> None:
+    """Handles an anomaly met in `structure`, the object being decoded or its name, according to the current parse mode"""
+    diagnostic = Diagnostic(structure if isinstance(structure, str) else type(structure).__name__, offset, message)
+    mode = _MODE.get()
+    if mode is None:
+        print(f'WARNING: {message}')
+    elif mode[0]:
+        raise ParseError(diagnostic)
+    else:
+        mode[1].append(diagnostic)
+
+
+def cap_count(structure: Any, name: str, count: int, offset: int, end: int, size: int) -> int:
+    """Returns `count`, or the number of `size`-byte records fitting between `offset` and `end` if fewer"""
+    fitting = max(end - offset, 0) // size
+    if count > fitting:
+        report(structure, offset, f'{name} = {count} but only {fitting} fit in the section')
+        return fitting
+    return count
+
+
+def fits(structure: Any, name: str, count: int, index: int, offset: int, end: int, size: int) -> bool:
+    """
+        Returns whether the record `index` of a variable-size list, `size` bytes at least,
+        starts between `offset` and `end`
+    """
+    if offset + size <= end:
+        return True
+    report(structure, offset, f'{name} = {count} but only {index} fit in the section')
+    return False
+
+
+def section_end(data: Buffer, offset: int, size: int) -> int:
+    """Returns the end of a section of `size` bytes starting at `offset`, bounded by the buffer"""
+    return min(offset + size, len(data))
+
+
+def recover(section: _S, offset: int, error: Exception, required: bool = False, structure: Optional[str] = None) -> _S:
+    """
+        Handles an error raised while decoding a section.
+        In tolerant mode, it's reported under `structure`, the name of its type by default,
+        and the section is kept as far as it was decoded, unless it's `required` to locate the others.
+    """
+    mode = _MODE.get()
+    if mode is None:
+        raise error
+    diagnostic = Diagnostic(structure or type(section).__name__, offset, f'section could not be decoded: {error}')
+    if mode[0] or required:
+        raise ParseError(diagnostic) from error
+    mode[1].append(diagnostic)
+    return section
+
+
+def load_section(section: _S, data: Buffer, offset: int, required: bool = False) -> _S:
+    """Decodes a top-level or lazily decoded section, a truncated or corrupt one being handled by `recover`"""
+    try:
+        return section.load_from(data, offset)
+    except (StructError, UnicodeDecodeError) as error:
+        return recover(section, offset, error, required)
@@ -0,0 +1,213 @@
+"""
+    Decoders of the ExtensionData blocks, looked up by (ext_data_type, ext_data_version)
+    https://github.com/lw/BluRay/wiki/ExtensionData
+"""
+
+__all__ = ['PipPosition', 'PipMetadata', 'STNTableSS', 'StaticMetadata',
+           'EXT_DATA_DECODERS', 'register_ext_data_decoder', 'decode_ext_data_block']
+
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .diagnostics import cap_count, recover, section_end
+from .extension_data import ExtensionDataEntry
+from .movie_playlist import UINT16, Buffer, iter_unpack_from
+from .play_item import FrozenStreamAttributes, FrozenStreamEntry, StreamAttributes, StreamEntry
+
+_BLOCK_HEADER = Struct('>IH')
+_PIP_METADATA = Struct('>HBxHxB2xI')
+_PIP_POSITION = Struct('>II')
+_STATIC_METADATA_HEADER = Struct('>IB3x')
+_STATIC_METADATA = Struct('>13H')
+_OFFSET_SEQUENCES = Struct('>H')
+
+ExtDataDecoder = Callable[[Buffer], Any]
+
+# (ext_data_type, ext_data_version) -> decoder of the block
+EXT_DATA_DECODERS: Dict[Tuple[int, int], ExtDataDecoder] = {}
+
+
+def register_ext_data_decoder(ext_data_type: int, ext_data_version: int) -> Callable[[ExtDataDecoder], ExtDataDecoder]:
+    """Registers the decoder of the blocks of a type and version, replacing the previous one"""
+    def register(decoder: ExtDataDecoder) -> ExtDataDecoder:
+        EXT_DATA_DECODERS[ext_data_type, ext_data_version] = decoder
+        return decoder
+    return register
+
+
+def decode_ext_data_block(entry: ExtensionDataEntry, block: Buffer) -> Any:
+    """
+        Decodes the block of an ExtensionDataEntry, `block` holding its ext_data_length bytes.
+        Blocks without a registered decoder are returned as bytes,
+        as are corrupt blocks in tolerant mode.
+    """
+    decoder = EXT_DATA_DECODERS.get((entry.ext_data_type, entry.ext_data_version))
+    if decoder is None:
+        return bytes(block)
+    try:
+        return decoder(block)
+    except (StructError, UnicodeDecodeError) as error:
+        return recover(bytes(block), 0, error, structure=decoder.__name__)
+
+
+class PipPosition(NamedTuple):
+    """Position and scale of the secondary video from `time` on"""
+    time: int                                                                   # 45 kHz
+    xpos: int
+    ypos: int
+    scale_factor: int
+
+
+class PipMetadata(NamedTuple):
+    """Picture-in-Picture metadata of a secondary video stream"""
+    ref_to_play_item_id: int
+    ref_to_secondary_video_stream_id: int
+    pip_timeline_type: int
+    is_luma_key: bool
+    trick_playing_flag: bool
+    upper_limit_luma_key: Optional[int]
+    positions: Tuple[PipPosition, ...]
+
+
+@register_ext_data_decoder(1, 1)
+def decode_pip_metadata(block: Buffer) -> Tuple[PipMetadata, ...]:
+    """Decodes a PiP metadata block"""
+    # 4 bytes - 32 bits - length
+    # 2 bytes - 16 bits
+    length, nb_pip_metadata = _BLOCK_HEADER.unpack_from(block, 0)
+    end = section_end(block, 0, length + 4)
+    nb_pip_metadata = cap_count(
+        'PipMetadata', 'nb_pip_metadata', nb_pip_metadata, _BLOCK_HEADER.size, end, _PIP_METADATA.size
+    )
+
+    pip_metadata: List[PipMetadata] = []
+    # 2 bytes - 16 bits
+    # 1 byte - 8 bits
+    # 1 byte - 8 bits - Reserved
+    # 2 bytes - 16 bits - timeline type, luma key and trick play flags
+    # 1 byte - 8 bits - Reserved
+    # 1 byte - 8 bits
+    # 2 bytes - 16 bits - Reserved
+    # 4 bytes - 32 bits - Address of the positions from the start of the block
+    for ref_to_play_item_id, ref_to_secondary_video_stream_id, flags, upper_limit_luma_key, \
+            metadata_block_header_address in iter_unpack_from(_PIP_METADATA, block, _BLOCK_HEADER.size, nb_pip_metadata):
+        is_luma_key = bool(flags & 0x0800)
+        pip_metadata.append(PipMetadata(
+            ref_to_play_item_id, ref_to_secondary_video_stream_id, flags >> 12, is_luma_key, bool(flags & 0x0400),
+            upper_limit_luma_key if is_luma_key else None,
+            _decode_pip_positions(block, metadata_block_header_address)
+        ))
+    return tuple(pip_metadata)
+
+
+def _decode_pip_positions(block: Buffer, offset: int) -> Tuple[PipPosition, ...]:
+    nb_positions, = UINT16.unpack_from(block, offset)                          # 2 bytes - 16 bits
+    offset += 2
+    nb_positions = cap_count('PipMetadata', 'nb_positions', nb_positions, offset, len(block), _PIP_POSITION.size)
+    # nb_positions x 8 bytes:
+    # 4 bytes - 32 bits - time
+    # 12 bits - xpos
+    # 12 bits - ypos
+    # 4 bits - scale_factor
+    # 4 bits - Reserved
+    return tuple(
+        PipPosition(time, position >> 20, (position >> 8) & 0x0FFF, (position >> 4) & 0x0F)
+        for time, position in iter_unpack_from(_PIP_POSITION, block, offset, nb_positions)
+    )
+
+
+class STNTableSS(NamedTuple):
+    """
+        STN_table_SS of a PlayItem, holding the streams used in stereoscopic 3D playback.
+        The dependent view is decoded, the following PG, IG and secondary video entries
+        are kept undecoded in `data`.
+    """
+    length: int
+    fixed_offset_during_popup_flag: bool
+    dependent_view: Optional[Tuple[FrozenStreamEntry, FrozenStreamAttributes]]
+    number_of_offset_sequences: Optional[int]
+    data: bytes
+
+
+@register_ext_data_decoder(2, 1)
+def decode_stn_table_ss(block: Buffer) -> Tuple[STNTableSS, ...]:
+    """
+        Decodes a block of STN_table_SS, one per PlayItem in order.
+        PlayItems are assumed to hold one primary video stream, the only count 3D discs use.
+    """
+    tables: List[STNTableSS] = []
+    offset = 0
+    while offset + 2 <= len(block):
+        length, = UINT16.unpack_from(block, offset)                            # 2 bytes - 16 bits
+        end = section_end(block, offset, length + 2)
+        table_offset, offset = offset + 2, end
+        if end - table_offset < 2:
+            continue
+
+        # 1 bit
+        # 15 bits - Reserved
+        fixed_offset_during_popup_flag = bool(block[table_offset] & 0x80)
+        table_offset += 2
+
+        # A table holding only the flags has no primary video stream
+        dependent_view = number_of_offset_sequences = None
+        if table_offset < end:
+            stream_entry = StreamEntry().load_from(block, table_offset)
+            table_offset += stream_entry.length + 1
+            stream_attributes = StreamAttributes().load_from(block, table_offset)
+            table_offset += stream_attributes.length + 1
+            dependent_view = (stream_entry.freeze(), stream_attributes.freeze())
+
+            # 10 bits - Reserved
+            # 6 bits
+            number_of_offset_sequences, = _OFFSET_SEQUENCES.unpack_from(block, table_offset)
+            number_of_offset_sequences &= 0x3F
+            table_offset += _OFFSET_SEQUENCES.size
+
+        tables.append(STNTableSS(
+            length, fixed_offset_during_popup_flag, dependent_view, number_of_offset_sequences,
+            bytes(block[table_offset:end])
+        ))
+    return tuple(tables)
+
+
+class StaticMetadata(NamedTuple):
+    """HDR static metadata of UHD playlists, SMPTE ST 2086 mastering display and content light levels"""
+    dynamic_range_type: int
+    display_primaries_x: Tuple[int, int, int]                                   # 0.00002 units
+    display_primaries_y: Tuple[int, int, int]                                   # 0.00002 units
+    white_point_x: int                                                          # 0.00002 units
+    white_point_y: int                                                          # 0.00002 units
+    max_display_mastering_luminance: int                                        # cd/m²
+    min_display_mastering_luminance: int                                        # 0.0001 cd/m²
+    max_cll: int                                                                # cd/m²
+    max_fall: int                                                               # cd/m²
+
+
+@register_ext_data_decoder(3, 5)
+def decode_static_metadata(block: Buffer) -> Tuple[StaticMetadata, ...]:
+    """Decodes a UHD static metadata block"""
+    # 4 bytes - 32 bits - length
+    # 1 byte - 8 bits
+    # 3 bytes - 24 bits - Reserved
+    length, nb_static_metadata = _STATIC_METADATA_HEADER.unpack_from(block, 0)
+    end = section_end(block, 0, length + 4)
+    nb_static_metadata = cap_count(
+        'StaticMetadata', 'nb_static_metadata', nb_static_metadata,
+        _STATIC_METADATA_HEADER.size, end, _STATIC_METADATA.size
+    )
+
+    # nb_static_metadata x 26 bytes:
+    # 4 bits - dynamic_range_type
+    # 12 bits - Reserved
+    # 3 x (2 bytes - 16 bits + 2 bytes - 16 bits) - display primaries x and y
+    # 2 bytes - 16 bits + 2 bytes - 16 bits - white point x and y
+    # 4 x 2 bytes - 16 bits - luminances and light levels
+    return tuple(
+        StaticMetadata(
+            values[0] >> 12, (values[1], values[3], values[5]), (values[2], values[4], values[6]), *values[7:]
+        )
+        for values in iter_unpack_from(_STATIC_METADATA, block, _STATIC_METADATA_HEADER.size, nb_static_metadata)
+    )
+
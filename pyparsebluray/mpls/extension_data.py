@@ -1,11 +1,13 @@
 """https://github.com/lw/BluRay/wiki/ExtensionData"""
 
-__all__ = ['ExtensionData']
+__all__ = ['ExtensionData', 'FrozenExtensionData']
 
 
-from typing import List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
-from .movie_playlist import MplsObject
+from .diagnostics import section_end
+from .movie_playlist import UINT32, Buffer, MplsObject
+from .schema import Field, Repeat, compile_schema
 
 
 class ExtensionDataEntry(NamedTuple):
@@ -16,6 +18,28 @@ class ExtensionDataEntry(NamedTuple):
     ext_data_length: int
 
 
+_LOAD_EXTENSION_DATA = compile_schema('_load_extension_data', (
+    Field('data_block_start_address', 'I'),                                     # 4 bytes - 32 bits
+    Field(None, '3x'),                                                          # 3 bytes - 24 bits - Reserved
+    Field('nb_ext_data_entries', 'B'),                                          # 1 byte - 8 bits
+    # nb_ext_data_entries x 12 bytes:
+    Repeat('ext_data_entries', 'nb_ext_data_entries', (
+        Field('ext_data_type', 'H'),                                            # 2 bytes - 16 bits
+        Field('ext_data_version', 'H'),                                         # 2 bytes - 16 bits
+        Field('ext_data_start_address', 'I'),                                   # 4 bytes - 32 bits
+        Field('ext_data_length', 'I'),                                          # 4 bytes - 32 bits
+    ), ExtensionDataEntry),
+))
+
+
+class FrozenExtensionData(NamedTuple):
+    """Frozen ExtensionData"""
+    length: int
+    data_block_start_address: Optional[int]
+    nb_ext_data_entries: Optional[int]
+    ext_data_entries: Optional[Tuple[ExtensionDataEntry, ...]]
+
+
 class ExtensionData(MplsObject):
     """https://github.com/lw/BluRay/wiki/ExtensionData"""
     length: int
@@ -23,30 +47,21 @@ class ExtensionData(MplsObject):
     nb_ext_data_entries: Optional[int]
     ext_data_entries: Optional[List[ExtensionDataEntry]]
 
+    _frozen = FrozenExtensionData
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(4)                                     # 4 bytes - 32 bits
-
-        if self.length != 0:
-            self.data_block_start_address, = self._unpack_byte(4)               # 4 bytes - 32 bits
-            self.mpls.read(3)                                                   # 3 bytes - 24 bits - Reserved
-            self.nb_ext_data_entries, = self._unpack_byte(1)                    # 1 byte - 8 bits
+        self.load_from(self._read_section(UINT32))
 
-            self.ext_data_entries = []
+        self.mpls.seek(pos + self.length + 4)
 
-            if self.nb_ext_data_entries > 0:
-                for _ in range(self.nb_ext_data_entries):
-                    ext_data_type, = self._unpack_byte(2)                       # 2 bytes - 16 bits
-                    ext_data_version, = self._unpack_byte(2)                    # 2 bytes - 16 bits
-                    ext_data_start_address, = self._unpack_byte(4)              # 4 bytes - 32 bits
-                    ext_data_length, = self._unpack_byte(4)                     # 4 bytes - 32 bits
+        return self
 
-                    self.ext_data_entries.append(
-                        ExtensionDataEntry(ext_data_type, ext_data_version,
-                                           ext_data_start_address, ext_data_length)
-                    )
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
 
-        self.mpls.seek(pos + self.length + 4)
+        if self.length != 0:
+            _LOAD_EXTENSION_DATA(self, data, offset + 4, section_end(data, offset, self.length + 4))
 
         return self
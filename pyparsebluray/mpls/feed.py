@@ -0,0 +1,163 @@
+"""Push-based incremental parsing of a MPLS file"""
+
+__all__ = ['MplsEvent', 'MplsFeedParser']
+
+from struct import Struct
+from typing import Any, Generator, List, NamedTuple, Optional, Tuple
+
+from .app_info_playlist import AppInfoPlaylist
+from .diagnostics import load_section
+from .extension_data import ExtensionData
+from .load import MplsFile
+from .movie_playlist import UINT16, UINT32, Buffer, MoviePlaylist
+from .play_item import PlayItem
+from .playlist import Playlist
+from .playlist_mark import PlaylistMarks
+from .sub_path import SubPath
+
+_MOVIE_PLAYLIST_SIZE = 40
+_PLAYLIST = Struct('>I2xHH')
+
+# Request of `size` bytes at the absolute `offset` of the file
+_Request = Tuple[int, int]
+_Steps = Generator[_Request, bytes, None]
+
+
+class MplsEvent(NamedTuple):
+    """
+        Section completed by `MplsFeedParser.feed`.
+        `section` is one of 'movie_playlist', 'app_info_playlist', 'play_item', 'sub_path',
+        'playlist', 'playlist_mark' or 'extension_data'.
+        The 'playlist' event comes after its play items and sub paths and holds all of them.
+    """
+    section: str
+    value: Any
+
+
+class MplsFeedParser:
+    """
+        Incremental parser for MPLS files coming from non-seekable streams such as pipes.
+
+        Chunks of any size are pushed with `feed`, which returns the sections completed so far.
+        Bytes are dropped as soon as they are consumed: at most one section,
+        or one PlayItem/SubPath, plus the last chunk is buffered.
+        Sections must be stored in increasing address order, as they are in every known MPLS file.
+        Sections are decoded according to the current parse mode, see `parse_mode`.
+        Once an error is raised, every later call raises it again.
+    """
+    movie_playlist: Optional[MoviePlaylist]
+    app_info_playlist: Optional[AppInfoPlaylist]
+    playlist: Optional[Playlist]
+    playlist_mark: Optional[PlaylistMarks]
+    extension_data: Optional[ExtensionData]
+
+    def __init__(self) -> None:
+        self.movie_playlist = None
+        self.app_info_playlist = None
+        self.playlist = None
+        self.playlist_mark = None
+        self.extension_data = None
+
+        self._buffer = bytearray()
+        self._position = 0                                                      # Offset of _buffer[0] in the file
+        self._events: List[MplsEvent] = []
+        self._steps = self._parse()
+        self._request: Optional[_Request] = next(self._steps)
+        self._error: Optional[Exception] = None
+
+    @property
+    def done(self) -> bool:
+        """True once every section has been parsed"""
+        return self._request is None
+
+    def feed(self, chunk: Buffer) -> List[MplsEvent]:
+        """Pushes the next bytes of the file and returns the sections they completed"""
+        if self._error is not None:
+            raise self._error
+        if self._request is None:
+            return []
+        self._buffer += chunk
+
+        while self._request is not None:
+            offset, size = self._request
+            if offset < self._position:
+                self._error = ValueError(
+                    f'MplsFeedParser: section at {offset} is before the current position {self._position}'
+                )
+                raise self._error
+            start = offset - self._position
+            if len(self._buffer) < start + size:
+                # Drop what will never be needed again while waiting for more bytes
+                drop = min(start, len(self._buffer))
+                del self._buffer[:drop]
+                self._position += drop
+                break
+            data = bytes(self._buffer[start:start + size])
+            del self._buffer[:start]
+            self._position = offset
+            try:
+                self._request = self._steps.send(data)
+            except StopIteration:
+                self._request = None
+                self._buffer.clear()
+            except Exception as error:
+                self._error = error
+                raise
+
+        events, self._events = self._events, []
+        return events
+
+    def close(self) -> MplsFile:
+        """Checks that the whole file has been fed and returns all of its sections"""
+        if self._error is not None:
+            raise self._error
+        if self._request is not None:
+            raise EOFError(f'MplsFeedParser: truncated file, {self._request[1]} bytes expected at {self._request[0]}')
+        return MplsFile(self.movie_playlist, self.app_info_playlist,  # type: ignore[arg-type]
+                        self.playlist, self.playlist_mark, self.extension_data)  # type: ignore[arg-type]
+
+    def _emit(self, section: str, value: Any) -> Any:
+        self._events.append(MplsEvent(section, value))
+        return value
+
+    def _section(self, offset: int, length_size: int) -> _Steps:
+        length_struct = UINT16 if length_size == 2 else UINT32
+        length, = length_struct.unpack((yield offset, length_size))
+        return (yield offset, length_size + length)
+
+    def _parse(self) -> _Steps:
+        header = load_section(MoviePlaylist(None), (yield 0, _MOVIE_PLAYLIST_SIZE), 0, required=True)
+        self.movie_playlist = self._emit('movie_playlist', header)
+
+        data = yield from self._section(_MOVIE_PLAYLIST_SIZE, 4)
+        self.app_info_playlist = self._emit('app_info_playlist', load_section(AppInfoPlaylist(None), data, 0))
+
+        offset = header.playlist_start_address
+        playlist = Playlist(None)
+        data = yield offset, 4
+        if UINT32.unpack(data)[0] == 0:
+            load_section(playlist, data, 0)
+        else:
+            data = yield offset, _PLAYLIST.size
+            playlist.length, playlist.nb_play_items, playlist.nb_sub_paths = _PLAYLIST.unpack(data)
+            offset += _PLAYLIST.size
+
+            playlist.play_items = []
+            for _ in range(playlist.nb_play_items):
+                data = yield from self._section(offset, 2)
+                playlist.play_items.append(self._emit('play_item', load_section(PlayItem(None), data, 0)))
+                offset += len(data)
+
+            playlist.sub_paths = []
+            for _ in range(playlist.nb_sub_paths):
+                data = yield from self._section(offset, 4)
+                playlist.sub_paths.append(self._emit('sub_path', load_section(SubPath(None), data, 0)))
+                offset += len(data)
+        self.playlist = self._emit('playlist', playlist)
+
+        data = yield from self._section(header.playlist_mark_start_address, 4)
+        self.playlist_mark = self._emit('playlist_mark', load_section(PlaylistMarks(None), data, 0))
+
+        if header.extension_data_start_address != 0:
+            data = yield from self._section(header.extension_data_start_address, 4)
+            self.extension_data = self._emit('extension_data', load_section(ExtensionData(None), data, 0))
@@ -1,15 +1,22 @@
 """Convenience functions"""
 
 __all__ = ['load_movie_playlist', 'load_app_info_playlist', 'load_playlist',
-           'load_playlist_mark', 'load_extention_data']
+           'load_playlist_mark', 'load_extention_data', 'load_lazy_playlist',
+           'MplsFile', 'FrozenMplsFile', 'load_mpls', 'loads_mpls', 'load_mpls_file',
+           'list_playlists', 'scan_playlists']
 
+import mmap
+import os
 from io import BufferedReader
+from pathlib import Path
+from typing import Collection, Dict, List, NamedTuple, Optional, Union
 
-from .app_info_playlist import AppInfoPlaylist
-from .extension_data import ExtensionData
-from .movie_playlist import MoviePlaylist
-from .playlist import Playlist
-from .playlist_mark import PlaylistMarks
+from .app_info_playlist import AppInfoPlaylist, FrozenAppInfoPlaylist
+from .diagnostics import load_section
+from .extension_data import ExtensionData, FrozenExtensionData
+from .movie_playlist import Buffer, FrozenMoviePlaylist, MoviePlaylist
+from .playlist import FrozenPlaylist, LazyPlaylist, Playlist
+from .playlist_mark import FrozenPlaylistMarks, PlaylistMarks
 
 
 def load_movie_playlist(mpls: BufferedReader) -> MoviePlaylist:
@@ -27,6 +34,11 @@ def load_playlist(mpls: BufferedReader) -> Playlist:
     return Playlist(mpls).load()
 
 
+def load_lazy_playlist(mpls: BufferedReader) -> LazyPlaylist:
+    """Loads and returns a LazyPlaylist object"""
+    return LazyPlaylist(mpls).load()
+
+
 def load_playlist_mark(mpls: BufferedReader) -> PlaylistMarks:
     """Loads and returns a PlaylistMarks object"""
     return PlaylistMarks(mpls).load()
@@ -35,3 +47,84 @@ def load_playlist_mark(mpls: BufferedReader) -> PlaylistMarks:
 def load_extention_data(mpls: BufferedReader) -> ExtensionData:
     """Loads and returns a ExtensionData object"""
     return ExtensionData(mpls).load()
+
+
+class FrozenMplsFile(NamedTuple):
+    """Every frozen section of a MPLS file"""
+    movie_playlist: FrozenMoviePlaylist
+    app_info_playlist: FrozenAppInfoPlaylist
+    playlist: FrozenPlaylist
+    playlist_mark: FrozenPlaylistMarks
+    extension_data: Optional[FrozenExtensionData]
+
+
+class MplsFile(NamedTuple):
+    """Every section of a MPLS file"""
+    movie_playlist: MoviePlaylist
+    app_info_playlist: AppInfoPlaylist
+    playlist: Playlist
+    playlist_mark: PlaylistMarks
+    extension_data: Optional[ExtensionData]
+
+    def freeze(self) -> FrozenMplsFile:
+        """Returns the frozen counterpart of every section"""
+        return FrozenMplsFile._make(None if section is None else section.freeze() for section in self)
+
+
+def load_mpls(mpls: BufferedReader, lazy: bool = False) -> MplsFile:
+    """
+        Reads the whole MPLS file in one call and returns all of its sections.
+        If `lazy` is True, the playlist is a LazyPlaylist.
+    """
+    mpls.seek(0, os.SEEK_SET)
+    return _load_sections(mpls.read(), mpls, lazy)
+
+
+def loads_mpls(data: Buffer, lazy: bool = False) -> MplsFile:
+    """
+        Loads and returns all the sections of an in-memory MPLS file.
+        If `lazy` is True, the playlist is a LazyPlaylist.
+    """
+    return _load_sections(data, None, lazy)
+
+
+def load_mpls_file(path: Union[str, os.PathLike], lazy: bool = False) -> MplsFile:
+    """
+        Memory-maps a MPLS file and returns all of its sections.
+        If `lazy` is True, the playlist is a LazyPlaylist
+        and the file is read in one call instead since the LazyPlaylist outlives the mapping.
+    """
+    with open(path, 'rb') as mpls:
+        if lazy or os.fstat(mpls.fileno()).st_size == 0:
+            return _load_sections(mpls.read(), None, lazy)
+        with mmap.mmap(mpls.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _load_sections(data, None, lazy)
+
+
+def list_playlists(bdmv: Union[str, os.PathLike]) -> List[Path]:
+    """Returns the paths of the MPLS files of a BDMV folder, sorted by file name"""
+    return sorted(
+        path for path in Path(bdmv, 'PLAYLIST').iterdir()
+        if path.suffix.lower() == '.mpls' and path.is_file()
+    )
+
+
+def scan_playlists(bdmv: Union[str, os.PathLike], lazy: bool = False) -> Dict[str, MplsFile]:
+    """Loads every playlist of a BDMV folder, keyed and sorted by file name"""
+    return {path.name: load_mpls_file(path, lazy) for path in list_playlists(bdmv)}
+
+
+def _load_sections(data: Buffer, mpls: Optional[BufferedReader], lazy: bool = False,
+                   fields: Optional[Collection[str]] = None) -> MplsFile:
+    """Decodes the sections, only those whose MplsFile field is in `fields` if given, the others being None"""
+    header = load_section(MoviePlaylist(mpls), data, 0, required=True)
+    appinfo = pls = marks = extension = None
+    if fields is None or 'app_info_playlist' in fields:
+        appinfo = load_section(AppInfoPlaylist(mpls), data, 40)
+    if fields is None or 'playlist' in fields:
+        pls = load_section((LazyPlaylist if lazy else Playlist)(mpls), data, header.playlist_start_address)
+    if fields is None or 'playlist_mark' in fields:
+        marks = load_section(PlaylistMarks(mpls), data, header.playlist_mark_start_address)
+    if header.extension_data_start_address != 0 and (fields is None or 'extension_data' in fields):
+        extension = load_section(ExtensionData(mpls), data, header.extension_data_start_address)
+    return MplsFile(header, appinfo, pls, marks, extension)  # type: ignore[arg-type]
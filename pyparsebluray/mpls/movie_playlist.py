@@ -1,33 +1,94 @@
 """https://github.com/lw/BluRay/wiki/MPLS"""
 
-__all__ = ['MoviePlaylist']
+__all__ = ['MoviePlaylist', 'FrozenMoviePlaylist']
 
 
+import sys
 from abc import ABC, abstractmethod
+from array import array
 from io import BufferedReader
 from pprint import pformat
-from struct import unpack
-from typing import Any, Dict, Tuple
+from struct import Struct
+from typing import Any, ClassVar, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+UINT8 = Struct('>B')
+UINT16 = Struct('>H')
+UINT32 = Struct('>I')
+UINT64 = Struct('>Q')
+
+_BYTE_STRUCTS: Dict[int, Struct] = {1: UINT8, 2: UINT16, 4: UINT32, 8: UINT64}
+
+
+def iter_unpack_from(record: Struct, data: Buffer, offset: int, count: int) -> Iterator[Tuple[Any, ...]]:
+    """Decodes a block of `count` fixed-size records starting at `offset` in one pass"""
+    return record.iter_unpack(memoryview(data)[offset:offset + count * record.size])
+
+
+# encoding -> raw bytes -> interned string
+_STRING_POOLS: Dict[str, Dict[bytes, str]] = {'utf-8': {}}
+_UTF8_POOL = _STRING_POOLS['utf-8']
+# Entries of a pool before it's emptied, far more than the identifiers of a disc
+POOL_SIZE = 4096
+
+
+def decode_string(raw: bytes, encoding: str = 'utf-8') -> str:
+    """
+        Decodes a short identifier (clip name, codec identifier, language code...)
+        through a shared pool, so that equal values decoded anywhere are the same interned str object.
+        A pool holding POOL_SIZE values is emptied, bounding memory when scanning many discs or hostile files.
+    """
+    pool = _UTF8_POOL if encoding == 'utf-8' else _STRING_POOLS.setdefault(encoding, {})
+    string = pool.get(raw)
+    if string is None:
+        if len(pool) >= POOL_SIZE:
+            pool.clear()
+        string = pool[raw] = sys.intern(raw.decode(encoding))
+    return string
 
 
 class MplsObject(ABC):
     """Abstract MPLS object interface"""
-    mpls: BufferedReader
+    mpls: Optional[BufferedReader]
+
+    _frozen: ClassVar[Type[Tuple[Any, ...]]]
 
-    def __init__(self, mpls: BufferedReader) -> None:
+    def __init__(self, mpls: Optional[BufferedReader] = None) -> None:
         self.mpls = mpls
         super().__init__()
 
     def __repr__(self) -> str:
         return pformat(vars(self), sort_dicts=False)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # File handles can't be pickled nor sent to another process
+        return dict(vars(self), mpls=None)
+
     @abstractmethod
     def load(self):
         """Method loading the MPLS object"""
 
+    @abstractmethod
+    def load_from(self, data: Buffer, offset: int = 0):
+        """Method loading the MPLS object from an in-memory buffer at the given offset"""
+
+    def freeze(self) -> Tuple[Any, ...]:
+        """
+            Returns a compact and immutable NamedTuple copy of the object, detached from the reader.
+            Attributes that were not loaded are set to None.
+        """
+        return self._frozen._make(_freeze(getattr(self, name, None)) for name in self._frozen._fields)
+
     def _get_pos(self) -> int:
         return self.mpls.tell()
 
+    def _read_section(self, length: Struct) -> bytes:
+        """Reads a length-prefixed section in one call, its length field included"""
+        prefix = self.mpls.read(length.size)
+        size, = length.unpack(prefix)
+        return prefix + self.mpls.read(size)
+
     def _unpack_byte(self, n: int) -> Tuple[Any, ...]:
         """
             Size 1 -> big-endian unsigned char
@@ -35,8 +96,54 @@ class MplsObject(ABC):
             Size 4 -> big-endian unsigned int
             Size 8 -> big-endian unsigned long long
         """
-        formats: Dict[int, str] = {1: '>B', 2: '>H', 4: '>I', 8: '>Q'}
-        return unpack(formats[n], self.mpls.read(n))
+        fmt = _BYTE_STRUCTS[n]
+        return fmt.unpack(self.mpls.read(fmt.size))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, MplsObject):
+        return value.freeze()
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return value if _is_frozen(value) else value._make(_freeze(v) for v in value)
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, array)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _is_frozen(value: Tuple[Any, ...]) -> bool:
+    return not any(isinstance(v, (MplsObject, list)) for v in value)
+
+
+class LazyMplsObject(MplsObject):
+    """
+        Abstract MPLS object keeping a reference to its source buffer
+        and decoding its `_lazy_attributes` only on first access
+    """
+    _data: Buffer
+    _lazy_attributes: ClassVar[Tuple[str, ...]] = ()
+
+    def __repr__(self) -> str:
+        return pformat(self._public_vars(), sort_dicts=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return dict(self._public_vars(), mpls=None)
+
+    def _public_vars(self) -> Dict[str, Any]:
+        for name in self._lazy_attributes:
+            getattr(self, name, None)
+        return {k: v for k, v in vars(self).items() if not k.startswith('_')}
+
+
+_MOVIE_PLAYLIST = Struct('>4s4sIII')
+
+
+class FrozenMoviePlaylist(NamedTuple):
+    """Frozen MoviePlaylist"""
+    type_indicator: str
+    version_number: str
+    playlist_start_address: int
+    playlist_mark_start_address: int
+    extension_data_start_address: int
 
 
 class MoviePlaylist(MplsObject):
@@ -47,17 +154,24 @@ class MoviePlaylist(MplsObject):
     playlist_mark_start_address: int
     extension_data_start_address: int
 
+    _frozen = FrozenMoviePlaylist
+
     def load(self):
         pos = self._get_pos()
 
         if pos != 0:
             raise Exception('MoviePlaylist: You should called it at the start of the mpls file!')
 
-        self.type_indicator = self.mpls.read(4).decode('utf-8')                 # 4 bytes - 32 bits
-        self.version_number = self.mpls.read(4).decode('utf-8')                 # 4 bytes - 32 bits
-        self.playlist_start_address, = self._unpack_byte(4)                     # 4 bytes - 32 bits
-        self.playlist_mark_start_address, = self._unpack_byte(4)                # 4 bytes - 32 bits
-        self.extension_data_start_address, = self._unpack_byte(4)               # 4 bytes - 32 bits
-        self.mpls.read(20)                                                      # 20 bytes - 160 bits - Reserved
+        return self.load_from(self.mpls.read(_MOVIE_PLAYLIST.size + 20))        # 20 bytes - 160 bits - Reserved
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        type_indicator, version_number, playlist_start_address, \
+            playlist_mark_start_address, extension_data_start_address = _MOVIE_PLAYLIST.unpack_from(data, offset)
+
+        self.type_indicator = type_indicator.decode('utf-8')                    # 4 bytes - 32 bits
+        self.version_number = version_number.decode('utf-8')                    # 4 bytes - 32 bits
+        self.playlist_start_address = playlist_start_address                    # 4 bytes - 32 bits
+        self.playlist_mark_start_address = playlist_mark_start_address          # 4 bytes - 32 bits
+        self.extension_data_start_address = extension_data_start_address        # 4 bytes - 32 bits
 
         return self
@@ -1,13 +1,64 @@
 """https://github.com/lw/BluRay/wiki/PlayItem"""
 
-__all__ = ['PlayItem',
+__all__ = ['PlayItem', 'LazyPlayItem', 'FrozenPlayItem', 'FrozenSTNTable',
+           'FrozenStreamEntry', 'FrozenStreamAttributes',
            'STREAM_CODING_TYPE', 'VIDEO_FORMAT', 'FRAMERATE', 'DYNAMIC_RANGE_TYPE',
            'COLOR_SPACE', 'AUDIO_FORMAT', 'SAMPLE_RATE', 'CHARACTER_CODE']
 
+import sys
 from fractions import Fraction
+from functools import cached_property
+from struct import Struct
 from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-from .movie_playlist import MplsObject
+from .diagnostics import fits, load_section, report, section_end
+from .movie_playlist import POOL_SIZE, UINT8, UINT16, Buffer, LazyMplsObject, MplsObject, decode_string
+from .schema import Field, Group, Repeat, compile_schema
+
+_STN_TABLE = Struct('>2x8B4x')
+
+# PID -> its interned '0x....' string
+_PIDS: Dict[int, str] = {}
+
+
+def _pid(ref: int) -> str:
+    pid = _PIDS.get(ref)
+    if pid is None:
+        if len(_PIDS) >= POOL_SIZE:
+            _PIDS.clear()
+        pid = _PIDS[ref] = sys.intern('0x{:<04x}'.format(ref))
+    return pid
+
+
+_STREAM_TYPES = frozenset((0x01, 0x02, 0x03, 0x04))
+
+_LOAD_STREAM_ENTRY = compile_schema('_load_stream_entry', (
+    Field('stream_type', 'B'),                                                  # 1 byte - 8 bits
+    # Stream of the clip used by the PlayItem
+    Group('stream_type == 0x01', (
+        Field('ref_to_stream_pid', 'H', convert=_pid),                          # 2 bytes - 16 bits
+    )),
+    # Stream of a clip used by a SubPath
+    Group('stream_type == 0x02', (
+        Field('ref_to_sub_path_id', 'B'),                                       # 1 byte - 8 bits
+        Field('ref_to_sub_clip_id', 'B'),                                       # 1 byte - 8 bits
+        Field('ref_to_stream_pid', 'H', convert=_pid),                          # 2 bytes - 16 bits
+    )),
+    # Stream of the clip used by an in-mux SubPath
+    Group('stream_type in {0x03, 0x04}', (
+        Field('ref_to_sub_path_id', 'B'),                                       # 1 byte - 8 bits
+        Field('ref_to_stream_pid', 'H', convert=_pid),                          # 2 bytes - 16 bits
+    )),
+))
+
+
+class FrozenStreamEntry(NamedTuple):
+    """Frozen StreamEntry"""
+    length: int
+    stream_type: Optional[int]
+    ref_to_stream_pid: Optional[str]
+    ref_to_sub_path_id: Optional[int]
+    ref_to_sub_clip_id: Optional[int]
 
 
 class StreamEntry(MplsObject):
@@ -18,36 +69,72 @@ class StreamEntry(MplsObject):
     ref_to_sub_path_id: Optional[int]
     ref_to_sub_clip_id: Optional[int]
 
+    _frozen = FrozenStreamEntry
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(1)                                     # 1 byte - 8 bits
+        self.load_from(self._read_section(UINT8))
 
-        if self.length != 0:
-            self.stream_type, = self._unpack_byte(1)                            # 1 byte - 8 bits
+        self.mpls.seek(pos + self.length + 1)
 
-            if self.stream_type == 0x01:
-                ref, = self._unpack_byte(2)                                     # 2 bytes - 16 bits
-                self.ref_to_stream_pid = '0x{:<04x}'.format(ref)
+        return self
 
-            elif self.stream_type == 0x02:
-                self.ref_to_sub_path_id, = self._unpack_byte(1)                 # 1 byte - 8 bits
-                self.ref_to_sub_clip_id, = self._unpack_byte(1)                 # 1 byte - 8 bits
-                ref, = self._unpack_byte(2)                                     # 2 bytes - 16 bits
-                self.ref_to_stream_pid = '0x{:<04x}'.format(ref)
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT8.unpack_from(data, offset)                          # 1 byte - 8 bits
 
-            elif self.stream_type in {0x03, 0x04}:
-                self.ref_to_sub_path_id, = self._unpack_byte(1)                 # 1 byte - 8 bits
-                ref, = self._unpack_byte(2)                                     # 2 bytes - 16 bits
-                self.ref_to_stream_pid = '0x{:<04x}'.format(ref)
+        if self.length != 0:
+            # Without a Repeat, the end of the buffer is checked by unpack_from
+            _LOAD_STREAM_ENTRY(self, data, offset + 1, offset + self.length + 1)
 
-            else:
-                print('WARNING: stream_type was not a recognised value', self.stream_type)
+            if self.stream_type not in _STREAM_TYPES:
+                report(self, offset, f'stream_type was not a recognised value {self.stream_type}')
 
+        return self
 
-        self.mpls.seek(pos + self.length + 1)
 
-        return self
+_LOAD_STREAM_ATTRIBUTES = compile_schema('_load_stream_attributes', (
+    Field('stream_coding_type', 'B'),                                           # 1 byte - 8 bits
+    Group('stream_coding_type in {0x01, 0x02, 0x1B, 0xEA}', (
+        Field('_video_format_and_framerate', 'B',                               # 1 byte - 8 bits
+              bits=(('video_format', 4, 4), ('framerate', 0, 4))),
+    )),
+    Group('stream_coding_type == 0x24', (
+        Field('_video_format_and_framerate', 'B',                               # 1 byte - 8 bits
+              bits=(('video_format', 4, 4), ('framerate', 0, 4))),
+        Field('_dynamic_range_type_and_colorspace', 'B',                        # 1 byte - 8 bits
+              bits=(('dynamic_range_type', 4, 4), ('colorspace', 0, 4))),
+        Field('cr_flag_and_hdr_plus_flag', 'B'),                                # 1 byte - 8 bits
+    )),
+    Group('stream_coding_type in {0x03, 0x04, 0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0xA1, 0xA2}', (
+        Field('_audio_format_and_samplerate', 'B',                              # 1 byte - 8 bits
+              bits=(('audio_format', 4, 4), ('samplerate', 0, 4))),
+        Field('language_code', '3s', convert=decode_string),                   # 3 bytes - 24 bits
+    )),
+    Group('stream_coding_type in {0x90, 0x91}', (
+        Field('language_code', '3s', convert=decode_string),                   # 3 bytes - 24 bits
+    )),
+    # The language code is decoded according to the character code once it's read
+    Group('stream_coding_type == 0x92', (
+        Field('character_code', 'B'),                                           # 1 byte - 8 bits
+        Field('language_code', '3s'),                                           # 3 bytes - 24 bits
+    )),
+))
+
+
+class FrozenStreamAttributes(NamedTuple):
+    """Frozen StreamAttributes"""
+    length: int
+    stream_coding_type: Optional[int]
+    video_format: Optional[int]
+    framerate: Optional[int]
+    dynamic_range_type: Optional[int]
+    colorspace: Optional[int]
+    cr_flag_and_hdr_plus_flag: Optional[int]
+    audio_format: Optional[int]
+    samplerate: Optional[int]
+    language_code: Union[str, bytes, None]
+    character_code: Optional[int]
 
 
 class StreamAttributes(MplsObject):
@@ -61,7 +148,7 @@ class StreamAttributes(MplsObject):
     dynamic_range_type: Optional[int]
     colorspace: Optional[int]
 
-    cr_flag_and_hdr_plus_flag = Optional[int]
+    cr_flag_and_hdr_plus_flag: Optional[int]
 
     audio_format: Optional[int]
     samplerate: Optional[int]
@@ -69,59 +156,34 @@ class StreamAttributes(MplsObject):
     language_code: Union[str, bytes, None]
     character_code: Optional[int]
 
+    _frozen = FrozenStreamAttributes
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(1)                                     # 1 byte - 8 bits
-
-        if self.length != 0:
-            self.stream_coding_type, = self._unpack_byte(1)                     # 1 byte - 8 bits
-
-            if self.stream_coding_type in {0x01, 0x02, 0x1B, 0xEA}:
-                # byte = "{0:08b}".format(self.mpls.read(1)[0])
-                # self.video_format = byte[:4], 2)
-                # self.framerate = byte[4:], 2)
-                video_format_and_framerate, = self._unpack_byte(1)              # 1 byte - 8 bits
-                self.video_format = video_format_and_framerate >> 4
-                self.framerate = video_format_and_framerate - (self.video_format << 4)
-
-            elif self.stream_coding_type == 0x24:
-                video_format_and_framerate, = self._unpack_byte(1)              # 1 byte - 8 bits
-                self.video_format = video_format_and_framerate >> 4
-                self.framerate = video_format_and_framerate - (self.video_format << 4)
+        self.load_from(self._read_section(UINT8))
 
-                dynamic_range_type_and_colorspace, = self._unpack_byte(1)       # 1 byte - 8 bits
-                self.dynamic_range_type = dynamic_range_type_and_colorspace >> 4
-                self.colorspace = dynamic_range_type_and_colorspace - (self.dynamic_range_type << 4)
-
-                self.cr_flag_and_hdr_plus_flag, = self._unpack_byte(1)           # 1 byte - 8 bits
-
-            elif self.stream_coding_type in {0x03, 0x04, 0x80, 0x81,
-                                             0x82, 0x83, 0x84, 0x85,
-                                             0x86, 0xA1, 0xA2}:
-                audio_format_and_samplerate, = self._unpack_byte(1)             # 1 byte - 8 bits
-                self.audio_format = audio_format_and_samplerate >> 4
-                self.samplerate = audio_format_and_samplerate - (self.audio_format << 4)
-
-                self.language_code = self.mpls.read(3).decode('utf-8')          # 3 bytes - 24 bits
+        self.mpls.seek(pos + self.length + 1)
 
-            elif self.stream_coding_type in {0x90, 0x91}:
-                self.language_code = self.mpls.read(3).decode('utf-8')          # 3 bytes - 24 bits
+        return self
 
-            elif self.stream_coding_type == 0x92:
-                self.character_code, = self._unpack_byte(1)                     # 1 byte - 8 bits
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT8.unpack_from(data, offset)                          # 1 byte - 8 bits
 
-                if self.character_code in CHARACTER_CODE:
-                    encoding = CHARACTER_CODE[self.character_code]
-                    self.language_code = self.mpls.read(3).decode(encoding)     # 3 bytes - 24 bits
-                else:
-                    print('WARNING: character_code was not a recognised value', self.character_code)
-                    self.language_code = self.mpls.read(3)                      # 3 bytes - 24 bits
+        if self.length != 0:
+            # Without a Repeat, the end of the buffer is checked by unpack_from
+            _LOAD_STREAM_ATTRIBUTES(self, data, offset + 1, offset + self.length + 1)
 
-        self.mpls.seek(pos + self.length + 1)
+            if self.stream_coding_type == 0x92:
+                self._decode_text_language_code(offset + 2)
 
         return self
 
+    def _decode_text_language_code(self, offset: int) -> None:
+        if self.character_code in CHARACTER_CODE:
+            self.language_code = decode_string(self.language_code, CHARACTER_CODE[self.character_code])
+        else:
+            report(self, offset, f'character_code was not a recognised value {self.character_code}')
 
 
 STREAM_CODING_TYPE: Dict[int, str] = {
@@ -209,6 +271,39 @@ CHARACTER_CODE: Dict[int, str] = {
 EntryStreams = List[Tuple[StreamEntry, StreamAttributes]]
 
 
+FrozenEntryStreams = Tuple[Tuple[FrozenStreamEntry, FrozenStreamAttributes], ...]
+
+
+class FrozenSTNTable(NamedTuple):
+    """Frozen STNTable"""
+    length: int
+    nb_prim_video_stream_entries: Optional[int]
+    nb_prim_audio_stream_entries: Optional[int]
+    nb_prim_pgs_stream_entries: Optional[int]
+    nb_prim_igs_stream_entries: Optional[int]
+    nb_seco_audio_stream_entries: Optional[int]
+    nb_seco_video_stream_entries: Optional[int]
+    nb_seco_pgs_stream_entries: Optional[int]
+    nb_dv_stream_entries: Optional[int]
+    prim_video_stream_entries: Optional[FrozenEntryStreams]
+    prim_audio_stream_entries: Optional[FrozenEntryStreams]
+    prim_pgs_stream_entries: Optional[FrozenEntryStreams]
+    seco_pgs_stream_entries: Optional[FrozenEntryStreams]
+    prim_igs_stream_entries: Optional[FrozenEntryStreams]
+    seco_audio_stream_entries: Optional[FrozenEntryStreams]
+    seco_video_stream_entries: Optional[FrozenEntryStreams]
+    dv_stream_entries: Optional[FrozenEntryStreams]
+
+
+# In the order the stream entries are stored
+_NB_STREAM_ENTRIES = (
+    'nb_prim_video_stream_entries', 'nb_prim_audio_stream_entries',
+    'nb_prim_pgs_stream_entries', 'nb_seco_pgs_stream_entries',
+    'nb_prim_igs_stream_entries', 'nb_seco_audio_stream_entries',
+    'nb_seco_video_stream_entries', 'nb_dv_stream_entries'
+)
+
+
 class STNTable(MplsObject):
     """https://github.com/lw/BluRay/wiki/STNTable"""
     length: int
@@ -231,23 +326,31 @@ class STNTable(MplsObject):
 
     stream_entries: Tuple
 
+    _frozen = FrozenSTNTable
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(2)                                     # 2 bytes - 16 bits
+        self.load_from(self._read_section(UINT16))
+
+        self.mpls.seek(pos + self.length + 2)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT16.unpack_from(data, offset)                         # 2 bytes - 16 bits
 
         if self.length != 0:
-            self.mpls.read(2)                                                   # 2 bytes - 16 bits - Reserved
-            self.nb_prim_video_stream_entries, = self._unpack_byte(1)           # 1 byte - 8 bits
-            self.nb_prim_audio_stream_entries, = self._unpack_byte(1)           # 1 byte - 8 bits
-            self.nb_prim_pgs_stream_entries, = self._unpack_byte(1)             # 1 byte - 8 bits
-            self.nb_prim_igs_stream_entries, = self._unpack_byte(1)             # 1 byte - 8 bits
-            self.nb_seco_audio_stream_entries, = self._unpack_byte(1)           # 1 byte - 8 bits
-            self.nb_seco_video_stream_entries, = self._unpack_byte(1)           # 1 byte - 8 bits
-            self.nb_seco_pgs_stream_entries, = self._unpack_byte(1)             # 1 byte - 8 bits
-            self.nb_dv_stream_entries, = self._unpack_byte(1)                   # 1 byte - 8 bits
-            self.mpls.read(4)                                                   # 4 bytes - 32 bits - Reserved
+            end = section_end(data, offset, self.length + 2)
 
+            # 2 bytes - 16 bits - Reserved
+            # 8 x 1 byte - 8 bits
+            # 4 bytes - 32 bits - Reserved
+            self.nb_prim_video_stream_entries, self.nb_prim_audio_stream_entries, \
+                self.nb_prim_pgs_stream_entries, self.nb_prim_igs_stream_entries, \
+                self.nb_seco_audio_stream_entries, self.nb_seco_video_stream_entries, \
+                self.nb_seco_pgs_stream_entries, self.nb_dv_stream_entries = _STN_TABLE.unpack_from(data, offset + 2)
+            offset += 2 + _STN_TABLE.size
 
             nbs = (
                 self.nb_prim_video_stream_entries, self.nb_prim_audio_stream_entries,
@@ -258,11 +361,18 @@ class STNTable(MplsObject):
 
             __stream_entries: List[EntryStreams] = []
 
-            for nb in nbs:
+            truncated = False
+            for name, nb in zip(_NB_STREAM_ENTRIES, nbs):
                 entry_streams: EntryStreams = []
-                for _ in range(nb):
-                    stream_entry = StreamEntry(self.mpls).load()
-                    stream_attributes = StreamAttributes(self.mpls).load()
+                for i in range(0 if truncated else nb):
+                    # Length fields of the StreamEntry and the StreamAttributes
+                    if not fits(self, name, nb, i, offset, end, 2):
+                        truncated = True
+                        break
+                    stream_entry = StreamEntry(self.mpls).load_from(data, offset)
+                    offset += stream_entry.length + 1
+                    stream_attributes = StreamAttributes(self.mpls).load_from(data, offset)
+                    offset += stream_attributes.length + 1
                     entry_streams.append((stream_entry, stream_attributes))
                 __stream_entries.append(entry_streams)
 
@@ -271,9 +381,6 @@ class STNTable(MplsObject):
                 self.prim_igs_stream_entries, self.seco_audio_stream_entries, \
                 self.seco_video_stream_entries, self.dv_stream_entries = __stream_entries
 
-
-        self.mpls.seek(pos + self.length + 2)
-
         return self
 
 
@@ -284,6 +391,50 @@ class Angle(NamedTuple):
     ref_to_stcid: int
 
 
+_LOAD_PLAY_ITEM = compile_schema('_load_play_item', (
+    Field('clip_information_filename', '5s', convert=decode_string),           # 5 bytes - 40 bits
+    Field('clip_codec_identifier', '4s', convert=decode_string),               # 4 bytes - 32 bits
+    Field('misc_flags_1', 'H', bits=(('is_multi_angle', 4, 1),)),              # 2 bytes - 16 bits - Reserved
+    Field('ref_to_stcid', 'B'),                                                 # 1 byte - 8 bits
+    Field('intime', 'I'),                                                       # 4 bytes - 32 bits
+    Field('outtime', 'I'),                                                      # 4 bytes - 32 bits
+    Field('uo_mask_table', 'Q'),                                                # 8 bytes - 64 bits
+    Field('misc_flags_2', 'B'),                                                 # 1 byte - 8 bits
+    Field('still_mode', 'B'),                                                   # 1 byte - 8 bits
+    Field('still_time', 'H', when='still_mode == 0x01'),                        # 2 bytes - 16 bits, else Reserved
+    Group('is_multi_angle', (
+        Field('nb_angles', 'B'),                                                # 1 byte - 8 bits
+        Field('misc_flags_3', 'B'),                                             # 1 byte - 8 bits
+        # nb_angles x 10 bytes:
+        Repeat('angles', 'nb_angles', (
+            Field('clip_information_filename', '5s', convert=decode_string),   # 5 bytes - 40 bits
+            Field('clip_codec_identifier', '4s', convert=decode_string),       # 4 bytes - 32 bits
+            Field('ref_to_stcid', 'B'),                                         # 1 byte - 8 bits
+        ), Angle),
+    )),
+))
+
+
+class FrozenPlayItem(NamedTuple):
+    """Frozen PlayItem"""
+    length: int
+    clip_information_filename: Optional[str]
+    clip_codec_identifier: Optional[str]
+    misc_flags_1: Optional[int]
+    is_multi_angle: Optional[bool]
+    ref_to_stcid: Optional[int]
+    intime: Optional[int]
+    outtime: Optional[int]
+    uo_mask_table: Optional[int]
+    misc_flags_2: Optional[int]
+    still_mode: Optional[int]
+    still_time: Optional[int]
+    nb_angles: Optional[int]
+    misc_flags_3: Optional[int]
+    angles: Optional[Tuple[Angle, ...]]
+    stn_table: Optional[FrozenSTNTable]
+
+
 class PlayItem(MplsObject):
     """https://github.com/lw/BluRay/wiki/PlayItem"""
     length: int
@@ -303,43 +454,48 @@ class PlayItem(MplsObject):
     angles: Optional[List[Angle]]
     stn_table: Optional[STNTable]
 
+    _frozen = FrozenPlayItem
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(2)
+        self.load_from(self._read_section(UINT16))
+
+        self.mpls.seek(pos + self.length + 2)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT16.unpack_from(data, offset)
 
         if self.length != 0:
-            self.clip_information_filename = self.mpls.read(5).decode('utf-8')  # 5 bytes - 40 bits
-            self.clip_codec_identifier = self.mpls.read(4).decode('utf-8')      # 4 bytes - 32 bits
+            offset = self._load_play_item(data, offset + 2, section_end(data, offset, self.length + 2))
+            self.stn_table = STNTable(self.mpls).load_from(data, offset)
 
-            self.misc_flags_1, = self._unpack_byte(2)                           # 2 bytes - 16 bits - Reserved
-            self.is_multi_angle = bool(self.misc_flags_1 & (1 << 16 - 1 - 11))  # Condition
+        return self
 
-            self.ref_to_stcid, = self._unpack_byte(1)                           # 1 byte - 8 bits
-            self.intime, = self._unpack_byte(4)                                 # 4 bytes - 32 bits
-            self.outtime, = self._unpack_byte(4)                                # 4 bytes - 32 bits
-            self.uo_mask_table, = self._unpack_byte(8)                          # 8 bytes - 64 bits
-            self.misc_flags_2, = self._unpack_byte(1)                           # 1 byte - 8 bits
+    # (data, offset, end) -> offset of the STNTable, decoding the fields preceding it
+    _load_play_item = _LOAD_PLAY_ITEM
 
-            self.still_mode, = self._unpack_byte(1)                             # 1 byte - 8 bits
-            if self.still_mode == 0x01:
-                self.still_time, = self._unpack_byte(2)                         # 2 bytes - 16 bits
-            else:
-                self.mpls.read(2)                                               # 2 bytes - 16 bits - Reserved
 
-            if self.is_multi_angle:
-                self.nb_angles, = self._unpack_byte(1)                          # 1 byte - 8 bits
-                self.misc_flags_3, = self._unpack_byte(1)                       # 1 byte - 8 bits
-                self.angles = []
+class LazyPlayItem(LazyMplsObject, PlayItem):
+    """PlayItem decoding its STNTable on first access"""
+    _lazy_attributes = ('stn_table',)
+    _stn_table_offset: Optional[int]
 
-                for _ in range(self.nb_angles):
-                    clip_info = self.mpls.read(5).decode('utf-8')               # 5 bytes - 40 bits
-                    clip_codec = self.mpls.read(4).decode('utf-8')              # 4 bytes - 32 bits
-                    ref, = self._unpack_byte(1)                                 # 1 byte - 8 bits
-                    self.angles.append(Angle(clip_info, clip_codec, ref))
+    def load_from(self, data: Buffer, offset: int = 0):
+        self._data = data
+        self._stn_table_offset = None
 
-            self.stn_table = STNTable(self.mpls).load()
+        self.length, = UINT16.unpack_from(data, offset)
 
-        self.mpls.seek(pos + self.length + 2)
+        if self.length != 0:
+            self._stn_table_offset = self._load_play_item(data, offset + 2, section_end(data, offset, self.length + 2))
 
         return self
+
+    @cached_property
+    def stn_table(self) -> STNTable:  # type: ignore[override]
+        if self._stn_table_offset is None:
+            raise AttributeError('stn_table')
+        return load_section(STNTable(self.mpls), self._data, self._stn_table_offset)
@@ -1,13 +1,27 @@
 """https://github.com/lw/BluRay/wiki/PlayList"""
 
-__all__ = ['Playlist']
+__all__ = ['Playlist', 'LazyPlaylist', 'FrozenPlaylist']
 
 
-from typing import List, Optional
+from functools import cached_property
+from struct import Struct
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, overload
 
-from .movie_playlist import MplsObject
-from .play_item import PlayItem
-from .sub_path import SubPath
+from .diagnostics import fits, load_section, section_end
+from .movie_playlist import UINT16, UINT32, Buffer, LazyMplsObject, MplsObject
+from .play_item import FrozenPlayItem, LazyPlayItem, PlayItem
+from .sub_path import FrozenSubPath, SubPath
+
+_PLAYLIST = Struct('>2xHH')
+
+
+class FrozenPlaylist(NamedTuple):
+    """Frozen Playlist"""
+    length: int
+    nb_play_items: Optional[int]
+    nb_sub_paths: Optional[int]
+    play_items: Optional[Tuple[FrozenPlayItem, ...]]
+    sub_paths: Optional[Tuple[FrozenSubPath, ...]]
 
 
 class Playlist(MplsObject):
@@ -18,19 +32,128 @@ class Playlist(MplsObject):
     play_items: Optional[List[PlayItem]]
     sub_paths: Optional[List[SubPath]]
 
+    _frozen = FrozenPlaylist
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(4)                                     # 4 bytes - 32 bits
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
 
         if self.length != 0:
-            self.mpls.read(2)                                                   # 2 bytes - 16 bits
-            self.nb_play_items, = self._unpack_byte(2)                          # 2 bytes - 16 bits
-            self.nb_sub_paths, = self._unpack_byte(2)                           # 2 bytes - 16 bits
+            end = section_end(data, offset, self.length + 4)
 
-            self.play_items = [PlayItem(self.mpls).load() for _ in range(self.nb_play_items)]
-            self.sub_paths = [SubPath(self.mpls).load() for _ in range(self.nb_sub_paths)]
+            # 2 bytes - 16 bits - Reserved
+            # 2 bytes - 16 bits
+            # 2 bytes - 16 bits
+            self.nb_play_items, self.nb_sub_paths = _PLAYLIST.unpack_from(data, offset + 4)
+            offset += 4 + _PLAYLIST.size
 
-        self.mpls.seek(pos + self.length + 4)
+            self.play_items = []
+            for i in range(self.nb_play_items):
+                if not fits(self, 'nb_play_items', self.nb_play_items, i, offset, end, 2):
+                    break
+                play_item = PlayItem(self.mpls).load_from(data, offset)
+                self.play_items.append(play_item)
+                offset += play_item.length + 2
+
+            self.sub_paths = []
+            for i in range(self.nb_sub_paths):
+                if not fits(self, 'nb_sub_paths', self.nb_sub_paths, i, offset, end, 4):
+                    break
+                sub_path = SubPath(self.mpls).load_from(data, offset)
+                self.sub_paths.append(sub_path)
+                offset += sub_path.length + 4
 
         return self
+
+
+class LazyPlaylist(LazyMplsObject, Playlist):
+    """
+        Playlist only recording the offsets of its sections.
+        PlayItems, their STNTable and SubPaths are decoded on first access and cached.
+        The buffer given to `load_from` must stay alive as long as this object.
+    """
+    _lazy_attributes = ('sub_paths',)
+    _sub_paths_offset: Optional[int]
+    _end: int
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self._data = data
+        self._sub_paths_offset = None
+
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
+
+        if self.length != 0:
+            self._end = section_end(data, offset, self.length + 4)
+
+            self.nb_play_items, self.nb_sub_paths = _PLAYLIST.unpack_from(data, offset + 4)
+            offset += 4 + _PLAYLIST.size
+
+            offsets: List[int] = []
+            for i in range(self.nb_play_items):
+                if not fits(self, 'nb_play_items', self.nb_play_items, i, offset, self._end, 2):
+                    break
+                offsets.append(offset)
+                offset += UINT16.unpack_from(data, offset)[0] + 2
+
+            self.play_items = _LazyPlayItems(self, offsets)  # type: ignore[assignment]
+            self._sub_paths_offset = offset
+
+        return self
+
+    @cached_property
+    def sub_paths(self) -> List[SubPath]:  # type: ignore[override]
+        if self._sub_paths_offset is None:
+            raise AttributeError('sub_paths')
+
+        offset = self._sub_paths_offset
+        sub_paths = []
+        for i in range(self.nb_sub_paths):
+            if not fits(self, 'nb_sub_paths', self.nb_sub_paths, i, offset, self._end, 4):
+                break
+            sub_path = load_section(SubPath(self.mpls), self._data, offset)
+            sub_paths.append(sub_path)
+            offset += sub_path.length + 4
+        return sub_paths
+
+
+class _LazyPlayItems(Sequence[PlayItem]):
+    """Sequence of LazyPlayItem decoded on first access"""
+
+    def __init__(self, playlist: LazyPlaylist, offsets: List[int]) -> None:
+        self._playlist = playlist
+        self._offsets = offsets
+        self._play_items: List[Optional[PlayItem]] = [None] * len(offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, i: int) -> PlayItem: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[PlayItem]: ...
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        play_item = self._play_items[i]
+        if play_item is None:
+            play_item = self._play_items[i] = load_section(
+                LazyPlayItem(self._playlist.mpls), self._playlist._data, self._offsets[i]
+            )
+        return play_item
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return list, (list(self),)
@@ -1,7 +1,9 @@
 """https://github.com/lw/BluRay/wiki/PlayListMark"""
-from typing import List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
-from .movie_playlist import MplsObject
+from .diagnostics import section_end
+from .movie_playlist import UINT32, Buffer, MplsObject
+from .schema import Field, Repeat, compile_schema
 
 
 class PlaylistMark(NamedTuple):
@@ -13,36 +15,66 @@ class PlaylistMark(NamedTuple):
     duration: int
 
 
+_LOAD_PLAYLIST_MARKS = compile_schema('_load_playlist_marks', (
+    Field('nb_playlist_marks', 'H'),                                            # 2 bytes - 16 bits
+    # nb_playlist_marks x 14 bytes:
+    Repeat('playlist_marks', 'nb_playlist_marks', (
+        Field(None, 'x'),                                                       # 1 byte - 8 bits - Reserved
+        Field('mark_type', 'B'),                                                # 1 byte - 8 bits
+        Field('ref_to_play_item_id', 'H'),                                      # 2 bytes - 16 bits
+        Field('mark_timestamp', 'I'),                                           # 4 bytes - 32 bits
+        Field('entry_espid', 'H'),                                              # 2 bytes - 16 bits
+        Field('duration', 'I'),                                                 # 4 bytes - 32 bits
+    ), PlaylistMark),
+))
+
+
+PLAYLIST_MARK_DTYPE = [
+    ('mark_type', 'u1'),
+    ('ref_to_play_item_id', 'u2'),
+    ('mark_timestamp', 'u4'),
+    ('entry_espid', 'u2'),
+    ('duration', 'u4'),
+]
+
+
+class FrozenPlaylistMarks(NamedTuple):
+    """Frozen PlaylistMarks"""
+    length: int
+    nb_playlist_marks: Optional[int]
+    playlist_marks: Optional[Tuple[PlaylistMark, ...]]
+
+
 class PlaylistMarks(MplsObject):
     """https://github.com/lw/BluRay/wiki/PlayListMark"""
     length: int
     nb_playlist_marks: Optional[int]
     playlist_marks: Optional[List[PlaylistMark]]
 
+    _frozen = FrozenPlaylistMarks
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(4)                                     # 4 bytes - 32 bits
+        self.load_from(self._read_section(UINT32))
 
-        if self.length != 0:
-            self.nb_playlist_marks, = self._unpack_byte(2)                      # 2 bytes - 16 bits
-
-            self.playlist_marks = []
+        self.mpls.seek(pos + self.length + 4)
 
-            if self.nb_playlist_marks > 0:
-                for _ in range(self.nb_playlist_marks):
-                    self.mpls.read(1)                                           # 1 byte - 8 bits - Reserved
-                    mark_type, = self._unpack_byte(1)                           # 1 byte - 8 bits
-                    ref_to_play_item_id, = self._unpack_byte(2)                 # 2 bytes - 16 bits
-                    mark_timestamp, = self._unpack_byte(4)                      # 4 bytes - 32 bits
-                    entry_espid, = self._unpack_byte(2)                         # 2 bytes - 16 bits
-                    duration, = self._unpack_byte(4)                            # 4 bytes - 32 bits
+        return self
 
-                    self.playlist_marks.append(
-                        PlaylistMark(mark_type, ref_to_play_item_id,
-                                     mark_timestamp, entry_espid, duration)
-                    )
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
 
-        self.mpls.seek(pos + self.length + 4)
+        if self.length != 0:
+            _LOAD_PLAYLIST_MARKS(self, data, offset + 4, section_end(data, offset, self.length + 4))
 
         return self
+
+    def to_numpy(self):
+        """
+            Returns the playlist marks as a NumPy structured array
+            with one field per PlaylistMark attribute. Requires numpy.
+        """
+        import numpy as np
+
+        return np.array(self.playlist_marks or [], dtype=PLAYLIST_MARK_DTYPE)
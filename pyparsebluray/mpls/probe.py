@@ -0,0 +1,86 @@
+"""Minimal-I/O probe of a playlist"""
+
+__all__ = ['PlaylistProbe', 'probe_mpls', 'probes_mpls', 'probe_mpls_file']
+
+import os
+from io import BufferedReader
+from struct import Struct
+from typing import Callable, List, NamedTuple, Tuple, Union
+
+from .movie_playlist import Buffer
+
+_HEADER = Struct('>8xII')
+_PLAYLIST = Struct('>I2xH')
+_PLAY_ITEM = Struct('>H5s4x3xII')
+_PLAYLIST_MARKS = Struct('>IH')
+
+
+class PlaylistProbe(NamedTuple):
+    """Summary of a playlist used to rank candidate playlists"""
+    duration: int                                                               # 45 kHz
+    nb_play_items: int
+    clip_information_filenames: Tuple[str, ...]
+    nb_playlist_marks: int
+
+
+def _probe(read: Callable[[int, int], Buffer]) -> PlaylistProbe:
+    playlist_start_address, playlist_mark_start_address = _HEADER.unpack(read(0, _HEADER.size))
+
+    length, nb_play_items = _PLAYLIST.unpack(read(playlist_start_address, _PLAYLIST.size))
+    if length == 0:
+        nb_play_items = 0
+
+    duration = 0
+    clip_information_filenames: List[str] = []
+    offset = playlist_start_address + _PLAYLIST.size + 2                        # nb_sub_paths
+    for _ in range(nb_play_items):
+        # Only the fields preceding uo_mask_table are read, the rest of the PlayItem
+        # and its STNTable are jumped over with the length prefix
+        length, clip_information_filename, intime, outtime = _PLAY_ITEM.unpack(read(offset, _PLAY_ITEM.size))
+        clip_information_filenames.append(clip_information_filename.decode('utf-8'))
+        duration += outtime - intime
+        offset += length + 2
+
+    length, nb_playlist_marks = _PLAYLIST_MARKS.unpack(read(playlist_mark_start_address, _PLAYLIST_MARKS.size))
+    if length == 0:
+        nb_playlist_marks = 0
+
+    return PlaylistProbe(duration, nb_play_items, tuple(clip_information_filenames), nb_playlist_marks)
+
+
+def _read_exactly(data: bytes, size: int) -> bytes:
+    if len(data) != size:
+        raise EOFError(f'PlaylistProbe: expected {size} bytes, got {len(data)}')
+    return data
+
+
+def probe_mpls(mpls: BufferedReader) -> PlaylistProbe:
+    """
+        Returns the duration, play item count, clips and mark count of a MPLS file
+        reading only the fields needed.
+        The position of `mpls` is left unchanged if the file descriptor supports positional reads.
+    """
+    if hasattr(os, 'pread'):
+        try:
+            fd = mpls.fileno()
+        except (AttributeError, OSError):
+            pass
+        else:
+            return _probe(lambda offset, size: _read_exactly(os.pread(fd, size, offset), size))
+
+    def read(offset: int, size: int) -> bytes:
+        mpls.seek(offset, os.SEEK_SET)
+        return _read_exactly(mpls.read(size), size)
+    return _probe(read)
+
+
+def probes_mpls(data: Buffer) -> PlaylistProbe:
+    """Probes an in-memory MPLS file"""
+    view = memoryview(data)
+    return _probe(lambda offset, size: view[offset:offset + size])
+
+
+def probe_mpls_file(path: Union[str, os.PathLike]) -> PlaylistProbe:
+    """Opens a MPLS file without buffering and probes it with positional reads"""
+    with open(path, 'rb', buffering=0) as mpls:
+        return probe_mpls(mpls)  # type: ignore[arg-type]
@@ -0,0 +1,208 @@
+"""
+    Declarative layouts of the structures, compiled into specialized decoding functions.
+
+    A schema is a tuple of:
+        Field   a named value, or reserved bytes if unnamed, optionally split into bit fields
+        Group   fields present only if a condition on the previous ones holds
+        Repeat  a list of records, its count being a previous field
+
+    Consecutive fields are merged into one Struct and the generated function assigns
+    the values to the attributes of the decoded object, in schema order.
+"""
+
+__all__ = ['Field', 'Group', 'Repeat', 'Schema', 'compile_schema']
+
+from functools import lru_cache
+from itertools import starmap
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .diagnostics import cap_count, fits
+from .movie_playlist import Buffer, iter_unpack_from
+
+
+class Field(NamedTuple):
+    """
+        Value of a struct format such as 'B', 'I' or '5s'; unnamed fields are reserved bytes ('x', '2x', ...)
+        and fields named with a leading underscore are only split into their bits.
+        `when` is a Python expression over the previous fields, the field being reserved if it's false.
+        `bits` are (name, shift, width) of the bit fields split from the value, assigned after it;
+        1-bit fields are bools.
+        `convert` is applied to the value before it's assigned.
+    """
+    name: Optional[str]
+    format: str
+    when: Optional[str] = None
+    bits: Tuple[Tuple[str, int, int], ...] = ()
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+class Group(NamedTuple):
+    """Members read only if `when`, a Python expression over the previous fields, is true"""
+    when: str
+    members: Tuple['Member', ...]
+
+
+class Repeat(NamedTuple):
+    """
+        `count` records of `fields`, each built by `factory` called with the record values,
+        count that is capped to the records fitting before the end of the section.
+        Records may hold a Repeat, its list being passed to `factory` in place.
+    """
+    name: str
+    count: str
+    fields: Tuple[Union[Field, 'Repeat'], ...]
+    factory: Callable[..., Any]
+
+
+Member = Union[Field, Group, Repeat]
+Schema = Tuple[Member, ...]
+
+# (obj, data, offset, end) -> offset following the decoded fields
+Decoder = Callable[[Any, Buffer, int, int], int]
+
+
+class _Compiler:
+    lines: List[str]
+    namespace: Dict[str, Any]
+    depth: int
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.namespace = {
+            'StructError': StructError, 'cap_count': cap_count, 'fits': fits,
+            'iter_unpack_from': iter_unpack_from, 'starmap': starmap
+        }
+        self.depth = 0
+
+    def constant(self, value: Any) -> str:
+        for name, known in self.namespace.items():
+            if known is value:
+                return name
+        name = f'_k{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def members(self, members: Schema, indent: str, target: str = '_obj.') -> None:
+        """Decodes `members`, assigning their values to the attributes of the object or to locals if `target` is ''"""
+        run: List[Field] = []
+        for member in members:
+            if isinstance(member, Field):
+                run.append(member)
+                continue
+            self.fields(run, indent, target)
+            run = []
+            if isinstance(member, Group):
+                self.lines.append(f'{indent}if {member.when}:')
+                self.members(member.members, indent + '    ', target)
+            else:
+                self.repeat(member, indent, target)
+        self.fields(run, indent, target)
+
+    def fields(self, fields: List[Field], indent: str, target: str) -> None:
+        """Unpacks consecutive fields with a single Struct, if they fit before the end of the section"""
+        if not fields:
+            return
+        record = Struct('>' + ''.join(field.format for field in fields))
+        self.lines.append(f'{indent}if _offset + {record.size} > _end:')
+        self.lines.append(
+            f'{indent}    raise StructError(f"{record.size} bytes required at {{_offset}} but the section ends at {{_end}}")'
+        )
+        names = [field.name for field in fields if field.name is not None]
+        if names:
+            self.lines.append(f'{indent}{", ".join(names)}, = {self.constant(record)}.unpack_from(_data, _offset)')
+        self.lines.append(f'{indent}_offset += {record.size}')
+
+        for field in fields:
+            if field.name is None:
+                continue
+            # Underscored fields are only split into their bits, locals are only reassigned once converted
+            if field.name.startswith('_') or not (target or field.convert):
+                assigned = None
+            else:
+                assigned = f'{target}{field.name}'
+            body = indent
+            if field.when is not None and (assigned or field.bits):
+                self.lines.append(f'{indent}if {field.when}:')
+                body += '    '
+            if assigned:
+                value = field.name if field.convert is None else f'{self.constant(field.convert)}({field.name})'
+                self.lines.append(f'{body}{assigned} = {value}')
+            for name, shift, width in field.bits:
+                bits = f'{field.name} >> {shift} & {(1 << width) - 1:#x}'
+                self.lines.append(f'{body}{name}{f" = {target}{name}" if target else ""} = '
+                                  f'{f"bool({bits})" if width == 1 else bits}')
+
+    def repeat(self, repeat: Repeat, indent: str, target: str) -> None:
+        if any(isinstance(member, Repeat) for member in repeat.fields):
+            self.variable_repeat(repeat, indent, target)
+            return
+        record = Struct('>' + ''.join(field.format for field in repeat.fields))  # type: ignore[union-attr]
+        struct_name = self.constant(record)
+        self.lines.append(
+            f'{indent}_count = cap_count(_obj, {repeat.count!r}, {repeat.count}, _offset, _end, {record.size})'
+        )
+        records = f'iter_unpack_from({struct_name}, _data, _offset, _count)'
+        named = [field for field in repeat.fields if field.name is not None]
+        factory = self.constant(repeat.factory)
+        if any(field.convert is not None for field in named):  # type: ignore[union-attr]
+            values = ', '.join(
+                field.name if field.convert is None else f'{self.constant(field.convert)}({field.name})'  # type: ignore
+                for field in named
+            )
+            targets = ', '.join(field.name for field in named)  # type: ignore[misc]
+            self.lines.append(f'{indent}{target}{repeat.name} = [{factory}({values}) for {targets}, in {records}]')
+        elif hasattr(repeat.factory, '_make'):
+            # NamedTuple records are built from the unpacked tuples without unpacking them
+            make = self.constant(repeat.factory._make)
+            self.lines.append(f'{indent}{target}{repeat.name} = list(map({make}, {records}))')
+        else:
+            self.lines.append(f'{indent}{target}{repeat.name} = list(starmap({factory}, {records}))')
+        self.lines.append(f'{indent}_offset += _count * {record.size}')
+
+    def variable_repeat(self, repeat: Repeat, indent: str, target: str) -> None:
+        """Records holding a Repeat are decoded one by one, while their fixed-size start fits in the section"""
+        self.depth += 1
+        items, index = f'_items{self.depth}', f'_i{self.depth}'
+        start: List[str] = []
+        for member in repeat.fields:
+            if not isinstance(member, Field):
+                break
+            start.append(member.format)
+        self.lines.append(f'{indent}{target}{repeat.name} = {items} = []')
+        self.lines.append(f'{indent}for {index} in range({repeat.count}):')
+        self.lines.append(
+            f'{indent}    if not fits(_obj, {repeat.count!r}, {repeat.count}, {index}, _offset, _end, '
+            f'{Struct(">" + "".join(start)).size}):'
+        )
+        self.lines.append(f'{indent}        break')
+        self.members(repeat.fields, indent + '    ', '')
+        values = ', '.join(
+            member.name for member in repeat.fields
+            if member.name is not None and not member.name.startswith('_')
+        )
+        self.lines.append(f'{indent}    {items}.append({self.constant(repeat.factory)}({values}))')
+        self.depth -= 1
+
+
+@lru_cache(maxsize=None)
+def compile_schema(name: str, schema: Schema) -> Decoder:
+    """
+        Returns the function decoding `schema` at `offset` into the attributes of an object,
+        `end` being the end of the section, which bounds the repeated records
+        and past which fixed fields raise a struct.error, and returning the offset following the decoded fields.
+        Its `size` is the one of the fields always present.
+        Compiled functions are cached by name and schema, so compiling the same schema again is free.
+    """
+    compiler = _Compiler()
+    compiler.members(schema, '    ')
+    source = '\n'.join([f'def {name}(_obj, _data, _offset, _end):', *compiler.lines, '    return _offset'])
+    exec(compile(source, f'<schema {name}>', 'exec'), compiler.namespace)  # pylint: disable=exec-used
+
+    decoder = compiler.namespace[name]
+    decoder.size = Struct('>' + ''.join(
+        member.format for member in schema if isinstance(member, Field)
+    )).size
+    decoder.source = source
+    return decoder
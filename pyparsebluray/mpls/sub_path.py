@@ -1,11 +1,13 @@
 """https://github.com/lw/BluRay/wiki/SubPath"""
 
-__all__ = ['SubPath']
+__all__ = ['SubPath', 'FrozenSubPath', 'FrozenSubPlayItem']
 
 
-from typing import List, NamedTuple, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
-from .movie_playlist import MplsObject
+from .diagnostics import fits, section_end
+from .movie_playlist import UINT16, UINT32, Buffer, MplsObject, decode_string
+from .schema import Field, Group, Repeat, compile_schema
 
 
 class MultiClipEntry(NamedTuple):
@@ -15,6 +17,44 @@ class MultiClipEntry(NamedTuple):
     ref_to_stcid: int
 
 
+_LOAD_SUB_PLAY_ITEM = compile_schema('_load_sub_play_item', (
+    Field('clip_information_filename', '5s', convert=decode_string),           # 5 bytes - 40 bits
+    Field('clip_codec_identifier', '4s', convert=decode_string),               # 4 bytes - 32 bits
+    Field('misc_flags_1', 'I', bits=(('is_multi_clip_entries', 4, 1),)),       # 4 bytes - 32 bits
+    Field('ref_to_stcid', 'B'),                                                 # 1 byte - 8 bits
+    Field('intime', 'I'),                                                       # 4 bytes - 32 bits
+    Field('outtime', 'I'),                                                      # 4 bytes - 32 bits
+    Field('sync_play_item_id', 'H'),                                            # 2 bytes - 16 bits
+    Field('sync_start_pts', 'I'),                                               # 4 bytes - 32 bits
+    Group('is_multi_clip_entries', (
+        Field('nb_multi_clip_entries', 'B'),                                    # 1 byte - 8 bits
+        Field(None, 'x'),                                                       # 1 byte - 8 bits - Reserved
+        # nb_multi_clip_entries x 10 bytes:
+        Repeat('multi_clip_entries', 'nb_multi_clip_entries', (
+            Field('clip_information_filename', '5s', convert=decode_string),   # 5 bytes - 40 bits
+            Field('clip_codec_identifier', '4s', convert=decode_string),       # 4 bytes - 32 bits
+            Field('ref_to_stcid', 'B'),                                         # 1 byte - 8 bits
+        ), MultiClipEntry),
+    )),
+))
+
+
+class FrozenSubPlayItem(NamedTuple):
+    """Frozen SubPlayItem"""
+    length: int
+    clip_information_filename: Optional[str]
+    clip_codec_identifier: Optional[str]
+    misc_flags_1: Optional[int]
+    is_multi_clip_entries: Optional[bool]
+    ref_to_stcid: Optional[int]
+    intime: Optional[int]
+    outtime: Optional[int]
+    sync_play_item_id: Optional[int]
+    sync_start_pts: Optional[int]
+    nb_multi_clip_entries: Optional[int]
+    multi_clip_entries: Optional[Tuple[MultiClipEntry, ...]]
+
+
 class SubPlayItem(MplsObject):
     """https://github.com/lw/BluRay/wiki/SubPlayItem"""
     length: int
@@ -30,36 +70,43 @@ class SubPlayItem(MplsObject):
     nb_multi_clip_entries: Optional[int]
     multi_clip_entries: Optional[List[MultiClipEntry]]
 
+    _frozen = FrozenSubPlayItem
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(2)                                     # 2 bytes - 16 bits
-
-        if self.length != 0:
-            self.clip_information_filename = self.mpls.read(5).decode('utf-8')  # 5 bytes - 40 bits
-            self.clip_codec_identifier = self.mpls.read(4).decode('utf-8')      # 4 bytes - 32 bits
-            self.misc_flags_1, = self._unpack_byte(4)                           # 4 bytes - 32 bits
-            self.is_multi_clip_entries = bool(self.misc_flags_1 & (1 << 32 - 1 - 27))
-            self.ref_to_stcid, = self._unpack_byte(1)                           # 1 byte - 8 bits
-            self.intime, = self._unpack_byte(4)                                 # 4 bytes - 32 bits
-            self.outtime, = self._unpack_byte(4)                                # 4 bytes - 32 bits
-            self.sync_play_item_id, = self._unpack_byte(2)                      # 2 bytes - 16 bits
-            self.sync_start_pts, = self._unpack_byte(4)                         # 4 bytes - 32 bits
-
-            if self.is_multi_clip_entries:
-                self.nb_multi_clip_entries, = self._unpack_byte(1)
-                self.mpls.read(1)
-
-                for _ in range(self.nb_multi_clip_entries):
-                    clip_info = self.mpls.read(5).decode('utf-8')               # 5 bytes - 40 bits
-                    clip_codec = self.mpls.read(4).decode('utf-8')              # 4 bytes - 32 bits
-                    ref, = self._unpack_byte(1)                                 # 1 byte - 8 bits
-                    self.multi_clip_entries.append(MultiClipEntry(clip_info, clip_codec, ref))
+        self.load_from(self._read_section(UINT16))
 
         self.mpls.seek(pos + self.length + 2)
 
         return self
 
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT16.unpack_from(data, offset)                         # 2 bytes - 16 bits
+
+        if self.length != 0:
+            _LOAD_SUB_PLAY_ITEM(self, data, offset + 2, section_end(data, offset, self.length + 2))
+
+        return self
+
+
+_LOAD_SUB_PATH = compile_schema('_load_sub_path', (
+    Field(None, 'x'),                                                           # 1 byte - 8 bits - Reserved
+    Field('sub_path_type', 'B'),                                                # 1 byte - 8 bits
+    Field('misc_flags_1', 'H'),                                                 # 2 bytes - 16 bits
+    Field(None, 'x'),                                                           # 1 byte - 8 bits - Reserved
+    Field('nb_sub_play_items', 'B'),                                            # 1 byte - 8 bits
+))
+
+
+class FrozenSubPath(NamedTuple):
+    """Frozen SubPath"""
+    length: int
+    sub_path_type: Optional[int]
+    misc_flags_1: Optional[int]
+    nb_sub_play_items: Optional[int]
+    sub_play_items: Optional[Tuple[FrozenSubPlayItem, ...]]
+
 
 class SubPath(MplsObject):
     """https://github.com/lw/BluRay/wiki/SubPath"""
@@ -69,20 +116,31 @@ class SubPath(MplsObject):
     nb_sub_play_items: Optional[int]
     sub_play_items: Optional[List[SubPlayItem]]
 
+    _frozen = FrozenSubPath
+
     def load(self):
         pos = self._get_pos()
 
-        self.length, = self._unpack_byte(4)                                     # 4 bytes - 32 bits
+        self.load_from(self._read_section(UINT32))
+
+        self.mpls.seek(pos + self.length + 4)
+
+        return self
+
+    def load_from(self, data: Buffer, offset: int = 0):
+        self.length, = UINT32.unpack_from(data, offset)                         # 4 bytes - 32 bits
 
         if self.length != 0:
-            self.mpls.read(1)
-            self.sub_path_type, = self._unpack_byte(1)                          # 1 byte - 8 bits
-            self.misc_flags_1, = self._unpack_byte(2)                           # 2 bytes - 16 bits
-            self.mpls.read(1)
-            self.nb_sub_play_items, = self._unpack_byte(1)                      # 1 byte - 8 bits
+            end = section_end(data, offset, self.length + 4)
 
-            self.sub_play_items = [SubPlayItem(self.mpls).load() for _ in range(self.nb_sub_play_items)]
+            offset = _LOAD_SUB_PATH(self, data, offset + 4, end)
 
-        self.mpls.seek(pos + self.length + 4)
+            self.sub_play_items = []
+            for i in range(self.nb_sub_play_items):
+                if not fits(self, 'nb_sub_play_items', self.nb_sub_play_items, i, offset, end, 2):
+                    break
+                sub_play_item = SubPlayItem(self.mpls).load_from(data, offset)
+                self.sub_play_items.append(sub_play_item)
+                offset += sub_play_item.length + 2
 
         return self
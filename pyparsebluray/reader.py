@@ -0,0 +1,253 @@
+"""Cursor-free readers decoding at explicit offsets, safe to share between threads"""
+
+__all__ = ['PositionalReader', 'FileReader', 'BufferReader',
+           'load_mpls_at', 'load_clpi_at', 'load_ext_data_blocks', 'scan_playlists_threaded']
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from struct import Struct
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from .clpi import CPI, ClipInfo, ClipInformation, ClipMark, ClpiFile, ProgramInfo, SequenceInfo
+from .mpls import AppInfoPlaylist, ExtensionData, LazyPlaylist, MoviePlaylist, MplsFile, Playlist, PlaylistMarks
+from .mpls.diagnostics import load_section, recover, report
+from .mpls.ext_data_blocks import decode_ext_data_block
+from .mpls.extension_data import ExtensionDataEntry
+from .mpls.load import list_playlists
+from .mpls.movie_playlist import UINT32, Buffer, MplsObject
+
+# Fixed-size header of MPLS and CLPI files, the first section following it
+_HEADER_SIZE = 40
+# data_block_start_address and nb_ext_data_entries of ExtensionData, and the size of its entries
+_EXTENSION_DATA_HEADER_SIZE = 8
+_ENTRY_SIZE = 12
+
+
+class PositionalReader(ABC):
+    """
+        Abstract reader without a cursor.
+        Every read states its offset, so one reader can be shared between threads.
+    """
+
+    @abstractmethod
+    def read_at(self, offset: int, size: int) -> Buffer:
+        """Returns exactly `size` bytes starting at `offset`, raises EOFError if the file is shorter"""
+
+    def read_section(self, offset: int, length: Struct) -> Buffer:
+        """Reads the length-prefixed section at `offset`, its length field included"""
+        prefix = self.read_at(offset, length.size)
+        size, = length.unpack(prefix)
+        if size == 0:
+            return prefix
+        return bytes(prefix) + bytes(self.read_at(offset + length.size, size))
+
+    def __enter__(self) -> 'PositionalReader':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the underlying resource"""
+
+
+def _read_exactly(data: Buffer, size: int, offset: int) -> Buffer:
+    if len(data) != size:
+        raise EOFError(f'PositionalReader: expected {size} bytes at {offset}, got {len(data)}')
+    return data
+
+
+class FileReader(PositionalReader):
+    """
+        Reads a file descriptor with os.pread, leaving its position untouched.
+        `file` is either a path, opened and closed by the reader, or a descriptor owned by the caller.
+        Where os.pread isn't available, reads are serialized by a lock around a seek and a read.
+    """
+    _fd: int
+    _owned: bool
+    _lock: Optional[threading.Lock]
+
+    def __init__(self, file: Union[str, os.PathLike, int]) -> None:
+        if isinstance(file, int):
+            self._fd, self._owned = file, False
+        else:
+            self._fd, self._owned = os.open(file, os.O_RDONLY | getattr(os, 'O_BINARY', 0)), True
+        self._lock = None if hasattr(os, 'pread') else threading.Lock()
+
+    def fileno(self) -> int:
+        """Returns the file descriptor"""
+        return self._fd
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        if self._lock is None:
+            return _read_exactly(os.pread(self._fd, size, offset), size, offset)
+        with self._lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            return _read_exactly(os.read(self._fd, size), size, offset)
+
+    def close(self) -> None:
+        if self._owned and self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class BufferReader(PositionalReader):
+    """Reads an in-memory file, such as bytes or a mmap, without copying it"""
+    _view: memoryview
+
+    def __init__(self, data: Buffer) -> None:
+        self._view = memoryview(data)
+
+    def read_at(self, offset: int, size: int) -> memoryview:
+        return _read_exactly(self._view[offset:offset + size], size, offset)
+
+    def read_section(self, offset: int, length: Struct) -> memoryview:
+        size, = length.unpack(self.read_at(offset, length.size))
+        return self.read_at(offset, length.size + size)
+
+
+Sections = List[Tuple[Type[MplsObject], int]]
+_H = TypeVar('_H', MoviePlaylist, ClipInformation)
+
+
+def _load_header(reader: PositionalReader, header: _H) -> _H:
+    try:
+        data = reader.read_at(0, _HEADER_SIZE)
+    except EOFError as error:
+        return recover(header, 0, error, required=True)
+    return load_section(header, data, 0, required=True)
+
+
+def _load_section(reader: PositionalReader, cls: Type[MplsObject], offset: int) -> MplsObject:
+    section = cls()
+    try:
+        data = reader.read_section(offset, UINT32)
+    except EOFError as error:
+        return recover(section, offset, error)
+    return load_section(section, data, 0)
+
+
+def _load_sections(reader: PositionalReader, sections: Sections, executor: Optional[Executor]) -> List[MplsObject]:
+    """Decodes `sections`, each from its own read, in `executor` if given"""
+    if executor is None:
+        return [_load_section(reader, cls, offset) for cls, offset in sections]
+    # Each task runs in a copy of the caller's context, so it sees the current parse_mode
+    futures = [executor.submit(copy_context().run, _load_section, reader, cls, offset) for cls, offset in sections]
+    return [future.result() for future in futures]
+
+
+def load_mpls_at(reader: PositionalReader, lazy: bool = False, executor: Optional[Executor] = None) -> MplsFile:
+    """
+        Returns all the sections of a MPLS file read through a PositionalReader.
+        After the header, every section is read and decoded independently,
+        in `executor` if given, typically a ThreadPoolExecutor.
+        If `lazy` is True, the playlist is a LazyPlaylist.
+    """
+    header = _load_header(reader, MoviePlaylist())
+    sections: Sections = [
+        (AppInfoPlaylist, _HEADER_SIZE),
+        (LazyPlaylist if lazy else Playlist, header.playlist_start_address),
+        (PlaylistMarks, header.playlist_mark_start_address),
+    ]
+    if header.extension_data_start_address != 0:
+        sections.append((ExtensionData, header.extension_data_start_address))
+
+    appinfo, pls, marks, *extension = _load_sections(reader, sections, executor)
+    return MplsFile(header, appinfo, pls, marks, extension[0] if extension else None)  # type: ignore[arg-type]
+
+
+def load_clpi_at(reader: PositionalReader, executor: Optional[Executor] = None) -> ClpiFile:
+    """
+        Returns all the sections of a CLPI file read through a PositionalReader.
+        After the header, every section is read and decoded independently, in `executor` if given.
+    """
+    header = _load_header(reader, ClipInformation())
+    sections: Sections = [
+        (ClipInfo, _HEADER_SIZE),
+        (SequenceInfo, header.sequence_info_start_address),
+        (ProgramInfo, header.program_info_start_address),
+        (CPI, header.cpi_start_address),
+        (ClipMark, header.clip_mark_start_address),
+    ]
+    if header.extension_data_start_address != 0:
+        sections.append((ExtensionData, header.extension_data_start_address))
+
+    clip_info, sequence_info, program_info, cpi, clip_mark, *extension = _load_sections(reader, sections, executor)
+    return ClpiFile(header, clip_info, sequence_info, program_info, cpi, clip_mark,  # type: ignore[arg-type]
+                    extension[0] if extension else None)
+
+
+def load_ext_data_blocks(reader: PositionalReader, ext_data_type: int,
+                         ext_data_version: Optional[int] = None) -> List[Tuple[ExtensionDataEntry, Any]]:
+    """
+        Returns the ExtensionData entries of a MPLS or CLPI file of a type, and version if given,
+        each with its block decoded by `pyparsebluray.mpls.decode_ext_data_block`.
+        Only the header, the ExtensionData entries and the matching blocks are read.
+        A block lying outside of the section, or past the end of the file, is reported and its entry left out.
+    """
+    type_indicator = bytes(reader.read_at(0, 4))
+    if type_indicator == b'MPLS':
+        header: Union[MoviePlaylist, ClipInformation] = _load_header(reader, MoviePlaylist())
+    elif type_indicator == b'HDMV':
+        header = _load_header(reader, ClipInformation())
+    else:
+        raise ValueError(f'load_ext_data_blocks: unknown type_indicator {type_indicator!r}')
+    if header.extension_data_start_address == 0:
+        return []
+
+    start = header.extension_data_start_address
+    extension = ExtensionData()
+    try:
+        prefix = reader.read_at(start, UINT32.size)
+        length, = UINT32.unpack(prefix)
+        if length == 0:
+            return []
+        # Header, then the entries it counts, bounded by the section
+        directory = bytes(prefix) + bytes(reader.read_at(start + 4, min(length, _EXTENSION_DATA_HEADER_SIZE)))
+        if len(directory) == 4 + _EXTENSION_DATA_HEADER_SIZE:
+            nb_ext_data_entries = directory[-1]
+            directory += bytes(reader.read_at(
+                start + len(directory), min(length + 4 - len(directory), nb_ext_data_entries * _ENTRY_SIZE)
+            ))
+    except EOFError as error:
+        recover(extension, start, error)
+        return []
+    load_section(extension, directory, 0)
+
+    blocks: List[Tuple[ExtensionDataEntry, Any]] = []
+    for entry in getattr(extension, 'ext_data_entries', None) or ():
+        if entry.ext_data_type != ext_data_type or ext_data_version not in (None, entry.ext_data_version):
+            continue
+        if entry.ext_data_start_address + entry.ext_data_length > length + 4:
+            report(extension, start + entry.ext_data_start_address,
+                   f'ext_data_length = {entry.ext_data_length} at {entry.ext_data_start_address} '
+                   f'but the section is {length + 4} bytes long')
+            continue
+        try:
+            block = reader.read_at(start + entry.ext_data_start_address, entry.ext_data_length)
+        except EOFError as error:
+            recover(extension, start + entry.ext_data_start_address, error)
+            continue
+        blocks.append((entry, decode_ext_data_block(entry, block)))
+    return blocks
+
+
+def _load_mpls_path(path: Path, lazy: bool) -> MplsFile:
+    with FileReader(path) as reader:
+        return load_mpls_at(reader, lazy)
+
+
+def scan_playlists_threaded(bdmv: Union[str, os.PathLike], max_workers: Optional[int] = None,
+                            lazy: bool = False) -> Dict[str, MplsFile]:
+    """
+        Counterpart of `pyparsebluray.mpls.scan_playlists` loading the files from a thread pool,
+        each in a copy of the caller's context so the current parse_mode applies
+    """
+    paths = list_playlists(bdmv)
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(copy_context().run, _load_mpls_path, path, lazy) for path in paths]
+        return {path.name: future.result() for path, future in zip(paths, futures)}
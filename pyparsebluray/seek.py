@@ -0,0 +1,132 @@
+"""Mapping of playlist timestamps to clips and byte offsets"""
+
+__all__ = ['SeekPoint', 'SeekIndex', 'SOURCE_PACKET_SIZE']
+
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple
+
+# Size in bytes of a source packet of a m2ts file
+SOURCE_PACKET_SIZE = 192
+
+
+class SeekPoint(NamedTuple):
+    """Entry point at or before a playlist timestamp"""
+    play_item_id: int
+    clip_information_filename: str
+    clip_time: int                                                              # 45 kHz
+    entry_point_time: int                                                       # 45 kHz
+    spn: int
+    byte_offset: int
+
+
+class SeekIndex:
+    """
+        Binary-search index mapping playlist timestamps (45 kHz ticks) to play items
+        and then to source packets through the EP map of their clip.
+
+        `playlist` is a loaded or frozen Playlist and `clips` maps clip information filenames,
+        with or without extension (such as '00001' or '00001.clpi' from `scan_clips`), to loaded or frozen ClpiFile.
+        The EP map of a clip is expanded only the first time it is needed,
+        and only its entries in the STC sequence referenced by the play item are searched.
+    """
+    clips: Dict[str, Any]
+    clip_information_filenames: List[str]
+    ref_to_stcids: List[int]
+    intimes: List[int]
+    starts: List[int]                                                           # 45 kHz
+    duration: int                                                               # 45 kHz
+
+    def __init__(self, playlist: Any, clips: Mapping[str, Any]) -> None:
+        self.clips = {Path(name).stem: clip for name, clip in clips.items()}
+        self.clip_information_filenames = []
+        self.ref_to_stcids = []
+        self.intimes = []
+        self.starts = []
+
+        start = 0
+        for play_item in playlist.play_items or ():
+            self.clip_information_filenames.append(play_item.clip_information_filename)
+            self.ref_to_stcids.append(play_item.ref_to_stcid)
+            self.intimes.append(play_item.intime)
+            self.starts.append(start)
+            start += play_item.outtime - play_item.intime
+        self.duration = start
+
+        self._entry_points: Dict[str, Tuple['array[int]', 'array[int]']] = {}
+        self._stc_ranges: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+    def locate(self, time: int) -> Tuple[int, int]:
+        """Returns the play item containing a playlist time and the matching time in its clip"""
+        if not self.starts or not 0 <= time < self.duration:
+            raise ValueError(f'SeekIndex: {time} is outside of the playlist')
+        play_item_id = bisect_right(self.starts, time) - 1
+        return play_item_id, self.intimes[play_item_id] + time - self.starts[play_item_id]
+
+    def seek(self, time: int) -> SeekPoint:
+        """Returns the entry point at or before a playlist time"""
+        return self.seek_clip(*self.locate(time))
+
+    def seek_mark(self, mark: Any) -> SeekPoint:
+        """Returns the entry point at or before a PlaylistMark"""
+        return self.seek_clip(mark.ref_to_play_item_id, mark.mark_timestamp)
+
+    def seek_clip(self, play_item_id: int, clip_time: int) -> SeekPoint:
+        """Returns the entry point at or before a time of the clip of a play item"""
+        clip_information_filename = self.clip_information_filenames[play_item_id]
+        pts, spn = self._get_entry_points(clip_information_filename)
+        if not pts:
+            raise ValueError(f'SeekIndex: the clip {clip_information_filename} has no entry point')
+
+        # PTS restart with every STC sequence so they are only sorted within one of them
+        lo, hi = self._get_stc_range(clip_information_filename, self.ref_to_stcids[play_item_id])
+        i = max(bisect_right(pts, clip_time * 2, lo, hi) - 1, lo)
+        return SeekPoint(play_item_id, clip_information_filename, clip_time,
+                         pts[i] // 2, spn[i], spn[i] * SOURCE_PACKET_SIZE)
+
+    def _get_entry_points(self, clip_information_filename: str) -> Tuple['array[int]', 'array[int]']:
+        try:
+            return self._entry_points[clip_information_filename]
+        except KeyError:
+            pass
+
+        streams = self.clips[clip_information_filename].cpi.ep_map_streams or ()
+        # Prefer the EP map of the video stream
+        stream = next((s for s in streams if s.ep_stream_type == 1), next(iter(streams), None))
+        entry_points = stream.entry_points() if stream is not None else (array('Q'), array('Q'))
+        self._entry_points[clip_information_filename] = entry_points
+        return entry_points
+
+    def _get_stc_range(self, clip_information_filename: str, ref_to_stcid: int) -> Tuple[int, int]:
+        """Returns the range of the entry points whose SPN lie in an STC sequence of a clip"""
+        key = clip_information_filename, ref_to_stcid
+        try:
+            return self._stc_ranges[key]
+        except KeyError:
+            pass
+
+        pts, spn = self._get_entry_points(clip_information_filename)
+        atc_sequences = self.clips[clip_information_filename].sequence_info.atc_sequences
+        if not atc_sequences:
+            # No SequenceInfo to restrict the search to
+            stc_range = 0, len(spn)
+        else:
+            stc_sequences = [stc for atc in atc_sequences for stc in atc.stc_sequences]
+            stc_index = ref_to_stcid - atc_sequences[0].offset_stc_id
+            if not 0 <= stc_index < len(stc_sequences):
+                raise ValueError(
+                    f'SeekIndex: the clip {clip_information_filename} has no STC sequence {ref_to_stcid}'
+                )
+            lo = bisect_left(spn, stc_sequences[stc_index].spn_stc_start)
+            hi = (bisect_left(spn, stc_sequences[stc_index + 1].spn_stc_start, lo)
+                  if stc_index + 1 < len(stc_sequences) else len(spn))
+            if lo == hi:
+                raise ValueError(
+                    f'SeekIndex: the clip {clip_information_filename} has no entry point '
+                    f'in its STC sequence {ref_to_stcid}'
+                )
+            stc_range = lo, hi
+
+        self._stc_ranges[key] = stc_range
+        return stc_range
@@ -0,0 +1,340 @@
+"""Read-only access to the files of UDF 2.50 disc images"""
+
+__all__ = ['UdfImage', 'SECTOR_SIZE']
+
+import os
+import threading
+from pathlib import PurePosixPath
+from struct import Struct
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .clpi import ClpiFile, loads_clpi
+from .mpls import MplsFile, loads_mpls
+
+SECTOR_SIZE = 2048
+
+# Every structure of ECMA-167/UDF is little-endian
+_TAG = Struct('<H')
+_EXTENT_AD = Struct('<II')
+_SHORT_AD = Struct('<II')
+_LONG_AD = Struct('<IIH6x')
+_PARTITION_DESCRIPTOR = Struct('<22xH164xI')
+_LOGICAL_VOLUME_DESCRIPTOR = Struct('<212xI32x16sII')
+_TYPE_1_PARTITION_MAP = Struct('<4xH')
+_TYPE_2_PARTITION_MAP = Struct('<38xH')
+_METADATA_PARTITION_MAP = Struct('<38xHI')
+_FILE_ENTRY = Struct('<27xB6xH20xQ')
+_FILE_IDENTIFIER_DESCRIPTOR = Struct('<18xBB16sH')
+
+_ANCHOR_VOLUME_DESCRIPTOR_POINTER = 2
+_PARTITION_DESCRIPTOR_TAG = 5
+_LOGICAL_VOLUME_DESCRIPTOR_TAG = 6
+_TERMINATING_DESCRIPTOR = 8
+_FILE_SET_DESCRIPTOR = 256
+_FILE_IDENTIFIER_DESCRIPTOR_TAG = 257
+_FILE_ENTRY_TAG = 261
+_EXTENDED_FILE_ENTRY_TAG = 266
+
+_FILE_TYPE_DIRECTORY = 4
+_DIRECTORY = 0x02
+_DELETED = 0x04
+_PARENT = 0x08
+
+# Allocation descriptor types, from the 2 high bits of the extent length
+_RECORDED = 0
+_NEXT_EXTENT = 3
+
+
+class _Extent(NamedTuple):
+    partition: int
+    block: int
+    length: int
+    recorded: bool
+
+
+class _FileEntry(NamedTuple):
+    directory: bool
+    size: int
+    extents: List[_Extent]
+    embedded: Optional[bytes]
+
+
+class _Partition(NamedTuple):
+    start: int
+    # (offset in the metadata file, length, block in the physical partition) if this is a metadata partition
+    metadata_extents: Optional[List[Tuple[int, int, int]]]
+
+
+class UdfImage:
+    """
+        Read-only UDF 2.50 image such as a BD-ROM ISO, supporting physical and metadata partitions.
+
+        Only the descriptors on the way to a file and the sectors the file occupies are read,
+        with positional reads, so loading the playlists of a 50 GB image takes a handful of small reads.
+        `reads` counts the reads made so far.
+    """
+    path: str
+    block_size: int
+    reads: int
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        self.block_size = SECTOR_SIZE
+        self.reads = 0
+        self._file = open(self.path, 'rb', buffering=0)
+        self._lock = threading.Lock()
+        self._directories: Dict[Tuple[int, int], Dict[str, Tuple[Tuple[int, int], bool]]] = {}
+        try:
+            self._mount()
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> 'UdfImage':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the image file"""
+        self._file.close()
+
+    def listdir(self, path: str = '/') -> List[str]:
+        """Returns the names of the entries of a directory"""
+        entry_icb, directory = self._lookup(path)
+        if not directory:
+            raise NotADirectoryError(path)
+        return list(self._directory(entry_icb))
+
+    def is_dir(self, path: str) -> bool:
+        """Returns True if `path` is a directory of the image"""
+        return self._lookup(path)[1]
+
+    def read_file(self, path: str) -> bytes:
+        """Reads a file of the image, only touching the sectors it occupies"""
+        entry_icb, directory = self._lookup(path)
+        if directory:
+            raise IsADirectoryError(path)
+        return self._read_file_entry(self._file_entry(*entry_icb))
+
+    def load_mpls_file(self, path: str, lazy: bool = False) -> MplsFile:
+        """Reads a MPLS file of the image and returns all of its sections"""
+        return loads_mpls(self.read_file(path), lazy)
+
+    def load_clpi_file(self, path: str) -> ClpiFile:
+        """Reads a CLPI file of the image and returns all of its sections"""
+        return loads_clpi(self.read_file(path))
+
+    def scan_playlists(self, bdmv: str = '/BDMV', lazy: bool = False) -> Dict[str, MplsFile]:
+        """Loads every playlist of the BDMV folder of the image, keyed and sorted by file name"""
+        folder = PurePosixPath(bdmv, 'PLAYLIST')
+        return {
+            name: self.load_mpls_file(str(folder / name), lazy)
+            for name in sorted(self.listdir(str(folder))) if name.lower().endswith('.mpls')
+        }
+
+    def scan_clips(self, bdmv: str = '/BDMV') -> Dict[str, ClpiFile]:
+        """Loads every clip information file of the BDMV folder of the image, keyed and sorted by file name"""
+        folder = PurePosixPath(bdmv, 'CLIPINF')
+        return {
+            name: self.load_clpi_file(str(folder / name))
+            for name in sorted(self.listdir(str(folder))) if name.lower().endswith('.clpi')
+        }
+
+    def _read(self, offset: int, size: int) -> bytes:
+        self.reads += 1
+        if hasattr(os, 'pread'):
+            data = os.pread(self._file.fileno(), size, offset)
+        else:
+            with self._lock:
+                self._file.seek(offset, os.SEEK_SET)
+                data = self._file.read(size)
+        if len(data) != size:
+            raise EOFError(f'UdfImage: expected {size} bytes at {offset}, got {len(data)}')
+        return data
+
+    @staticmethod
+    def _check_tag(data: bytes, *tags: int) -> int:
+        tag, = _TAG.unpack_from(data, 0)
+        if tag not in tags:
+            raise ValueError(f'UdfImage: unexpected descriptor tag {tag}, expected {tags}')
+        return tag
+
+    def _mount(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        for sector in (256, size // SECTOR_SIZE - 1, size // SECTOR_SIZE - 257):
+            anchor = self._read(sector * SECTOR_SIZE, 32)
+            if _TAG.unpack_from(anchor, 0)[0] == _ANCHOR_VOLUME_DESCRIPTOR_POINTER:
+                break
+        else:
+            raise ValueError('UdfImage: no Anchor Volume Descriptor Pointer found, not an UDF image')
+        length, location = _EXTENT_AD.unpack_from(anchor, 16)
+
+        partition_starts: Dict[int, int] = {}
+        logical_volume: Optional[bytes] = None
+        sequence = self._read(location * SECTOR_SIZE, length)
+        for offset in range(0, length, SECTOR_SIZE):
+            tag, = _TAG.unpack_from(sequence, offset)
+            if tag == _PARTITION_DESCRIPTOR_TAG:
+                number, start = _PARTITION_DESCRIPTOR.unpack_from(sequence, offset)
+                partition_starts[number] = start
+            elif tag == _LOGICAL_VOLUME_DESCRIPTOR_TAG:
+                logical_volume = sequence[offset:offset + SECTOR_SIZE]
+            elif tag == _TERMINATING_DESCRIPTOR:
+                break
+        if logical_volume is None:
+            raise ValueError('UdfImage: no Logical Volume Descriptor found')
+
+        self.block_size, file_set, _, nb_partition_maps = _LOGICAL_VOLUME_DESCRIPTOR.unpack_from(logical_volume, 0)
+
+        self._partitions: List[_Partition] = []
+        metadata_maps: List[Tuple[int, int, int]] = []
+        offset = 440
+        for _ in range(nb_partition_maps):
+            map_type, map_length = logical_volume[offset], logical_volume[offset + 1]
+            if map_type == 1:
+                number, = _TYPE_1_PARTITION_MAP.unpack_from(logical_volume, offset)
+                self._partitions.append(_Partition(partition_starts[number], None))
+            elif logical_volume[offset + 5:offset + 28].rstrip(b'\0') == b'*UDF Metadata Partition':
+                number, metadata_file_location = _METADATA_PARTITION_MAP.unpack_from(logical_volume, offset)
+                metadata_maps.append((len(self._partitions), number, metadata_file_location))
+                self._partitions.append(_Partition(partition_starts[number], None))
+            else:
+                # Sparable and virtual partitions only exist on writable media,
+                # they are read as the physical partition they refer to
+                number, = _TYPE_2_PARTITION_MAP.unpack_from(logical_volume, offset)
+                self._partitions.append(_Partition(partition_starts[number], None))
+            offset += map_length
+
+        for index, number, metadata_file_location in metadata_maps:
+            # Until its extents are known, the metadata partition maps to the physical partition
+            # the metadata file is stored in
+            metadata_file = self._file_entry(index, metadata_file_location)
+            metadata_extents = []
+            position = 0
+            for extent in metadata_file.extents:
+                metadata_extents.append((position, extent.length, extent.block))
+                position += extent.length
+            self._partitions[index] = _Partition(partition_starts[number], metadata_extents)
+
+        _, block, partition = _LONG_AD.unpack_from(file_set)
+        file_set_descriptor = self._read(self._position(partition, block), SECTOR_SIZE)
+        self._check_tag(file_set_descriptor, _FILE_SET_DESCRIPTOR)
+        _, block, partition = _LONG_AD.unpack_from(file_set_descriptor, 400)
+        self._root = (partition, block)
+
+    def _position(self, partition: int, block: int) -> int:
+        """Byte offset in the image of a logical block"""
+        start, metadata_extents = self._partitions[partition]
+        if metadata_extents is None:
+            return (start + block) * self.block_size
+        offset = block * self.block_size
+        for extent_offset, length, extent_block in metadata_extents:
+            if extent_offset <= offset < extent_offset + length:
+                return (start + extent_block) * self.block_size + offset - extent_offset
+        raise ValueError(f'UdfImage: block {block} is outside the metadata partition')
+
+    def _read_extent(self, extent: _Extent) -> bytes:
+        if not extent.recorded:
+            return bytes(extent.length)
+        metadata_extents = self._partitions[extent.partition].metadata_extents
+        if metadata_extents is None or extent.length <= self.block_size:
+            return self._read(self._position(extent.partition, extent.block), extent.length)
+        # An extent of a metadata partition may span several extents of the metadata file
+        chunks = []
+        block, remaining = extent.block, extent.length
+        while remaining > 0:
+            offset = block * self.block_size
+            extent_offset, length, _ = next(e for e in metadata_extents if e[0] <= offset < e[0] + e[1])
+            size = min(remaining, extent_offset + length - offset)
+            chunks.append(self._read(self._position(extent.partition, block), size))
+            remaining -= size
+            block += size // self.block_size
+        return b''.join(chunks)
+
+    def _file_entry(self, partition: int, block: int) -> _FileEntry:
+        data = self._read(self._position(partition, block), self.block_size)
+        tag = self._check_tag(data, _FILE_ENTRY_TAG, _EXTENDED_FILE_ENTRY_TAG)
+        file_type, flags, size = _FILE_ENTRY.unpack_from(data)
+        if tag == _FILE_ENTRY_TAG:
+            length_extended_attributes, length_allocation_descriptors = _EXTENT_AD.unpack_from(data, 168)
+            offset = 176 + length_extended_attributes
+        else:
+            length_extended_attributes, length_allocation_descriptors = _EXTENT_AD.unpack_from(data, 208)
+            offset = 216 + length_extended_attributes
+
+        directory = file_type == _FILE_TYPE_DIRECTORY
+        allocation_type = flags & 0x07
+        if allocation_type == 3:
+            return _FileEntry(directory, size, [], data[offset:offset + length_allocation_descriptors])
+
+        extents: List[_Extent] = []
+        end = offset + length_allocation_descriptors
+        while offset < end:
+            if allocation_type == 0:
+                length, extent_block = _SHORT_AD.unpack_from(data, offset)
+                extent_partition = partition
+                offset += _SHORT_AD.size
+            else:
+                length, extent_block, extent_partition = _LONG_AD.unpack_from(data, offset)
+                offset += _LONG_AD.size
+            extent_type, length = length >> 30, length & 0x3FFFFFFF
+            if length == 0:
+                break
+            if extent_type == _NEXT_EXTENT:
+                # The allocation descriptors continue in another block
+                data = self._read(self._position(extent_partition, extent_block), length)
+                offset, end = 24, 24 + _EXTENT_AD.unpack_from(data, 20)[0]
+                continue
+            extents.append(_Extent(extent_partition, extent_block, length, extent_type == _RECORDED))
+        return _FileEntry(directory, size, extents, None)
+
+    def _read_file_entry(self, entry: _FileEntry) -> bytes:
+        if entry.embedded is not None:
+            return entry.embedded[:entry.size]
+        return b''.join(self._read_extent(extent) for extent in entry.extents)[:entry.size]
+
+    def _directory(self, icb: Tuple[int, int]) -> Dict[str, Tuple[Tuple[int, int], bool]]:
+        directory = self._directories.get(icb)
+        if directory is not None:
+            return directory
+
+        directory = {}
+        data = self._read_file_entry(self._file_entry(*icb))
+        offset = 0
+        while offset + 38 <= len(data):
+            self._check_tag(data[offset:offset + 2], _FILE_IDENTIFIER_DESCRIPTOR_TAG)
+            characteristics, length_identifier, entry_icb, length_implementation_use = \
+                _FILE_IDENTIFIER_DESCRIPTOR.unpack_from(data, offset)
+            identifier_offset = offset + 38 + length_implementation_use
+            identifier = data[identifier_offset:identifier_offset + length_identifier]
+            offset += (38 + length_implementation_use + length_identifier + 3) & ~3
+
+            if characteristics & (_DELETED | _PARENT) or not identifier:
+                continue
+            _, block, partition = _LONG_AD.unpack(entry_icb)
+            directory[self._decode_identifier(identifier)] = ((partition, block), bool(characteristics & _DIRECTORY))
+
+        self._directories[icb] = directory
+        return directory
+
+    @staticmethod
+    def _decode_identifier(identifier: bytes) -> str:
+        if identifier[0] in {16, 255}:
+            return identifier[1:].decode('utf-16-be')
+        return identifier[1:].decode('latin-1')
+
+    def _lookup(self, path: str) -> Tuple[Tuple[int, int], bool]:
+        icb, directory = self._root, True
+        for name in PurePosixPath('/', path).parts[1:]:
+            if not directory:
+                raise NotADirectoryError(path)
+            entries = self._directory(icb)
+            entry = entries.get(name)
+            if entry is None:
+                entry = next((e for n, e in entries.items() if n.lower() == name.lower()), None)
+            if entry is None:
+                raise FileNotFoundError(path)
+            icb, directory = entry
+        return icb, directory
@@ -16,10 +16,14 @@ setuptools.setup(
     description='Parse and extract binary data from bluray files',
     long_description=long_description,
     long_description_content_type='text/markdown',
-    packages=['pyparsebluray', 'pyparsebluray.mpls'],
+    packages=['pyparsebluray', 'pyparsebluray.clpi', 'pyparsebluray.index_table',
+              'pyparsebluray.movie_object', 'pyparsebluray.mpls'],
     package_data={
         'pyparsebluray': ['py.typed'],
     },
+    entry_points={
+        'console_scripts': ['pyparsebluray = pyparsebluray.__main__:main'],
+    },
     url='https://github.com/Ichunjo/pyparsebluray',
     zip_safe=False,
     classifiers=[
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+import pytest
+
+from .synthetic import write_synthetic_disc
+
+
+@pytest.fixture
+def bdmv(tmp_path: Path) -> Path:
+    """BDMV folder of 3 synthetic playlists, one clip, an index table and movie objects"""
+    return write_synthetic_disc(tmp_path, nb_play_items=5, nb_streams=8, nb_angles=2, nb_sub_paths=1,
+                                nb_ext_data_entries=2)
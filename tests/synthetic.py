@@ -0,0 +1,266 @@
+"""Synthetic BDMV files for the tests and benchmarks"""
+
+__all__ = ['synthetic_mpls', 'write_synthetic_mpls', 'synthetic_clpi', 'synthetic_index_bdmv',
+           'synthetic_movie_object', 'write_synthetic_disc', 'corrupt']
+
+import os
+import random
+from pathlib import Path
+from struct import Struct
+from typing import List, Optional, Sequence, Tuple, Union
+
+_MOVIE_PLAYLIST = Struct('>4s4sIII20x')
+_APP_INFO_PLAYLIST = Struct('>IxBHQH')
+_STREAM_ENTRY = Struct('>BBH6x')
+_STN_TABLE = Struct('>HH8B4x')
+_PLAY_ITEM = Struct('>5s4sHBIIQBBH')
+_ANGLES = Struct('>BB')
+_ANGLE = Struct('>5s4sB')
+_SUB_PLAY_ITEM = Struct('>H5s4sIBIIHI')
+_SUB_PATH = Struct('>IxBHxB')
+_PLAYLIST = Struct('>I2xHH')
+_PLAYLIST_MARK = Struct('>xBHIHI')
+_EXTENSION_DATA = Struct('>II3xB')
+_EXTENSION_DATA_ENTRY = Struct('>HHII')
+
+# (stream_coding_type, attributes following it)
+_VIDEO = (0x1B, bytes((0x61, 0, 0, 0)))
+_AUDIO = (0x81, bytes((0x61,)) + b'eng')
+_PGS = (0x90, b'fra' + bytes(1))
+_LANGUAGES = (b'eng', b'jpn', b'fra', b'deu', b'spa', b'ita')
+# No decoder is registered for it, its blocks stay bytes
+_UNREGISTERED_EXT_DATA_TYPE = 0xFF00
+
+
+def _clip_name(rng: random.Random) -> bytes:
+    return b'%05d' % rng.randrange(100000)
+
+
+def _stream(rng: random.Random, coding: int, attributes: bytes) -> bytes:
+    if coding != _VIDEO[0]:
+        attributes = attributes.replace(b'eng', rng.choice(_LANGUAGES)).replace(b'fra', rng.choice(_LANGUAGES))
+    entry = _STREAM_ENTRY.pack(_STREAM_ENTRY.size - 1, 0x01, rng.randrange(0x1000, 0x1FFF))
+    return entry + bytes((len(attributes) + 1, coding)) + attributes
+
+
+def _stn_table(rng: random.Random, nb_streams: int) -> bytes:
+    nb_video = min(nb_streams, 1)
+    nb_audio = (nb_streams - nb_video + 1) // 2
+    nb_pgs = nb_streams - nb_video - nb_audio
+    streams = b''.join(
+        [_stream(rng, *_VIDEO) for _ in range(nb_video)]
+        + [_stream(rng, *_AUDIO) for _ in range(nb_audio)]
+        + [_stream(rng, *_PGS) for _ in range(nb_pgs)]
+    )
+    return _STN_TABLE.pack(_STN_TABLE.size - 2 + len(streams), 0, nb_video, nb_audio, nb_pgs, 0, 0, 0, 0, 0) + streams
+
+
+def _play_item(rng: random.Random, nb_streams: int, nb_angles: int) -> bytes:
+    intime = rng.randrange(1 << 30)
+    outtime = intime + rng.randrange(45000, 45000 * 3600)
+    misc_flags_1 = (1 << 16 - 1 - 11) if nb_angles else 0
+    body = _PLAY_ITEM.pack(_clip_name(rng), b'M2TS', misc_flags_1, 0, intime, outtime, 0, 0, 0, 0)
+    if nb_angles:
+        body += _ANGLES.pack(nb_angles, 0)
+        body += b''.join(_ANGLE.pack(_clip_name(rng), b'M2TS', 0) for _ in range(nb_angles))
+    body += _stn_table(rng, nb_streams)
+    return len(body).to_bytes(2, 'big') + body
+
+
+def _sub_path(rng: random.Random, nb_sub_play_items: int) -> bytes:
+    sub_play_items = b''.join(
+        _SUB_PLAY_ITEM.pack(_SUB_PLAY_ITEM.size - 2, _clip_name(rng), b'M2TS', 0, 0,
+                            0, rng.randrange(45000, 1 << 30), 0, 0)
+        for _ in range(nb_sub_play_items)
+    )
+    return _SUB_PATH.pack(_SUB_PATH.size - 4 + len(sub_play_items), 5, 0, nb_sub_play_items) + sub_play_items
+
+
+def _extension_data(blocks: Sequence[Tuple[int, int, bytes]]) -> bytes:
+    if not blocks:
+        return b''
+    data_block_start_address = _EXTENSION_DATA.size + len(blocks) * _EXTENSION_DATA_ENTRY.size
+    entries: List[bytes] = []
+    data_blocks = b''
+    for ext_data_type, ext_data_version, data_block in blocks:
+        entries.append(_EXTENSION_DATA_ENTRY.pack(
+            ext_data_type, ext_data_version, data_block_start_address + len(data_blocks), len(data_block)
+        ))
+        data_blocks += data_block
+    return _EXTENSION_DATA.pack(
+        data_block_start_address - 4 + len(data_blocks), data_block_start_address, len(blocks)
+    ) + b''.join(entries) + data_blocks
+
+
+def synthetic_mpls(nb_play_items: int = 10, nb_streams: int = 8, nb_angles: int = 0,
+                   nb_sub_paths: int = 0, nb_sub_play_items: int = 1,
+                   nb_playlist_marks: int = 10, nb_ext_data_entries: int = 0,
+                   ext_data_blocks: Sequence[Tuple[int, int, bytes]] = (), seed: Optional[int] = 0) -> bytes:
+    """
+        Returns a valid MPLS file.
+        Every STNTable holds one video stream and `nb_streams` - 1 audio and PGS streams.
+        The ExtensionData holds `nb_ext_data_entries` zeroed blocks of a type without decoder,
+        followed by the (ext_data_type, ext_data_version, block) of `ext_data_blocks`.
+        Clip names, times and languages are drawn from a generator seeded with `seed`.
+    """
+    rng = random.Random(seed)
+
+    app_info_playlist = _APP_INFO_PLAYLIST.pack(_APP_INFO_PLAYLIST.size - 4, 1, 0, 0, 0)
+    play_items = b''.join(_play_item(rng, nb_streams, nb_angles) for _ in range(nb_play_items))
+    sub_paths = b''.join(_sub_path(rng, nb_sub_play_items) for _ in range(nb_sub_paths))
+    playlist = _PLAYLIST.pack(_PLAYLIST.size - 4 + len(play_items) + len(sub_paths), nb_play_items, nb_sub_paths)
+    playlist += play_items + sub_paths
+
+    marks = b''.join(
+        _PLAYLIST_MARK.pack(1, rng.randrange(max(nb_play_items, 1)), rng.randrange(1 << 30), 0xFFFF, 0)
+        for _ in range(nb_playlist_marks)
+    )
+    playlist_mark = (len(marks) + 2).to_bytes(4, 'big') + nb_playlist_marks.to_bytes(2, 'big') + marks
+
+    extension_data = _extension_data([
+        (_UNREGISTERED_EXT_DATA_TYPE, 1 + i, bytes(4 * (i + 1))) for i in range(nb_ext_data_entries)
+    ] + list(ext_data_blocks))
+
+    playlist_start_address = _MOVIE_PLAYLIST.size + len(app_info_playlist)
+    playlist_mark_start_address = playlist_start_address + len(playlist)
+    extension_data_start_address = playlist_mark_start_address + len(playlist_mark) if extension_data else 0
+
+    header = _MOVIE_PLAYLIST.pack(b'MPLS', b'0300', playlist_start_address,
+                                  playlist_mark_start_address, extension_data_start_address)
+    return header + app_info_playlist + playlist + playlist_mark + extension_data
+
+
+def write_synthetic_mpls(path: Union[str, os.PathLike], **kwargs: int) -> int:
+    """Writes a `synthetic_mpls` file and returns its size"""
+    data = synthetic_mpls(**kwargs)
+    with open(path, 'wb') as mpls:
+        mpls.write(data)
+    return len(data)
+
+
+_CLIP_INFORMATION = Struct('>4s4sIIIII12x')
+_CLIP_INFO = Struct('>2xBBIII')
+_SEQUENCE = Struct('>IBB')
+_STC_SEQUENCE = Struct('>HIII')
+_PROGRAM = Struct('>IHBB')
+_EP_MAP_STREAM = Struct('>HHII')
+_COARSE = Struct('>II')
+_FINE = Struct('>I')
+
+
+def synthetic_clpi(nb_ep_fine_entries: int = 500) -> bytes:
+    """
+        Returns a valid CLPI file of one ATC sequence, 2 STC sequences of 10 s each,
+        a program of video, audio, PGS and text subtitle streams
+        and an EP map of the video stream with a fine entry every second.
+    """
+    clip_info = _CLIP_INFO.pack(1, 1, 0, 48000000, 123456) + bytes(128)
+    ts_type_info_block = bytes((0x80,)) + b'HDMV' + bytes(25)
+    clip_info += len(ts_type_info_block).to_bytes(2, 'big') + ts_type_info_block
+    clip_info = _length(clip_info)
+
+    sequence_info = bytes((0, 1)) + _SEQUENCE.pack(0, 2, 0)
+    sequence_info += _STC_SEQUENCE.pack(0x1001, 0, 27000000, 900000000)
+    sequence_info += _STC_SEQUENCE.pack(0x1001, 5000, 900000000, 1800000000)
+    sequence_info = _length(sequence_info)
+
+    streams = [
+        (0x1011, bytes((0x1B, 0x61, 0x30, 0, 0, 0))),
+        (0x1100, bytes((0x83, 0x61)) + b'jpn' + bytes(2)),
+        (0x1200, bytes((0x90,)) + b'eng' + bytes(1)),
+        (0x1800, bytes((0x92, 0x01)) + b'fra'),
+    ]
+    program_info = bytes((0, 1)) + _PROGRAM.pack(0, 0x100, len(streams), 0) + b''.join(
+        pid.to_bytes(2, 'big') + bytes((len(coding_info),)) + coding_info for pid, coding_info in streams
+    )
+    program_info = _length(program_info)
+
+    # A coarse entry starts wherever the high bits of the PTS or SPN held by the fine entries change
+    coarse, fine = b'', b''
+    nb_coarse = 0
+    high_bits = None
+    for i in range(nb_ep_fine_entries):
+        pts, spn = 27000000 + i * 90000, i * 1000
+        if (pts >> 19, spn >> 17) != high_bits:
+            high_bits = pts >> 19, spn >> 17
+            coarse += _COARSE.pack((i << 14) | ((pts >> 19) & 0x3FFF), spn & ~0x1FFFF)
+            nb_coarse += 1
+        fine += _FINE.pack((3 << 28) | (((pts >> 9) & 0x7FF) << 17) | (spn & 0x1FFFF))
+    ep_map = bytes((0, 1)) + _EP_MAP_STREAM.pack(
+        0x1011, (1 << 2) | ((nb_coarse >> 14) & 3), ((nb_coarse & 0x3FFF) << 18) | nb_ep_fine_entries,
+        2 + _EP_MAP_STREAM.size
+    ) + (4 + len(coarse)).to_bytes(4, 'big') + coarse + fine
+    cpi = _length(bytes((0, 1)) + ep_map)
+    clip_mark = _length(b'')
+
+    sequence_info_start_address = _CLIP_INFORMATION.size + len(clip_info)
+    program_info_start_address = sequence_info_start_address + len(sequence_info)
+    cpi_start_address = program_info_start_address + len(program_info)
+    clip_mark_start_address = cpi_start_address + len(cpi)
+    header = _CLIP_INFORMATION.pack(b'HDMV', b'0200', sequence_info_start_address, program_info_start_address,
+                                    cpi_start_address, clip_mark_start_address, 0)
+    return header + clip_info + sequence_info + program_info + cpi + clip_mark
+
+
+_INDEX = Struct('>4s4sII24x')
+_MOVIE_OBJECT_BDMV = Struct('>4s4sI28x')
+_COMMAND = Struct('>BBBBII')
+
+# (object_type, movie object id or playlist number) of a title
+Title = Tuple[int, int]
+
+
+def _index_object(object_type: int, ref: int, title: bool) -> bytes:
+    flags = (object_type << 30).to_bytes(4, 'big')
+    if object_type == 1:
+        return flags + bytes(2) + ref.to_bytes(2, 'big') + bytes(4)
+    return flags + bytes(2) + b'%05d' % ref + bytes(1)
+
+
+def synthetic_index_bdmv(titles: Sequence[Title] = ((1, 0), (1, 1))) -> bytes:
+    """Returns a valid index.bdmv whose titles are HDMV movie objects (1) or BD-J objects (2)"""
+    app_info_bdmv = _length(bytes((0x61, 0x61)) + b'x' * 32)
+    indexes = _index_object(1, 0, False) + _index_object(1, 1, False) + len(titles).to_bytes(2, 'big')
+    indexes += b''.join(_index_object(object_type, ref, True) for object_type, ref in titles)
+    indexes = _length(indexes)
+    return _INDEX.pack(b'INDX', b'0200', _INDEX.size + len(app_info_bdmv), 0) + app_info_bdmv + indexes
+
+
+def _play_playlist(playlist: int) -> bytes:
+    # PlayPL, immediate playlist number
+    return _COMMAND.pack((1 << 5) | 2, 1 << 7, 0, 0, playlist, 0)
+
+
+def synthetic_movie_object(playlists: Sequence[Sequence[int]] = ((0,), (1, 2))) -> bytes:
+    """Returns a valid MovieObject.bdmv of one movie object per item of `playlists`, playing them in order"""
+    movie_objects = (4 * bytes(1)) + len(playlists).to_bytes(2, 'big') + b''.join(
+        bytes(2) + len(numbers).to_bytes(2, 'big') + b''.join(map(_play_playlist, numbers)) for numbers in playlists
+    )
+    return _MOVIE_OBJECT_BDMV.pack(b'MOBJ', b'0200', 0) + _length(movie_objects)
+
+
+def write_synthetic_disc(root: Union[str, os.PathLike], nb_playlists: int = 3, **kwargs: int) -> Path:
+    """Writes a BDMV folder of `nb_playlists` `synthetic_mpls` files and one clip, and returns its path"""
+    bdmv = Path(root, 'BDMV')
+    (bdmv / 'PLAYLIST').mkdir(parents=True)
+    (bdmv / 'CLIPINF').mkdir()
+    for i in range(nb_playlists):
+        (bdmv / 'PLAYLIST' / f'{i:05d}.mpls').write_bytes(synthetic_mpls(seed=i, **kwargs))
+    (bdmv / 'CLIPINF' / '00001.clpi').write_bytes(synthetic_clpi())
+    (bdmv / 'index.bdmv').write_bytes(synthetic_index_bdmv())
+    (bdmv / 'MovieObject.bdmv').write_bytes(synthetic_movie_object())
+    return bdmv
+
+
+def _length(section: bytes) -> bytes:
+    return len(section).to_bytes(4, 'big') + section
+
+
+def corrupt(data: bytes, rng: random.Random) -> bytes:
+    """Overwrites a few bytes, favouring counts and lengths set to 0 or 0xFF, and sometimes truncates"""
+    mutated = bytearray(data)
+    for _ in range(rng.randrange(1, 32)):
+        mutated[rng.randrange(len(mutated))] = rng.choice((0x00, 0xFF, rng.randrange(256)))
+    if rng.random() < 0.25:
+        del mutated[rng.randrange(len(mutated)):]
+    return bytes(mutated)
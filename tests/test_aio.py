@@ -0,0 +1,32 @@
+import asyncio
+
+from pyparsebluray import (iter_playlists_async, load_clpi_file_async, load_index_bdmv_file_async,
+                           load_mpls_file_async, scan_playlists_async)
+from pyparsebluray.clpi import load_clpi_file
+from pyparsebluray.index_table import load_index_bdmv_file
+from pyparsebluray.mpls import scan_playlists
+
+
+def test_scan_playlists_async(bdmv):
+    expected = {name: mpls.freeze() for name, mpls in scan_playlists(bdmv).items()}
+    playlists = asyncio.run(scan_playlists_async(bdmv, max_concurrency=2))
+
+    assert list(playlists) == sorted(expected)
+    assert {name: mpls.freeze() for name, mpls in playlists.items()} == expected
+    assert asyncio.run(load_mpls_file_async(bdmv / 'PLAYLIST' / '00001.mpls')).freeze() == expected['00001.mpls']
+
+
+def test_iter_playlists_async_stops_early(bdmv):
+    async def first():
+        async for name, _ in iter_playlists_async(bdmv, max_concurrency=1):
+            return name
+        return None
+
+    assert asyncio.run(first()) == '00000.mpls'
+
+
+def test_load_other_files_async(bdmv):
+    clpi = bdmv / 'CLIPINF' / '00001.clpi'
+    assert asyncio.run(load_clpi_file_async(clpi)).freeze() == load_clpi_file(clpi).freeze()
+    index = bdmv / 'index.bdmv'
+    assert asyncio.run(load_index_bdmv_file_async(index)).freeze() == load_index_bdmv_file(index).freeze()
@@ -0,0 +1,38 @@
+from pyparsebluray import ParseCache
+from pyparsebluray.mpls import scan_playlists
+
+
+def test_hits_and_misses(bdmv, tmp_path):
+    expected = {name: mpls.freeze() for name, mpls in scan_playlists(bdmv).items()}
+
+    with ParseCache(tmp_path / 'cache.db') as cache:
+        assert cache.scan_playlists(bdmv) == expected
+        assert cache.scan_playlists(bdmv) == expected
+        assert cache.stats()['hits'] == 3 and cache.stats()['misses'] == 3
+        size = cache.size
+
+    with ParseCache(tmp_path / 'cache.db', key='content') as cache:
+        assert cache.size == size and len(cache) == 3
+        assert cache.load_mpls_file(bdmv / 'PLAYLIST' / '00000.mpls') == expected['00000.mpls']
+        assert cache.stats()['misses'] == 1 and len(cache) == 4
+
+
+def test_replaced_entries_are_not_counted_twice(bdmv, tmp_path):
+    with ParseCache(tmp_path / 'cache.db') as cache:
+        value = cache.load_mpls_file(bdmv / 'PLAYLIST' / '00000.mpls')
+        size = cache.size
+
+        cache._put('stat:replaced', value)
+        cache._put('stat:replaced', value)
+        assert cache.size == 2 * size and len(cache) == 2
+
+
+def test_eviction(bdmv, tmp_path):
+    with ParseCache(tmp_path / 'cache.db') as cache:
+        cache.scan_playlists(bdmv)
+        size = cache.size
+
+    with ParseCache(tmp_path / 'cache.db', max_size=size * 2 // 3) as cache:
+        assert len(cache) < 3 and cache.size <= cache.max_size
+        cache.clear()
+        assert len(cache) == 0 and cache.size == 0
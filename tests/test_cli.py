@@ -0,0 +1,29 @@
+import json
+
+from pyparsebluray.__main__ import FIELDS, _jsonable, main
+from pyparsebluray.mpls import loads_mpls
+
+
+def test_scan_writes_one_line_per_playlist(bdmv, capsys):
+    assert main(['--quiet', '--fields', 'playlist', str(bdmv)]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert len(lines) == 3
+    assert all(set(line) >= {'path', 'playlist'} and 'app_info_playlist' not in line for line in lines)
+
+
+def test_scan_reports_unreadable_files(tmp_path, capsys):
+    broken = tmp_path / 'broken.mpls'
+    broken.write_bytes(b'MPLS0300')
+
+    assert main(['--quiet', str(broken)]) == 1
+    line, = map(json.loads, capsys.readouterr().out.splitlines())
+    assert 'error' in line
+
+
+def test_scan_matches_loads_mpls(bdmv, capsys):
+    assert main(['--quiet', str(bdmv / 'PLAYLIST' / '00001.mpls')]) == 0
+    line, = map(json.loads, capsys.readouterr().out.splitlines())
+    expected = _jsonable(loads_mpls((bdmv / 'PLAYLIST' / '00001.mpls').read_bytes()).freeze())
+
+    assert {field: line[field] for field in FIELDS} == json.loads(json.dumps(expected))
@@ -0,0 +1,54 @@
+import io
+from struct import pack
+
+from pyparsebluray import clpi
+from pyparsebluray.clpi.clip_info import ATCDelta, ClipInfo
+
+from .synthetic import synthetic_clpi
+
+
+def test_loaders_agree(bdmv):
+    data = synthetic_clpi()
+    expected = clpi.loads_clpi(data).freeze()
+
+    assert clpi.load_clpi(io.BufferedReader(io.BytesIO(data))).freeze() == expected
+    assert clpi.load_clpi_file(bdmv / 'CLIPINF' / '00001.clpi').freeze() == expected
+    assert {name: clip.freeze() for name, clip in clpi.scan_clips(bdmv).items()} == {'00001.clpi': expected}
+
+
+def test_decoded_values():
+    clip = clpi.loads_clpi(synthetic_clpi(nb_ep_fine_entries=100)).freeze()
+
+    assert clip.clip_information.type_indicator == 'HDMV'
+    assert clip.clip_info.format_identifier == 'HDMV'
+    stc_sequences = clip.sequence_info.atc_sequences[0].stc_sequences
+    assert [stc.presentation_start_time for stc in stc_sequences] == [27000000, 900000000]
+    streams = clip.program_info.programs[0].program_streams
+    assert [stream.stream_coding_info.language_code for stream in streams] == [None, 'jpn', 'eng', 'fra']
+    video, audio, _, text = (stream.stream_coding_info for stream in streams)
+    assert (video.video_format, video.framerate, video.aspect_ratio, video.oc_flag) == (6, 1, 3, False)
+    assert (audio.audio_format, audio.samplerate) == (6, 1)
+    assert text.character_code == 1
+
+
+def test_clip_info_lists():
+    # Text subtitle sub TS with ATC deltas
+    body = pack('>2xBBIII128x', 1, 0x06, 1, 0, 0) + pack('>HB4s', 7, 0x80, b'HDMV') + bytes(2)
+    body += pack('>xB', 1) + pack('>I5s4sx', 90000, b'00002', b'M2TS')
+    body += pack('>xB', 2) + b'00003' + bytes(1) + b'00004' + bytes(1)
+    clip_info = ClipInfo().load_from(pack('>I', len(body)) + body)
+
+    assert clip_info.is_atc_delta and clip_info.format_identifier == 'HDMV'
+    assert clip_info.atc_deltas == [ATCDelta(90000, '00002', 'M2TS')]
+    assert clip_info.font_filenames == ['00003', '00004']
+
+
+def test_ep_map_expands_to_the_fine_entries():
+    ep_map = clpi.loads_clpi(synthetic_clpi(nb_ep_fine_entries=300)).cpi.ep_map_streams[0]
+
+    assert ep_map.stream_pid == 0x1011
+    assert ep_map.nb_ep_fine_entries == len(ep_map.spn_ep_fine) == 300
+    assert ep_map.nb_ep_coarse_entries == len(ep_map.spn_ep_coarse)
+    # Coarse entries hold the high bits of the SPN of the fine entries they point to
+    for fine_id, spn_coarse in zip(ep_map.ref_to_ep_fine_id, ep_map.spn_ep_coarse):
+        assert spn_coarse | ep_map.spn_ep_fine[fine_id] == fine_id * 1000
@@ -0,0 +1,89 @@
+import pytest
+
+from pyparsebluray import MARK_COLUMNS, STREAM_KINDS, LibraryTables
+from pyparsebluray.mpls import scan_playlists
+
+
+def _tables(bdmv):
+    """Tables of the playlists of `bdmv` appended loaded, frozen and lazy, and the frozen playlists"""
+    loaded = scan_playlists(bdmv)
+    frozen = {name: mpls.freeze() for name, mpls in loaded.items()}
+    tables = LibraryTables()
+    for playlists in (loaded, frozen, scan_playlists(bdmv, lazy=True)):
+        tables.append_disc(str(bdmv), playlists)
+    return tables, frozen
+
+
+def _streams(play_item):
+    for kind in STREAM_KINDS:
+        yield from getattr(play_item.stn_table, f'{kind}_stream_entries')
+
+
+def test_loaded_frozen_and_lazy_playlists_agree(bdmv):
+    tables, frozen = _tables(bdmv)
+    play_items = [play_item for mpls in frozen.values() for play_item in mpls.playlist.play_items]
+    marks = [mark for mpls in frozen.values() for mark in mpls.playlist_mark.playlist_marks]
+    streams = [stream for play_item in play_items for stream in _streams(play_item)]
+
+    assert len(tables.playlists) == 3 * len(frozen)
+    assert len(tables.play_items) == 3 * len(play_items)
+    assert len(tables.marks) == 3 * len(marks)
+    assert len(tables.streams) == 3 * len(streams)
+    assert list(tables.playlists.data['playlist_id']) == list(range(3 * len(frozen)))
+    # The three copies only differ by their playlist_id
+    for table in (tables.playlists, tables.play_items, tables.marks, tables.streams):
+        third = len(table) // 3
+        for column, values in table.data.items():
+            if column != 'playlist_id':
+                assert values[:third] == values[third:2 * third] == values[2 * third:]
+
+    mark_columns = [tables.marks.data[column] for column, _, _ in MARK_COLUMNS[1:]]
+    assert [tuple(column[i] for column in mark_columns) for i in range(len(marks))] == marks
+
+
+def test_dictionary_codes(bdmv):
+    tables, frozen = _tables(bdmv)
+    play_items = [play_item for mpls in frozen.values() for play_item in mpls.playlist.play_items]
+
+    assert tables.discs == ['', str(bdmv)]
+    assert tables.names == [''] + list(frozen)
+    assert [tables.names[code] for code in tables.playlists.data['name']] == list(frozen) * 3
+    assert [tables.clips[code] for code in tables.play_items.data['clip']] == [
+        play_item.clip_information_filename for play_item in play_items
+    ] * 3
+    assert len(set(tables.clips)) == len(tables.clips)
+
+    languages = [attributes.language_code or '' for play_item in play_items for _, attributes in _streams(play_item)]
+    assert [tables.languages[code] for code in tables.streams.data['language']] == languages * 3
+    for code, language in enumerate(tables.languages):
+        assert tables.language_code(language) == code
+    assert tables.language_code('zzz') == -1
+
+
+def test_to_numpy(bdmv):
+    np = pytest.importorskip('numpy')
+    tables, _ = _tables(bdmv)
+
+    arrays = tables.to_numpy()
+    assert {name: len(array) for name, array in arrays.items()} == {
+        'playlists': len(tables.playlists), 'play_items': len(tables.play_items),
+        'marks': len(tables.marks), 'streams': len(tables.streams),
+    }
+    assert np.array_equal(arrays['streams']['pid'], np.array(tables.streams.data['pid']))
+    assert len(LibraryTables().to_numpy()['marks']) == 0
+
+
+def test_to_arrow(bdmv):
+    pytest.importorskip('pyarrow')
+    tables, frozen = _tables(bdmv)
+
+    arrow = tables.to_arrow()
+    assert {name: table.num_rows for name, table in arrow.items()} == {
+        'playlists': len(tables.playlists), 'play_items': len(tables.play_items),
+        'marks': len(tables.marks), 'streams': len(tables.streams),
+    }
+    assert arrow['playlists'].column('name').to_pylist() == list(frozen) * 3
+    assert arrow['streams'].column('language').to_pylist() == [
+        tables.languages[code] for code in tables.streams.data['language']
+    ]
+    assert arrow['marks'].column('mark_timestamp').to_pylist() == list(tables.marks.data['mark_timestamp'])
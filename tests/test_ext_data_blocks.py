@@ -0,0 +1,98 @@
+from struct import pack
+
+import pytest
+
+from pyparsebluray import BufferReader, load_ext_data_blocks
+from pyparsebluray.mpls import ParseError, PipMetadata, PipPosition, StaticMetadata, loads_mpls, parse_mode
+from pyparsebluray.mpls.ext_data_blocks import decode_pip_metadata
+from pyparsebluray.mpls.extension_data import ExtensionDataEntry
+
+from .synthetic import synthetic_mpls
+
+
+def _pip_metadata_block() -> bytes:
+    # 6-byte header, one 14-byte PiP metadata and its positions at 20
+    metadata = pack('>HBxHxB2xI', 3, 1, 0x2C00, 0xEB, 20)
+    positions = pack('>H', 2) + pack('>II', 45000, 100 << 20 | 200 << 8 | 5 << 4) + pack('>II', 90000, 0)
+    return pack('>IH', 2 + len(metadata) + len(positions), 1) + metadata + positions
+
+
+def test_decode_pip_metadata():
+    assert decode_pip_metadata(_pip_metadata_block()) == (
+        PipMetadata(3, 1, 2, True, True, 0xEB, (PipPosition(45000, 100, 200, 5), PipPosition(90000, 0, 0, 0))),
+    )
+
+
+def test_load_ext_data_blocks():
+    static_metadata = pack('>IB3x', 30, 1) + pack('>13H', 1 << 12, *range(1, 13))
+    data = synthetic_mpls(nb_play_items=1, nb_ext_data_entries=2,
+                          ext_data_blocks=[(1, 1, _pip_metadata_block()), (3, 5, static_metadata)])
+
+    (entry, pip_metadata), = load_ext_data_blocks(BufferReader(data), 1)
+    assert entry.ext_data_version == 1 and pip_metadata == decode_pip_metadata(_pip_metadata_block())
+    (_, (metadata,)), = load_ext_data_blocks(BufferReader(data), 3, 5)
+    assert metadata == StaticMetadata(1, (1, 3, 5), (2, 4, 6), 7, 8, 9, 10, 11, 12)
+    assert load_ext_data_blocks(BufferReader(data), 3, 4) == []
+
+    # Blocks without decoder are returned as is
+    undecoded = load_ext_data_blocks(BufferReader(data), 0xFF00)
+    assert [block for _, block in undecoded] == [bytes(4), bytes(8)]
+
+
+class _RecordingReader(BufferReader):
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def read_at(self, offset, size):
+        self.reads.append((offset, size))
+        return super().read_at(offset, size)
+
+
+def test_only_matching_blocks_are_read():
+    pip_metadata = _pip_metadata_block()
+    data = synthetic_mpls(nb_play_items=1, nb_ext_data_entries=1, ext_data_blocks=[(1, 1, pip_metadata)])
+    mpls = loads_mpls(data)
+    start = mpls.movie_playlist.extension_data_start_address
+    entries = mpls.extension_data.ext_data_entries
+    pip_entry, = (entry for entry in entries if entry.ext_data_type == 1)
+    reader = _RecordingReader(data)
+
+    assert len(load_ext_data_blocks(reader, 1)) == 1
+    # ExtensionData length, header and entries, then the PiP metadata block only
+    assert reader.reads[-4:] == [
+        (start, 4), (start + 4, 8), (start + 12, 12 * len(entries)),
+        (start + pip_entry.ext_data_start_address, len(pip_metadata)),
+    ]
+
+    reader.reads.clear()
+    assert load_ext_data_blocks(reader, 2) == []
+    assert sum(size for offset, size in reader.reads if offset >= start) == 12 + 12 * len(entries)
+
+
+def _corrupt_entry(data: bytes, ext_data_length: int) -> bytes:
+    """Overwrites the length of the first ExtensionData entry"""
+    mpls = loads_mpls(data)
+    entry = mpls.movie_playlist.extension_data_start_address + 12
+    assert mpls.extension_data.ext_data_entries[0] == ExtensionDataEntry(0xFF00, 1, 36, 4)
+    return data[:entry + 8] + pack('>I', ext_data_length) + data[entry + 12:]
+
+
+def test_out_of_bounds_blocks():
+    data = _corrupt_entry(synthetic_mpls(nb_play_items=1, nb_ext_data_entries=2), 0x7FFFFFF0)
+
+    with parse_mode() as diagnostics:
+        blocks = load_ext_data_blocks(BufferReader(data), 0xFF00)
+    assert [entry.ext_data_version for entry, _ in blocks] == [2]
+    assert len(diagnostics) == 1 and diagnostics[0].structure == 'ExtensionData'
+
+    with pytest.raises(ParseError), parse_mode(strict=True):
+        load_ext_data_blocks(BufferReader(data), 0xFF00)
+
+
+def test_truncated_extension_data():
+    data = synthetic_mpls(nb_play_items=1, nb_ext_data_entries=1)
+
+    with parse_mode() as diagnostics:
+        assert load_ext_data_blocks(BufferReader(data[:-2]), 0xFF00) == []
+    assert len(diagnostics) == 1
@@ -0,0 +1,22 @@
+from pyparsebluray import fingerprint_mpls, fingerprint_playlist, group_playlists, scan_fingerprints
+from pyparsebluray.mpls import loads_mpls
+
+from .synthetic import synthetic_mpls
+
+
+def test_fingerprint_mpls_matches_decoded_playlist():
+    for shape in (dict(nb_play_items=0), dict(nb_play_items=6, nb_angles=3, nb_streams=5)):
+        data = synthetic_mpls(**shape)
+        playlist = loads_mpls(data).playlist
+        for stn in (False, True):
+            assert fingerprint_mpls(data, stn) == fingerprint_playlist(playlist, stn)
+            assert fingerprint_playlist(playlist.freeze(), stn) == fingerprint_playlist(playlist, stn)
+
+
+def test_group_playlists(bdmv):
+    fingerprints = scan_fingerprints(bdmv)
+    fingerprints['copy.mpls'] = fingerprints['00001.mpls']
+
+    groups = group_playlists(fingerprints)
+    assert ['00001.mpls', 'copy.mpls'] in groups
+    assert sum(map(len, groups)) == len(fingerprints)
@@ -0,0 +1,83 @@
+import random
+import time
+
+import pytest
+
+from pyparsebluray.clpi import loads_clpi
+from pyparsebluray.mpls import ParseError, loads_mpls, parse_mode
+
+from .synthetic import corrupt, synthetic_clpi, synthetic_mpls
+
+SHAPES = [
+    dict(nb_play_items=1, nb_streams=4),
+    dict(nb_play_items=10, nb_streams=16, nb_angles=2, nb_sub_paths=2, nb_ext_data_entries=2),
+]
+
+# Parse time allowed per byte of input and fixed overhead, far above the clean parse
+# but far below what looping over the counts claimed by a corrupt file would take
+_SECONDS_PER_BYTE = 50e-6
+_OVERHEAD = 0.05
+
+
+@pytest.mark.parametrize('strict', [False, True])
+@pytest.mark.parametrize('shape', SHAPES)
+def test_corrupted_playlists(shape, strict):
+    """Corrupt files raise nothing but ParseError, in a time bounded by their size"""
+    data = synthetic_mpls(**shape)
+    rng = random.Random(0)
+    for _ in range(50):
+        mutated = corrupt(data, rng)
+        for lazy in (False, True):
+            start = time.perf_counter()
+            try:
+                with parse_mode(strict):
+                    loads_mpls(mutated, lazy).freeze()
+            except ParseError:
+                pass
+            assert time.perf_counter() - start < _OVERHEAD + len(mutated) * _SECONDS_PER_BYTE
+
+
+def _check_clpi(data, strict):
+    start = time.perf_counter()
+    try:
+        with parse_mode(strict):
+            clpi = loads_clpi(data)
+            clpi.freeze()
+            for stream in clpi.cpi.ep_map_streams or ():
+                stream.entry_points()
+    except ParseError:
+        pass
+    assert time.perf_counter() - start < _OVERHEAD + len(data) * _SECONDS_PER_BYTE
+
+
+@pytest.mark.parametrize('strict', [False, True])
+def test_truncated_clips(strict):
+    """Clip information files cut anywhere raise nothing but ParseError, and their EP maps stay readable"""
+    data = synthetic_clpi()
+    for size in range(0, len(data), 7):
+        _check_clpi(data[:size], strict)
+
+
+@pytest.mark.parametrize('strict', [False, True])
+def test_corrupted_clips(strict):
+    """Corrupt clip information files raise nothing but ParseError, in a time bounded by their size"""
+    data = synthetic_clpi()
+    rng = random.Random(0)
+    for _ in range(200):
+        _check_clpi(corrupt(data, rng), strict)
+
+
+def test_truncated_ep_map():
+    """The entries of an EP map cut short are capped to those that fit and reported"""
+    data = synthetic_clpi()
+    # The empty ClipMark and the last 24 fine entries
+    with parse_mode() as diagnostics:
+        cpi = loads_clpi(data[:-100]).cpi
+    stream, = cpi.ep_map_streams
+    pts, spn = stream.entry_points()
+    assert stream.nb_ep_fine_entries == 500
+    assert len(pts) == len(spn) == 476
+    assert list(spn[:3]) == [0, 1000, 2000]
+    assert (diagnostics[0].structure, diagnostics[0].message) == (
+        'CPI', 'nb_ep_fine_entries = 500 but only 476 fit in the section'
+    )
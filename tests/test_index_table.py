@@ -0,0 +1,61 @@
+import pytest
+
+from pyparsebluray import index_table, movie_object
+from pyparsebluray.mpls import ParseError, parse_mode
+
+from .synthetic import synthetic_index_bdmv, synthetic_movie_object
+
+
+def test_index_bdmv():
+    index = index_table.loads_index_bdmv(synthetic_index_bdmv([(1, 0), (1, 1), (2, 7)]))
+
+    assert index.index.type_indicator == 'INDX'
+    assert index.indexes.nb_titles == 3
+    assert [title.object_type for title in index.indexes.titles] == [1, 1, 2]
+    assert index.indexes.titles[2].bdjo_filename == '00007'
+
+
+def test_movie_objects():
+    movie_objects = movie_object.loads_movie_object(synthetic_movie_object([[0], [1, 2]])).movie_objects
+
+    assert movie_objects.nb_movie_objects == 2
+    assert movie_object.movie_object_playlists(movie_objects) == {0: (0,), 1: (1, 2)}
+
+
+def test_title_table(bdmv):
+    titles = index_table.load_title_table(bdmv).titles
+
+    assert [title.playlists for title in titles] == [(0,), (1, 2)]
+
+
+def _overwrite(data: bytes, offset: int, value: bytes) -> bytes:
+    return data[:offset] + value + data[offset + len(value):]
+
+
+def test_corrupt_counts_are_capped():
+    # nb_titles of the Indexes at 78
+    index = _overwrite(synthetic_index_bdmv(), 78 + 28, b'\xFF\xFF')
+    with parse_mode() as diagnostics:
+        indexes = index_table.loads_index_bdmv(index).indexes
+    assert indexes.nb_titles == 0xFFFF and len(indexes.titles) == 2
+    assert [diagnostic.structure for diagnostic in diagnostics] == ['Indexes']
+
+    # nb_navigation_commands of the first movie object
+    movie_objects = _overwrite(synthetic_movie_object(), 52, b'\xFF\xFF')
+    with parse_mode() as diagnostics:
+        objects = movie_object.loads_movie_object(movie_objects).movie_objects.movie_objects
+    assert len(objects[0].navigation_commands) == 3
+    assert diagnostics and {diagnostic.structure for diagnostic in diagnostics} == {'MovieObjects'}
+
+    with pytest.raises(ParseError), parse_mode(strict=True):
+        movie_object.loads_movie_object(movie_objects)
+
+
+def test_truncated_sections_are_recovered():
+    with parse_mode() as diagnostics:
+        index = index_table.loads_index_bdmv(synthetic_index_bdmv()[:100])
+    assert index.index.type_indicator == 'INDX'
+    assert [diagnostic.structure for diagnostic in diagnostics] == ['Indexes']
+
+    with pytest.raises(ParseError), parse_mode():
+        movie_object.loads_movie_object(b'MOBJ0200')
@@ -0,0 +1,64 @@
+import io
+import threading
+
+import pytest
+
+from pyparsebluray import ParseStats, instrument
+from pyparsebluray.mpls import PlayItem, load_movie_playlist, load_playlist, loads_mpls
+
+from .synthetic import synthetic_mpls
+
+
+def test_counts_sections():
+    data = synthetic_mpls(nb_play_items=3, nb_streams=4, nb_sub_paths=1)
+    with instrument() as stats:
+        loads_mpls(data)
+    counters = stats.as_dict()
+
+    assert counters['PlayItem']['calls'] == 3 and counters['STNTable']['calls'] == 3
+    assert counters['StreamEntry']['calls'] == counters['StreamAttributes']['calls'] == 12
+    assert counters['MoviePlaylist']['bytes'] == 40 and counters['SubPath']['calls'] == 1
+
+    with instrument(stats):
+        file = io.BufferedReader(io.BytesIO(data))
+        file.seek(load_movie_playlist(file).playlist_start_address)
+        load_playlist(file)
+    assert stats['PlayItem'].calls == 6
+    assert stats['MoviePlaylist'].reads == 1 and stats['Playlist'].reads >= 1 and stats['Playlist'].seeks == 1
+
+
+def test_methods_restored():
+    load_from = PlayItem.load_from
+    with instrument():
+        assert PlayItem.load_from is not load_from
+        with pytest.raises(RuntimeError), instrument():
+            pass
+    assert PlayItem.load_from is load_from
+
+
+def test_blocks_only_count_their_context():
+    data = synthetic_mpls(nb_play_items=2)
+    started, done = threading.Event(), threading.Event()
+    results = {}
+
+    def instrumented(name: str, count: int) -> None:
+        with instrument() as stats:
+            started.set()
+            for _ in range(count):
+                loads_mpls(data)
+            done.wait(5)
+        results[name] = stats
+
+    thread = threading.Thread(target=instrumented, args=('thread', 2))
+    thread.start()
+    started.wait(5)
+    # Parsed outside of any block while the methods are wrapped
+    loads_mpls(data)
+    with instrument() as stats:
+        loads_mpls(data)
+    done.set()
+    thread.join()
+
+    assert stats['PlayItem'].calls == 2
+    assert results['thread']['PlayItem'].calls == 4
+    assert isinstance(results['thread'], ParseStats)
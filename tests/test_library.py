@@ -0,0 +1,33 @@
+from pyparsebluray import index_library
+from pyparsebluray.clpi import scan_clips
+from pyparsebluray.mpls import scan_playlists
+
+from .synthetic import write_synthetic_disc
+
+
+def test_index_library(bdmv, tmp_path):
+    damaged = write_synthetic_disc(tmp_path / 'damaged', nb_playlists=1)
+    (damaged / 'PLAYLIST' / '00000.mpls').write_bytes(b'MPLS0300')
+    missing = tmp_path / 'missing' / 'BDMV'
+
+    discs = list(index_library([bdmv, damaged, missing], max_workers=2, chunksize=1))
+    assert [disc.bdmv for disc in discs] == [str(bdmv), str(damaged), str(missing)]
+
+    assert discs[0].playlists == {name: mpls.freeze() for name, mpls in scan_playlists(bdmv).items()}
+    assert discs[0].clips == {name: clpi.freeze() for name, clpi in scan_clips(bdmv).items()}
+    assert discs[0].error is None and discs[0].diagnostics == ()
+    assert discs[1].error.startswith('error: unpack_from') and discs[1].playlists == {}
+    assert discs[2].error.startswith('FileNotFoundError')
+
+
+def test_index_library_parse_modes(tmp_path):
+    damaged = write_synthetic_disc(tmp_path, nb_playlists=2)
+    playlist = damaged / 'PLAYLIST' / '00001.mpls'
+    playlist.write_bytes(playlist.read_bytes()[:-10])
+
+    tolerant, = index_library([damaged], max_workers=1, clips=False, strict=False)
+    assert tolerant.error is None and sorted(tolerant.playlists) == ['00000.mpls', '00001.mpls']
+    assert tolerant.diagnostics and tolerant.clips == {}
+
+    strict, = index_library([damaged], max_workers=1, strict=True)
+    assert strict.error.startswith('ParseError') and strict.playlists == {}
@@ -0,0 +1,154 @@
+import contextlib
+import io
+import pickle
+
+import pytest
+
+from pyparsebluray import mpls
+from pyparsebluray.mpls.movie_playlist import _UTF8_POOL, POOL_SIZE, decode_string
+
+from .synthetic import synthetic_mpls
+
+SHAPES = [
+    dict(nb_play_items=1, nb_streams=1),
+    dict(nb_play_items=10, nb_streams=16, nb_angles=2, nb_sub_paths=2, nb_ext_data_entries=3),
+    dict(nb_play_items=0, nb_playlist_marks=0),
+]
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_loaders_agree(shape):
+    data = synthetic_mpls(**shape)
+    expected = mpls.loads_mpls(data).freeze()
+
+    assert mpls.load_mpls(io.BufferedReader(io.BytesIO(data))).freeze() == expected
+    assert mpls.loads_mpls(memoryview(data)).freeze() == expected
+    assert mpls.loads_mpls(data, lazy=True).freeze() == expected
+
+
+def test_section_loaders():
+    data = synthetic_mpls(nb_play_items=3, nb_ext_data_entries=1)
+    sections = mpls.loads_mpls(data)
+    file = io.BufferedReader(io.BytesIO(data))
+
+    header = mpls.load_movie_playlist(file)
+    assert header.freeze() == sections.movie_playlist.freeze()
+    assert mpls.load_app_info_playlist(file).freeze() == sections.app_info_playlist.freeze()
+    file.seek(header.playlist_start_address)
+    assert mpls.load_playlist(file).freeze() == sections.playlist.freeze()
+    file.seek(header.playlist_mark_start_address)
+    assert mpls.load_playlist_mark(file).freeze() == sections.playlist_mark.freeze()
+    file.seek(header.extension_data_start_address)
+    assert mpls.load_extention_data(file).freeze() == sections.extension_data.freeze()
+
+
+def test_decoded_values():
+    playlist = mpls.loads_mpls(synthetic_mpls(nb_play_items=2, nb_streams=3, nb_angles=2, nb_playlist_marks=4))
+    play_item = playlist.playlist.play_items[0]
+
+    assert playlist.movie_playlist.type_indicator == 'MPLS'
+    assert playlist.playlist.nb_play_items == 2
+    assert play_item.clip_codec_identifier == 'M2TS'
+    assert play_item.is_multi_angle and play_item.nb_angles == 2 and len(play_item.angles) == 2
+    assert play_item.outtime > play_item.intime
+    assert play_item.stn_table.nb_prim_video_stream_entries == 1
+    assert play_item.stn_table.nb_prim_audio_stream_entries == 1
+    assert play_item.stn_table.nb_prim_pgs_stream_entries == 1
+    assert len(playlist.playlist_mark.playlist_marks) == 4
+    assert playlist.extension_data is None
+
+
+def test_lazy_playlist_decodes_on_access():
+    data = synthetic_mpls(nb_play_items=4)
+    lazy = mpls.loads_mpls(data, lazy=True).playlist
+    eager = mpls.loads_mpls(data).playlist
+
+    assert lazy.play_items[3].intime == eager.play_items[3].intime
+    assert lazy.play_items[1].stn_table.freeze() == eager.play_items[1].stn_table.freeze()
+
+
+def test_frozen_records_pickle():
+    frozen = mpls.loads_mpls(synthetic_mpls(nb_angles=1, nb_sub_paths=1)).freeze()
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_load_mpls_file_and_scan(bdmv):
+    (bdmv / 'PLAYLIST' / 'notes.txt').write_text('')
+    (bdmv / 'PLAYLIST' / 'backup.mpls').mkdir()
+    assert mpls.list_playlists(bdmv) == [bdmv / 'PLAYLIST' / f'0000{i}.mpls' for i in range(3)]
+    playlists = mpls.scan_playlists(bdmv)
+
+    assert sorted(playlists) == ['00000.mpls', '00001.mpls', '00002.mpls']
+    for name, playlist in playlists.items():
+        assert mpls.load_mpls_file(bdmv / 'PLAYLIST' / name).freeze() == playlist.freeze()
+
+
+def test_probe(bdmv):
+    path = bdmv / 'PLAYLIST' / '00001.mpls'
+    playlist = mpls.load_mpls_file(path)
+    probe = mpls.probe_mpls_file(path)
+
+    assert probe == mpls.probes_mpls(path.read_bytes())
+    assert probe.nb_play_items == len(playlist.playlist.play_items)
+    assert probe.clip_information_filenames == tuple(
+        play_item.clip_information_filename for play_item in playlist.playlist.play_items
+    )
+    assert probe.duration == sum(
+        play_item.outtime - play_item.intime for play_item in playlist.playlist.play_items
+    )
+    assert probe.nb_playlist_marks == playlist.playlist_mark.nb_playlist_marks
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_feed_parser(chunk_size):
+    data = synthetic_mpls(nb_play_items=3, nb_sub_paths=1, nb_ext_data_entries=1)
+    parser = mpls.MplsFeedParser()
+    events = []
+    for start in range(0, len(data), chunk_size):
+        events += parser.feed(data[start:start + chunk_size])
+
+    assert parser.close().freeze() == mpls.loads_mpls(data).freeze()
+    assert [event.section for event in events].count('play_item') == 3
+    assert events[-1].section == 'extension_data'
+
+
+def test_feed_parser_truncated():
+    parser = mpls.MplsFeedParser()
+    parser.feed(synthetic_mpls()[:-1])
+    with pytest.raises(EOFError):
+        parser.close()
+
+
+def test_feed_parser_corrupted_section():
+    clean = mpls.loads_mpls(synthetic_mpls(nb_play_items=2))
+    data = bytearray(synthetic_mpls(nb_play_items=2))
+    # clip_codec_identifier of the first PlayItem, after the PlayList header and the PlayItem length
+    codec = int.from_bytes(data[8:12], 'big') + 10 + 2 + 5
+    data[codec:codec + 4] = b'\xff' * 4
+
+    with mpls.parse_mode() as diagnostics:
+        parser = mpls.MplsFeedParser()
+        events = parser.feed(data)
+        playlist = parser.close().playlist
+    assert [diagnostic.structure for diagnostic in diagnostics] == ['PlayItem']
+    assert [event.section for event in events].count('play_item') == 2
+    assert playlist.play_items[0].clip_information_filename == clean.playlist.play_items[0].clip_information_filename
+    assert not hasattr(playlist.play_items[0], 'clip_codec_identifier')
+    assert playlist.play_items[1].freeze() == clean.playlist.play_items[1].freeze()
+
+    for mode, error in ((mpls.parse_mode(strict=True), mpls.ParseError), (contextlib.nullcontext(), UnicodeDecodeError)):
+        parser = mpls.MplsFeedParser()
+        with mode, pytest.raises(error):
+            parser.feed(data)
+        # The parser keeps failing with the same error instead of waiting for more bytes
+        with pytest.raises(error):
+            parser.feed(b'')
+        with pytest.raises(error):
+            parser.close()
+
+
+def test_string_pool_is_bounded():
+    for i in range(POOL_SIZE + 10):
+        assert decode_string(b'%05d' % i) == '%05d' % i
+    assert len(_UTF8_POOL) <= POOL_SIZE
+    assert decode_string(b'M2TS') is decode_string(bytes(b'M2TS'))
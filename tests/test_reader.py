@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyparsebluray import BufferReader, FileReader, load_clpi_at, load_mpls_at, scan_playlists_threaded
+from pyparsebluray.clpi import loads_clpi
+from pyparsebluray.mpls import ParseError, loads_mpls, parse_mode, scan_playlists
+
+from .synthetic import synthetic_clpi, synthetic_mpls
+
+
+def test_load_mpls_at():
+    data = synthetic_mpls(nb_play_items=4, nb_angles=2, nb_sub_paths=1, nb_ext_data_entries=2)
+    expected = loads_mpls(data).freeze()
+
+    assert load_mpls_at(BufferReader(data)).freeze() == expected
+    assert load_mpls_at(BufferReader(data), lazy=True).freeze() == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert load_mpls_at(BufferReader(data), executor=executor).freeze() == expected
+
+
+def test_load_clpi_at(tmp_path):
+    path = tmp_path / '00001.clpi'
+    path.write_bytes(synthetic_clpi())
+
+    with FileReader(path) as reader:
+        assert load_clpi_at(reader).freeze() == loads_clpi(path.read_bytes()).freeze()
+
+
+def test_scan_playlists_threaded(bdmv):
+    expected = {name: mpls.freeze() for name, mpls in scan_playlists(bdmv).items()}
+    assert {name: mpls.freeze() for name, mpls in scan_playlists_threaded(bdmv, 2).items()} == expected
+
+
+def test_scan_playlists_threaded_parse_mode(bdmv):
+    playlist = bdmv / 'PLAYLIST' / '00001.mpls'
+    playlist.write_bytes(playlist.read_bytes()[:-10])
+
+    with parse_mode() as diagnostics:
+        playlists = scan_playlists_threaded(bdmv, 2)
+    assert sorted(playlists) == ['00000.mpls', '00001.mpls', '00002.mpls']
+    assert diagnostics and all(diagnostic.structure == 'ExtensionData' for diagnostic in diagnostics)
+
+    with pytest.raises(ParseError), parse_mode(strict=True):
+        scan_playlists_threaded(bdmv, 2)
@@ -0,0 +1,116 @@
+from struct import error as StructError
+from struct import pack
+from typing import NamedTuple
+
+import pytest
+
+from pyparsebluray.mpls import ParseError, parse_mode
+from pyparsebluray.mpls.schema import Field, Group, Repeat, compile_schema
+
+
+class Record(NamedTuple):
+    a: int
+    b: int
+
+
+class Decoded:
+    pass
+
+
+def _record(a: int, b: int) -> tuple:
+    return a, b
+
+
+@pytest.mark.parametrize('factory, expected', [
+    (_record, [(1, 2), (3, 4)]),
+    (Record, [Record(1, 2), Record(3, 4)]),
+])
+def test_repeat_factories(factory, expected):
+    decoder = compile_schema('_load_records', (
+        Field('n', 'B'), Repeat('xs', 'n', (Field('a', 'B'), Field('b', 'B')), factory),
+    ))
+    data = pack('>B4B', 2, 1, 2, 3, 4)
+    obj = Decoded()
+
+    assert decoder(obj, data, 0, len(data)) == 5
+    assert obj.n == 2 and obj.xs == expected
+
+
+def test_repeat_converts_and_skips_reserved():
+    decoder = compile_schema('_load_converted', (
+        Field('n', 'H'),
+        Repeat('xs', 'n', (Field(None, 'x'), Field('a', 'B', convert=str), Field('b', 'B')), _record),
+    ))
+    data = pack('>H6B', 2, 0, 1, 2, 0, 3, 4)
+    obj = Decoded()
+
+    assert decoder(obj, data, 0, len(data)) == 8
+    assert obj.xs == [('1', 2), ('3', 4)]
+
+
+def test_fields_groups_and_bits():
+    decoder = compile_schema('_load_fields', (
+        Field('kind', 'B'),
+        Field('count', 'H', when='kind == 2'),
+        Field('flags', 'B', bits=(('high', 4, 4), ('low_bit', 0, 1))),
+        Group('kind == 1', (Field('extra', 'I'),)),
+    ))
+    assert decoder.size == 4
+
+    obj = Decoded()
+    assert decoder(obj, pack('>BHBI', 1, 7, 0x51, 9), 0, 8) == 8
+    assert (obj.kind, obj.flags, obj.high, obj.low_bit, obj.extra) == (1, 0x51, 5, True, 9)
+    assert not hasattr(obj, 'count')
+
+    obj = Decoded()
+    assert decoder(obj, pack('>BHB', 2, 7, 0), 0, 4) == 4
+    assert obj.count == 7 and obj.low_bit is False and not hasattr(obj, 'extra')
+
+
+def test_repeat_count_bounded_by_end():
+    decoder = compile_schema('_load_bounded', (
+        Field('n', 'B'), Repeat('xs', 'n', (Field('a', 'B'), Field('b', 'B')), Record),
+    ))
+    data = pack('>B4B', 200, 1, 2, 3, 4)
+
+    with parse_mode() as diagnostics:
+        obj = Decoded()
+        assert decoder(obj, data, 0, 3) == 3
+    assert obj.xs == [Record(1, 2)] and len(diagnostics) == 1
+    with pytest.raises(ParseError), parse_mode(strict=True):
+        decoder(Decoded(), data, 0, len(data))
+
+
+def test_compilation_cached():
+    schema = (Field('n', 'B'), Field(None, 'x'))
+    assert compile_schema('_load_cached', schema) is compile_schema('_load_cached', schema)
+
+
+def test_fields_bounded_by_end():
+    decoder = compile_schema('_load_fixed', (Field('a', 'H'), Group('a == 1', (Field('b', 'I'),))))
+    data = pack('>HI', 1, 7)
+
+    with pytest.raises(StructError, match='4 bytes required at 2 but the section ends at 4'):
+        decoder(Decoded(), data, 0, 4)
+    with pytest.raises(StructError):
+        decoder(Decoded(), data, 0, 1)
+    obj = Decoded()
+    assert decoder(obj, data, 0, len(data)) == 6 and obj.b == 7
+
+
+def test_nested_repeat_and_underscored_fields():
+    decoder = compile_schema('_load_nested', (
+        Field('_flags', 'B', bits=(('high', 4, 4),)),
+        Field('n', 'B'),
+        Repeat('groups', 'n', (
+            Field('m', 'B'), Repeat('records', 'm', (Field('a', 'B'), Field('b', 'B')), Record),
+        ), lambda m, records: (m, records)),
+    ))
+    data = pack('>BB' 'B4B' 'B', 0x51, 3, 2, 1, 2, 3, 4, 0)
+    obj = Decoded()
+
+    with parse_mode() as diagnostics:
+        assert decoder(obj, data, 0, len(data)) == len(data)
+    assert not hasattr(obj, '_flags') and obj.high == 5
+    assert obj.groups == [(2, [Record(1, 2), Record(3, 4)]), (0, [])]
+    assert [d.message for d in diagnostics] == ['n = 3 but only 2 fit in the section']
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+
+from pyparsebluray import SOURCE_PACKET_SIZE, SeekIndex, SeekPoint
+from pyparsebluray.clpi import scan_clips
+
+# The synthetic clip has an entry point every second from 300 s (45 kHz), 1000 source packets apart,
+# and a second STC sequence from the source packet 5000
+_INTIME = 300 * 45000
+
+
+def _playlist(*clips: str, ref_to_stcid: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(play_items=[
+        SimpleNamespace(clip_information_filename=clip, ref_to_stcid=ref_to_stcid,
+                        intime=_INTIME, outtime=_INTIME + 100 * 45000)
+        for clip in clips
+    ])
+
+
+@pytest.mark.parametrize('frozen', [False, True])
+def test_seek_with_scanned_clips(bdmv, frozen):
+    clips = scan_clips(bdmv)
+    if frozen:
+        clips = {name: clip.freeze() for name, clip in clips.items()}
+    index = SeekIndex(_playlist('00001', '00001'), clips)
+
+    assert index.duration == 200 * 45000
+    # EP maps keep the PTS of the entry points to 512 ticks (90 kHz)
+    entry_point_time = (2 * (_INTIME + 3 * 45000)) // 512 * 512 // 2
+    assert index.seek(3 * 45000 + 10) == SeekPoint(0, '00001', _INTIME + 3 * 45000 + 10, entry_point_time,
+                                                   3000, 3000 * SOURCE_PACKET_SIZE)
+    assert index.seek(100 * 45000).play_item_id == 1
+    mark = SimpleNamespace(ref_to_play_item_id=1, mark_timestamp=_INTIME + 45000)
+    assert index.seek_mark(mark).spn == 1000
+    with pytest.raises(ValueError):
+        index.seek(200 * 45000)
+
+
+def test_seek_within_stc_sequence(bdmv):
+    clips = scan_clips(bdmv)
+    first = SeekIndex(_playlist('00001'), clips)
+    second = SeekIndex(_playlist('00001', ref_to_stcid=1), clips)
+
+    # The entry points of the first STC sequence end before the source packet 5000
+    assert first.seek(7 * 45000).spn == 4000
+    assert first.seek(2 * 45000).spn == 2000
+    # and those of the second one start from it
+    assert second.seek(2 * 45000).spn == 5000
+    assert second.seek(7 * 45000).spn == 7000
+
+    with pytest.raises(ValueError, match='no STC sequence 2'):
+        SeekIndex(_playlist('00001', ref_to_stcid=2), clips).seek(0)
@@ -0,0 +1,48 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pyparsebluray import UdfImage
+from pyparsebluray.clpi import scan_clips
+from pyparsebluray.mpls import scan_playlists
+
+pycdlib = pytest.importorskip('pycdlib')
+
+
+def _iso_path(parts) -> str:
+    return '/'.join(('/BDMV', *(part[:8].upper() for part in parts)))
+
+
+def _write_image(bdmv: Path, path: Path) -> None:
+    """Writes a UDF image holding `bdmv` as /BDMV, ISO 9660 names being placeholders"""
+    iso = pycdlib.PyCdlib()
+    iso.new(udf='2.60', interchange_level=4)
+    iso.add_directory('/BDMV', udf_path='/BDMV')
+    for number, file in enumerate(sorted(bdmv.rglob('*'))):
+        relative = file.relative_to(bdmv)
+        udf_path = f'/BDMV/{relative.as_posix()}'
+        if file.is_dir():
+            iso.add_directory(_iso_path(relative.parts), udf_path=udf_path)
+        else:
+            data = file.read_bytes()
+            iso.add_fp(io.BytesIO(data), len(data), _iso_path(relative.parts[:-1]) + f'/F{number}.;1', udf_path=udf_path)
+    iso.write(str(path))
+    iso.close()
+
+
+def test_udf_image(bdmv, tmp_path):
+    image_path = tmp_path / 'disc.iso'
+    _write_image(bdmv, image_path)
+
+    with UdfImage(image_path) as image:
+        assert sorted(image.listdir('/BDMV')) == sorted(path.name for path in bdmv.iterdir())
+        assert image.is_dir('/BDMV/PLAYLIST') and not image.is_dir('/BDMV/index.bdmv')
+        assert image.read_file('/BDMV/index.bdmv') == (bdmv / 'index.bdmv').read_bytes()
+
+        playlists = image.scan_playlists()
+        assert {name: mpls.freeze() for name, mpls in playlists.items()} == \
+            {name: mpls.freeze() for name, mpls in scan_playlists(bdmv).items()}
+        clips = image.scan_clips()
+        assert {name: clpi.freeze() for name, clpi in clips.items()} == \
+            {name: clpi.freeze() for name, clpi in scan_clips(bdmv).items()}